@@ -1,15 +1,57 @@
 
-from transformers import pipeline
-from fastapi import FastAPI
-from pydantic import BaseModel
+import asyncio
+from importlib import import_module
+from contextlib import asynccontextmanager
 
-app = FastAPI(title='금융뉴스 감성분석서비스')
+from fastapi import FastAPI, Request
+from starlette.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
-# 모델 로드 (서버 시작 시 1회만 실행)
-classifier = pipeline(
-    "text-classification",
-    model="snunlp/KR-FinBert-SC"
+# 05_webapi_router 의 공용 services 패키지 사용 (hf/ 에서 실행 : uvicorn 04_main:app)
+# 디렉터리 이름이 숫자로 시작해 import 문 대신 패키지 경로로 가져옴 (sys.path 는 수정하지 않음)
+_batching, _bulk, _cache, _models, _metrics = (
+    import_module(f"05_webapi_router.services.{name}")
+    for name in ("batching", "bulk", "sentiment_cache", "model_registry", "metrics")
 )
+DynamicBatcher                      = _batching.DynamicBatcher
+read_items, stream_sentiment        = _bulk.read_items, _bulk.stream_sentiment
+sentiment_cache                     = _cache.sentiment_cache
+registry, get_classifier            = _models.registry, _models.get_classifier
+get_tokenizer                       = _models.get_tokenizer
+install_metrics, mark_parsed, phase = _metrics.install_metrics, _metrics.mark_parsed, _metrics.phase
+
+# 모델은 레지스트리가 프로세스당 1회만 로드 (lifespan 에서 미리 로드, routers 와 공유)
+
+def classify_batch(texts):
+    # 여러 문장을 패딩해 한 번의 forward 로 추론
+    return get_classifier()(texts, batch_size=len(texts), truncation=True)
+
+def token_lengths(texts):
+    # 길이순 정렬용 토큰 수 (최대 길이에서 잘림) — 배처 스레드의 모델 토크나이저가 아닌 별도 인스턴스 사용
+    encoded = get_tokenizer()(texts, truncation=True)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+# 동시 요청을 모아 배치 추론 (SENTIMENT_MAX_BATCH / SENTIMENT_MAX_WAIT_MS 로 조절)
+# 추론 결과는 캐시에 저장 → 같은 헤드라인은 다음부터 모델을 거치지 않음
+batcher = DynamicBatcher(sentiment_cache.storing(classify_batch))
+
+async def submit_batch(texts):
+    # 대량 요청도 단건 요청과 같은 배처로 보냄 → forward 는 배처 스레드 하나에서만, 대기열 한도(503)도 공유
+    return await asyncio.gather(*[batcher.submit(text) for text in texts])
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 첫 요청이 모델 로드를 기다리지 않도록 시작 시 로드 (이벤트 루프는 막지 않음)
+    await run_in_threadpool(registry.warmup, ["sentiment", "sentiment_tokenizer"])
+    await batcher.start()
+    yield
+    await batcher.stop()
+
+app = FastAPI(title='금융뉴스 감성분석서비스', lifespan=lifespan)
+
+# 라우트별 응답 시간 / 처리 중 요청 수 / 본문 크기 → GET /metrics (Prometheus)
+install_metrics(app)
 
 class TextRequest(BaseModel):
     text: str
@@ -20,9 +62,13 @@ class SentimentResponse(BaseModel):
     score: float
 
 @app.post("/sentiment", response_model=SentimentResponse)
-def analyze_sentiment(request: TextRequest):
-    # 분류모델 호출 
-    result = classifier(request.text)[0]
+async def analyze_sentiment(request: TextRequest):
+    mark_parsed()
+    # 캐시 확인 후, 없으면 분류모델 호출 (배처가 다른 요청과 묶어서 추론)
+    with phase("inference"):
+        result = await sentiment_cache.aget(request.text)
+        if result is None:
+            result = await batcher.submit(request.text)
     # result > 'label'
     # result > 'score'
     # 결과: [{'label': 'positive', 'score: 0.9998772144317627}]
@@ -45,6 +91,31 @@ class SentimentResponse(BaseModel):
     label: str
     score: float
 
+# 대량 감성분석 — JSON 배열 또는 NDJSON (본문 / 파일 업로드) 입력, NDJSON 스트리밍 응답
+# curl -X POST localhost:8000/sentiment/batch -H "Content-Type: application/x-ndjson" --data-binary @news.ndjson
+@app.post("/sentiment/batch")
+async def analyze_sentiment_batch(request: Request):
+    items = await read_items(request)
+    return StreamingResponse(
+        stream_sentiment(items, sentiment_cache.wrap(submit_batch, store=False), token_lengths),
+        media_type="application/x-ndjson",
+    )
+
+# 배치 추론 지표 (큐 대기 건수, 배치 크기 분포 등)
+@app.get("/sentiment/metrics")
+def sentiment_metrics():
+    return batcher.metrics()
+
+# 감성분석 캐시 적중/미적중 통계
+@app.get("/sentiment/cache/stats")
+def sentiment_cache_stats():
+    return sentiment_cache.stats()
+
+# 로드된 모델별 로드 시간 / 메모리
+@app.get("/models")
+def model_info():
+    return registry.info()
+
 # CORS를 위한 미들웨어를 추가합니다.
 from fastapi.middleware.cors import CORSMiddleware
 
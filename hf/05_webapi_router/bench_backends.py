@@ -0,0 +1,131 @@
+# bench_backends.py
+# 감성분석 백엔드 비교 — 기준(torch FP32) 대비 정확도 일치율과 CPU 지연시간 / 처리량
+#
+# python bench_backends.py                                  # 실제 백엔드 전체, 내장 예문 (fake 는 --backends 로 지정할 때만)
+# python bench_backends.py --backends torch onnx-int8 --texts news.txt --json result.json
+#   news.txt : 한 줄에 문장 1개
+
+import gc
+import json
+import time
+import argparse
+import statistics
+
+from services.backends import BACKENDS, load_sentiment
+from services.model_registry import SENTIMENT_MODEL
+
+SAMPLE_TEXTS = [
+    "삼성전자, 3분기 영업이익 시장 예상치 크게 웃돌아",
+    "SK하이닉스 HBM 공급 확대로 사상 최대 실적 전망",
+    "코스피, 외국인 매도세에 2,500선 아래로 밀려",
+    "금리 인상 우려에 증시 하락 마감",
+    "한국은행 기준금리 동결 결정",
+    "현대차, 미국 전기차 보조금 제외로 판매 감소 우려",
+    "카카오, 경영진 사법 리스크에 주가 급락",
+    "LG에너지솔루션, 북미 배터리 공장 가동 시작",
+    "원·달러 환율 1,400원 돌파… 수입물가 부담 확대",
+    "네이버, 인공지능 검색 서비스 출시로 광고 매출 증가 기대",
+    "반도체 수출 14개월 연속 감소세",
+    "셀트리온, 바이오시밀러 유럽 승인 획득",
+    "건설사 PF 부실 우려 확산에 신용등급 하향",
+    "정부, 내년 경제성장률 전망치 2.2%로 유지",
+    "포스코홀딩스, 리튬 사업 투자 확대 발표",
+    "이마트 4분기 적자 전환… 구조조정 착수",
+]
+
+
+def _best(scores):
+    return max(scores, key=lambda s: s["score"])
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def measure(classifier, texts, repeat: int = 3, batch_size: int = 32) -> dict:
+    """단건 지연시간 (p50 / p95) 과 배치 처리량 (문장/초)"""
+    classifier(texts[:batch_size], batch_size=batch_size, truncation=True)    # 워밍업
+
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            classifier(text, truncation=True)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for i in range(0, len(texts), batch_size):
+            classifier(texts[i:i + batch_size], batch_size=batch_size, truncation=True)
+    seconds = time.perf_counter() - start
+
+    return {
+        "p50_ms"    : round(statistics.median(latencies), 2),
+        "p95_ms"    : round(_percentile(latencies, 95), 2),
+        "throughput": round(repeat * len(texts) / seconds, 1),
+    }
+
+
+def parity(reference, outputs) -> dict:
+    """기준 백엔드와 라벨 일치율 / 라벨별 점수 최대 차이"""
+    agree, max_diff = 0, 0.0
+    for ref, out in zip(reference, outputs):
+        agree += _best(ref)["label"] == _best(out)["label"]
+        ref_scores = {s["label"]: s["score"] for s in ref}
+        for s in out:
+            max_diff = max(max_diff, abs(s["score"] - ref_scores[s["label"]]))
+    return {"label_agreement": round(agree / len(reference), 4), "max_score_diff": round(max_diff, 4)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감성분석 백엔드 정확도 / 속도 비교")
+    parser.add_argument("--backends", nargs="+", default=[b for b in BACKENDS if b != "fake"], choices=BACKENDS)
+    parser.add_argument("--texts", help="비교용 문장 파일 (한 줄에 1개)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--json", help="결과 저장 경로")
+    args = parser.parse_args()
+
+    if args.texts:
+        with open(args.texts, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+    else:
+        texts = SAMPLE_TEXTS * 4
+
+    # 기준은 항상 torch FP32 (현재 서비스의 classifier 와 같은 출력)
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+    results, reference = {}, None
+    for backend in backends:
+        start      = time.perf_counter()
+        classifier = load_sentiment(SENTIMENT_MODEL, backend)
+        load_s     = time.perf_counter() - start
+
+        outputs = classifier(texts, top_k=None, truncation=True, batch_size=args.batch_size)
+        if reference is None:
+            reference = outputs
+        results[backend] = {
+            "load_seconds": round(load_s, 2),
+            **parity(reference, outputs),
+            **measure(classifier, texts, args.repeat, args.batch_size),
+        }
+        del classifier
+        gc.collect()
+
+    base = results["torch"]
+    print(f"\n모델: {SENTIMENT_MODEL}  |  문장 {len(texts)}개 × {args.repeat}회  |  배치 {args.batch_size}")
+    print(f"{'backend':<10} {'일치율':>7} {'점수차':>7} {'p50 ms':>8} {'p95 ms':>8} {'문장/초':>8} {'속도비':>6}")
+    for backend, r in results.items():
+        speedup = base["p50_ms"] / r["p50_ms"] if r["p50_ms"] else 0.0
+        print(f"{backend:<10} {r['label_agreement']:>7.2%} {r['max_score_diff']:>7.4f} "
+              f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['throughput']:>8.1f} {speedup:>5.1f}x")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"model": SENTIMENT_MODEL, "n_texts": len(texts), "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장 → {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+loadtest.py — FastAPI 서비스 부하 테스트 (로컬 uvicorn + 가짜 모델)
+
+uvicorn 을 별도 프로세스로 띄우고 (SENTIMENT_BACKEND=fake — 모델 다운로드 / GPU 불필요)
+동시 접속 수별로 일정 시간 요청을 보내 RPS · 지연 p50/p95/p99 · 에러율을 측정합니다.
+
+  시나리오  | 앱                     | 요청
+  sentiment | hf/04_main.py          | POST /sentiment
+  items     | 05_webapi_router/main  | GET  /items/{id}
+  login     | 05_webapi_router/main  | POST /auth/login
+  analysis  | 05_webapi_router/main  | POST /analysis/sentiment (txt 업로드)
+
+실행 :
+  python loadtest.py                                        # loadtest_results/<커밋>.json 저장
+  python loadtest.py --scenarios items login -c 1 16 64 -d 5
+  python loadtest.py --compare loadtest_results/abc123.json # 이전 결과와 비교
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import random
+import asyncio
+import argparse
+import subprocess
+from pathlib import Path
+
+import httpx
+
+BASE_DIR    = Path(__file__).parent
+RESULTS_DIR = BASE_DIR / "loadtest_results"
+
+HEADLINES = [
+    "삼성전자, 3분기 영업이익 시장 예상치 크게 웃돌아",
+    "코스피, 외국인 매도세에 2,500선 아래로 밀려",
+    "한국은행 기준금리 동결 결정",
+    "카카오, 경영진 사법 리스크에 주가 급락",
+    "반도체 수출 14개월 연속 감소세",
+    "LG에너지솔루션, 북미 배터리 공장 가동 시작",
+]
+DOCUMENT = (" ".join(HEADLINES) + ". ") * 20      # /analysis/sentiment 업로드용 (약 5KB)
+
+
+# ── 시나리오 ─────────────────────────────────────────────────────
+# 이름 → (앱, 요청 생성 함수(i) → httpx 요청 인자)
+
+def _sentiment(i, pool):
+    # pool 개의 서로 다른 문장을 돌려 씀 → 캐시 적중률이 1 - pool/요청수 정도
+    return {"method": "POST", "url": "/sentiment",
+            "json": {"text": f"{HEADLINES[i % len(HEADLINES)]} #{i % pool}"}}
+
+
+def _items(i, pool):
+    return {"method": "GET", "url": f"/items/{random.randint(1, 7000)}"}
+
+
+def _login(i, pool):
+    return {"method": "POST", "url": "/auth/login", "data": {"username": "admin", "password": "1234"}}
+
+
+def _analysis(i, pool):
+    text = f"{DOCUMENT} #{i % pool}"
+    return {"method": "POST", "url": "/analysis/sentiment",
+            "files": {"file": ("news.txt", text.encode("utf-8"), "text/plain")}}
+
+
+SCENARIOS = {
+    "sentiment": ("main", _sentiment),
+    "items"    : ("router", _items),
+    "login"    : ("router", _login),
+    "analysis" : ("router", _analysis),
+}
+
+# 앱 → (uvicorn 앱 경로, 작업 디렉터리)
+APPS = {
+    "main"  : ("04_main:app", BASE_DIR.parent),
+    "router": ("main:app", BASE_DIR),
+}
+
+
+# ── uvicorn 실행 ─────────────────────────────────────────────────
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Server:
+    """with Server("router") as base_url: — uvicorn 을 띄우고 응답할 때까지 대기, 끝나면 종료"""
+
+    def __init__(self, app: str, workers: int = 1, env: dict = None):
+        self.app, self.cwd = APPS[app]
+        self.port    = _free_port()
+        self.workers = workers
+        self.env     = {**os.environ, "SENTIMENT_BACKEND": "fake", **(env or {})}
+        self.proc    = None
+
+    def __enter__(self) -> str:
+        cmd = [sys.executable, "-m", "uvicorn", self.app, "--port", str(self.port),
+               "--workers", str(self.workers), "--log-level", "warning", "--no-access-log"]
+        self.proc = subprocess.Popen(cmd, cwd=self.cwd, env=self.env)
+        base_url  = f"http://127.0.0.1:{self.port}"
+        deadline  = time.time() + 60
+        while time.time() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"uvicorn 이 종료되었습니다 (exit {self.proc.returncode})")
+            try:
+                if httpx.get(base_url + "/metrics", timeout=1).status_code == 200:
+                    return base_url
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError("uvicorn 이 60초 안에 응답하지 않았습니다")
+
+    def __exit__(self, *exc):
+        if self.proc and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+
+# ── 부하 생성 ─────────────────────────────────────────────────────
+def _percentile(sorted_ms, q):
+    if not sorted_ms:
+        return 0.0
+    return sorted_ms[min(len(sorted_ms) - 1, int(q / 100 * len(sorted_ms)))]
+
+
+async def run_level(base_url, make_request, concurrency: int, duration: float, pool: int) -> dict:
+    """concurrency 개의 클라이언트가 duration 초 동안 쉬지 않고 요청"""
+    latencies, statuses, errors = [], {}, 0
+    counter  = iter(range(10 ** 9))
+    limits   = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        # 워밍업 (연결 생성 / 첫 요청 비용 제외)
+        await asyncio.gather(*[client.request(**make_request(0, pool)) for _ in range(concurrency)],
+                             return_exceptions=True)
+        start    = time.perf_counter()
+        deadline = start + duration
+
+        async def user():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                try:
+                    r = await client.request(**make_request(next(counter), pool))
+                    code = r.status_code
+                except httpx.HTTPError:
+                    code = "error"
+                latencies.append((time.perf_counter() - t0) * 1000)
+                statuses[str(code)] = statuses.get(str(code), 0) + 1
+                if code == "error" or code >= 400:
+                    errors += 1
+
+        await asyncio.gather(*[user() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    n = len(latencies)
+    return {
+        "concurrency": concurrency,
+        "requests"   : n,
+        "rps"        : round(n / elapsed, 1),
+        "p50_ms"     : round(_percentile(latencies, 50), 2),
+        "p95_ms"     : round(_percentile(latencies, 95), 2),
+        "p99_ms"     : round(_percentile(latencies, 99), 2),
+        "error_rate" : round(errors / n, 4) if n else 0.0,
+        "statuses"   : statuses,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(scenarios, levels, duration, pool, workers, env=None) -> dict:
+    result = {
+        "commit"  : _git_commit(),
+        "time"    : time.strftime("%Y-%m-%d %H:%M:%S"),
+        "settings": {"duration_s": duration, "pool": pool, "workers": workers,
+                     "fake_ms": os.getenv("SENTIMENT_FAKE_MS", "2")},
+        "results" : {},
+    }
+    # 같은 앱을 쓰는 시나리오는 서버 1개로
+    for app in dict.fromkeys(SCENARIOS[name][0] for name in scenarios):
+        with Server(app, workers, env) as base_url:
+            for name in scenarios:
+                if SCENARIOS[name][0] != app:
+                    continue
+                result["results"][name] = []
+                for c in levels:
+                    level = asyncio.run(run_level(base_url, SCENARIOS[name][1], c, duration, pool))
+                    result["results"][name].append(level)
+                    print(f"  {name:<10} c={c:<4} {level['rps']:>9,.1f} rps   p50 {level['p50_ms']:>8.2f}  "
+                          f"p95 {level['p95_ms']:>8.2f}  p99 {level['p99_ms']:>8.2f} ms   "
+                          f"에러 {level['error_rate']:.2%}")
+    return result
+
+
+# ── 결과 비교 ─────────────────────────────────────────────────────
+def compare(old: dict, new: dict):
+    """시나리오 · 동시 접속 수별 RPS / p95 를 이전 결과와 나란히 출력"""
+    print(f"\n비교 : {old['commit']} → {new['commit']}")
+    for name, levels in new["results"].items():
+        old_levels = {lv["concurrency"]: lv for lv in old["results"].get(name, [])}
+        for lv in levels:
+            prev = old_levels.get(lv["concurrency"])
+            if prev is None:
+                continue
+            ratio = lv["rps"] / prev["rps"] if prev["rps"] else float("nan")
+            flag  = "  ⚠️" if ratio < 0.9 else ""
+            print(f"  {name:<10} c={lv['concurrency']:<4} rps {prev['rps']:>9,.1f} → {lv['rps']:>9,.1f}  x{ratio:5.2f}   "
+                  f"p95 {prev['p95_ms']:>8.2f} → {lv['p95_ms']:>8.2f} ms{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FastAPI 서비스 부하 테스트 (가짜 모델)")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=SCENARIOS)
+    parser.add_argument("-c", "--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("-d", "--duration", type=float, default=10, help="동시 접속 수별 측정 시간 (초)")
+    parser.add_argument("--pool", type=int, default=1000, help="서로 다른 입력 문장 수 (캐시 적중률 조절)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--output",  default=None, help="결과 JSON 경로 (기본: loadtest_results/<커밋>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    result = run(args.scenarios, args.concurrency, args.duration, args.pool, args.workers)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{result['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+    print(f"저장 완료 : {output}")
+
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), result)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,36 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from routers.items import router as items_router
 from routers.login import router as login_router
 from routers.file_upload import router as file_upload
+from services.model_registry import registry
+from services.inference import inference
+from services.metrics import install_metrics
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 추론 풀 생성 + 라우터들이 함께 쓰는 모델을 시작 시 1번만 로드
+    await inference.start()
+    yield
+    inference.shutdown()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.include_router(items_router)
 app.include_router(login_router)
 app.include_router(file_upload)
 
+# 라우트별 응답 시간 / 처리 중 요청 수 / 본문 크기 → GET /metrics (Prometheus)
+install_metrics(app)
+
+
+# 로드된 모델별 로드 시간 / 메모리
+@app.get("/models")
+def model_info():
+    return registry.info()
+
 #uvicorn main:app --reload
 #get /items/
 #get /items/1
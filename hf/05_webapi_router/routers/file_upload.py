@@ -1,30 +1,59 @@
 # routers/file_upload.py
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
-from transformers import pipeline
+from starlette.concurrency import run_in_threadpool
+from services.chunking import score_document
+from services.sentiment_cache import sentiment_cache
+from services.model_registry import get_classifier, get_tokenizer
+from services.inference import inference
+from services.metrics import mark_parsed, phase
 
 router = APIRouter(prefix="/analysis", tags=["감성분석"])
 
-# 모델 로드 (서버 시작 시 1회만 실행)
-classifier = pipeline(
-    "text-classification",
-    model="snunlp/KR-FinBert-SC"
-)
+# 모델은 공용 레지스트리에서 가져옴 (04_main 과 같은 객체, 프로세스당 1회 로드)
 
+def classify_all(texts):
+    # 윈도우별 전체 라벨 점수 (문서 단위 집계용) — 추론 실행기의 스레드 / 프로세스에서 실행
+    return get_classifier()(texts, top_k=None, truncation=True, batch_size=len(texts))
 
+async def classify_all_async(texts):
+    # 이벤트 루프를 막지 않도록 실행기에 넘김, 대기열이 가득 차면 503
+    return await inference.run(classify_all, texts)
+
+# 같은 문장 묶음(윈도우)은 캐시에서 바로 가져옴 — /sentiment 와 같은 캐시를 공유 (kind 로 구분)
+classify_all_cached = sentiment_cache.wrap(classify_all_async, kind="all")
+
+
+# 긴 문서는 문장 단위 → 토큰 윈도우(겹침 포함)로 나눠 배치 추론 후 문서 단위로 집계
+# detail=true 이면 윈도우별 점수도 함께 반환
 @router.post("/sentiment")
-async def upload_sentiment(file: UploadFile = File()):
+async def upload_sentiment(file: UploadFile = File(), detail: bool = False):
+    mark_parsed()
     if file.content_type not in ["text/plain"]:
         raise HTTPException(
             status_code=400,
             detail="텍스트 파일(.txt)만 업로드 가능합니다"
         )
-    contents = await file.read()
-    text = contents.decode("utf-8")
-    result = classifier(text)[0]
-    return {
-        "filename": file.filename,
-        "text": text,
-        "label": result["label"],
-        "score": round(result["score"], 4)
-    }
\ No newline at end of file
+    try:
+        with phase("inference"):
+            # 토크나이저가 아직 로드 전이면 로드가 이벤트 루프를 막지 않도록 스레드 풀에서 가져옴
+            tokenizer = await run_in_threadpool(get_tokenizer)
+            result    = await score_document(file, tokenizer, detail=detail,
+                                             classify_fn=classify_all_cached)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="UTF-8 텍스트 파일만 분석할 수 있습니다")
+    if result["label"] is None:
+        raise HTTPException(status_code=400, detail="빈 파일입니다")
+    return {"filename": file.filename, **result}
+
+
+# 감성분석 캐시 적중/미적중 통계
+@router.get("/cache/stats")
+def cache_stats():
+    return sentiment_cache.stats()
+
+
+# 추론 실행기 상태 (대기 중 작업 수, 503 거절 횟수)
+@router.get("/inference/stats")
+def inference_stats():
+    return inference.metrics()
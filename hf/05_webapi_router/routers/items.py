@@ -1,21 +1,56 @@
-from fastapi import APIRouter 
+from fastapi import APIRouter, HTTPException, Query
+from services.catalogue import load_catalogue, parse_fields, project
 
 router = APIRouter(prefix="/items", tags=["종목"])
 
-# 임시 종목 데이터
+# 임시 종목 데이터 (screener CSV 가 없을 때 사용)
 ITEMS = [
     {"id": 1, "ticker": "005930", "name": "삼성전자"},
     {"id": 2, "ticker": "000660", "name": "SK하이닉스"},
     {"id": 3, "ticker": "035420", "name": "NAVER"},
 ]
 
+# 서버 시작 시 1회 로드 — id / 티커 dict, 이름 / 티커 접두어 정렬 인덱스
+catalogue = load_catalogue(fallback=ITEMS)
+
+
+def _fields(fields):
+  try:
+    return parse_fields(fields)
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e))
+
+
+# GET /items/?limit=50&fields=ticker,name  → 다음 페이지는 응답의 next_cursor 를 cursor 로 전달
 @router.get('/')
-def list_items():
-  return ITEMS 
+def list_items(cursor: str = None, limit: int = Query(50, ge=1, le=500), fields: str = None):
+  selected = _fields(fields)
+  try:
+    items, next_cursor = catalogue.page(cursor, limit)
+  except ValueError:
+    raise HTTPException(status_code=400, detail="잘못된 cursor 입니다")
+  return {
+    "items": [project(item, selected) for item in items],
+    "next_cursor": next_cursor,
+    "total": len(catalogue),
+  }
+
+# 티커 / 이름 접두어 검색 — /{item_id} 보다 먼저 선언해야 "search" 가 item_id 로 잡히지 않음
+@router.get("/search")
+def search_items(q: str = Query(min_length=1), limit: int = Query(20, ge=1, le=100), fields: str = None):
+  selected = _fields(fields)
+  return {"items": [project(item, selected) for item in catalogue.search(q, limit)]}
+
+@router.get("/ticker/{ticker}")
+def get_item_by_ticker(ticker: str):
+  item = catalogue.get_ticker(ticker)
+  if item is None:
+    return {"error": "존재하지 않는 종목입니다"}
+  return item
 
 @router.get("/{item_id}")
 def get_item(item_id: int):
-  for item in ITEMS:
-    if item["id"] == item_id:
-      return item
-  return {"error": "존재하지 않는 종목입니다"}
\ No newline at end of file
+  item = catalogue.get(item_id)
+  if item is None:
+    return {"error": "존재하지 않는 종목입니다"}
+  return item
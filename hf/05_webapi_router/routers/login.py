@@ -1,21 +1,53 @@
-from fastapi import APIRouter, Form, HTTPException
+from fastapi import APIRouter, Depends, Form, Header, HTTPException
+from services.credentials import CredentialStore, TooManyAttempts
 
 router = APIRouter(prefix="/auth", tags=["인증"])
 
-# 임시 사용자 데이터 (실제 서비스는 DB 사용)
-USERS = {
+# 임시 사용자 데이터 (실제 서비스는 DB 에 해시만 저장)
+# 서버 시작 시 salt + PBKDF2 해시로 바꿔 보관하고 평문은 남기지 않음
+store = CredentialStore.from_plaintext({
     "admin": "1234",
     "student": "abcd"
-}
+})
 
 
+# 로그인 성공 시 세션 토큰 발급 → 이후 요청은 Authorization: Bearer <토큰> (해시 계산 없이 확인)
+# 해시는 저장소 전용 스레드에서 계산 → 로그인이 몰려도 다른 라우트의 스레드 풀을 차지하지 않음
 @router.post("/login")
-def login(username: str = Form(), password: str = Form()):
-    if username not in USERS:
-        raise HTTPException(status_code=401, detail="존재하지 않는 사용자입니다ㄴ")
-    if USERS[username] != password:
-        raise HTTPException(status_code=401, detail="비밀번호가 틀렸습니다")
-    return {"message": f"{username}님 로그인 성공"}
-  
-  
-  
\ No newline at end of file
+async def login(username: str = Form(), password: str = Form()):
+    try:
+        token = await store.login(username, password)
+    except TooManyAttempts:
+        raise HTTPException(status_code=503, detail="로그인 요청이 많습니다. 잠시 후 다시 시도해 주세요",
+                            headers={"Retry-After": "1"})
+    if token is None:
+        # 사용자가 없는지 / 비밀번호가 틀렸는지 구분하지 않음 (계정 존재 여부 노출 방지)
+        raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 틀렸습니다")
+    return {"message": f"{username}님 로그인 성공", "access_token": token, "token_type": "bearer"}
+
+
+def current_user(authorization: str = Header(None)) -> str:
+    """Authorization: Bearer <토큰> → 사용자 이름 (다른 라우터에서 Depends(current_user) 로 사용)"""
+    scheme, _, token = (authorization or "").partition(" ")
+    username = store.sessions.lookup(token) if scheme.lower() == "bearer" and token else None
+    if username is None:
+        raise HTTPException(status_code=401, detail="로그인이 필요합니다",
+                            headers={"WWW-Authenticate": "Bearer"})
+    return username
+
+
+@router.get("/me")
+def me(username: str = Depends(current_user)):
+    return {"username": username}
+
+
+@router.post("/logout")
+def logout(authorization: str = Header(None), username: str = Depends(current_user)):
+    store.sessions.revoke(authorization.partition(" ")[2])
+    return {"message": f"{username}님 로그아웃"}
+
+
+# 로그인 시도 / 해시 계산 시간 통계
+@router.get("/stats")
+def auth_stats():
+    return store.stats()
@@ -0,0 +1,3 @@
+# services 패키지 — 05_webapi_router 의 routers 와 hf/04_main.py 가 함께 사용
+# 패키지 안에서는 상대 import (from .model_registry ...) 를 써서
+# 'services' (05_webapi_router 에서 실행) / '05_webapi_router.services' (hf/ 에서 실행) 어느 이름으로 가져와도 동작
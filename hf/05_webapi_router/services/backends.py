@@ -0,0 +1,143 @@
+# services/backends.py
+# 감성분석 추론 백엔드 — SENTIMENT_BACKEND 환경변수로 선택
+#   torch     : PyTorch FP32 (기본, 기존 동작)
+#   int8      : PyTorch 동적 양자화 (nn.Linear 가중치를 int8 로, 별도 export 불필요)
+#   onnx      : ONNX Runtime 그래프 (optimum 으로 export, SENTIMENT_ONNX_DIR 에 저장)
+#   onnx-int8 : ONNX Runtime + 동적 int8 양자화 그래프
+#   fake      : 모델 없이 결정적인 가짜 결과 (부하 테스트용, SENTIMENT_FAKE_MS 로 추론 시간 흉내)
+#
+# 어떤 백엔드든 transformers pipeline 으로 감싸서 반환하므로 호출하는 쪽 코드는 같습니다.
+# 정확도 / 속도 비교 : python bench_backends.py
+
+import os
+import time
+import zlib
+import hashlib
+from pathlib import Path
+
+BACKENDS     = ("torch", "int8", "onnx", "onnx-int8", "fake")
+ONNX_DIR     = Path(os.getenv("SENTIMENT_ONNX_DIR", Path(__file__).resolve().parent.parent / "models" / "kr-finbert-onnx"))
+ONNX_FILES   = {"onnx": "model.onnx", "onnx-int8": "model_quantized.onnx"}
+FAKE_MS      = float(os.getenv("SENTIMENT_FAKE_MS", "2"))          # fake : forward 1회 고정 시간 (ms)
+FAKE_ITEM_MS = float(os.getenv("SENTIMENT_FAKE_ITEM_MS", "0.5"))   # fake : 문장당 추가 시간 (ms)
+
+
+# ── 부하 테스트용 가짜 모델 ───────────────────────────────────────
+
+class FakeTokenizer:
+    """공백 단위 토큰 (문장 분할 / 길이 정렬만 흉내)"""
+    model_max_length = 512
+
+    def num_special_tokens_to_add(self) -> int:
+        return 2
+
+    def __call__(self, texts, add_special_tokens=True, truncation=False, **kwargs):
+        single = isinstance(texts, str)
+        ids = []
+        for text in [texts] if single else texts:
+            tokens = [zlib.crc32(word.encode("utf-8")) % 30000 for word in text.split()]
+            if add_special_tokens:
+                tokens = [1] + tokens + [2]
+            if truncation:
+                tokens = tokens[:self.model_max_length]
+            ids.append(tokens)
+        return {"input_ids": ids[0] if single else ids}
+
+    def decode(self, ids) -> str:
+        return " ".join(f"t{i}" for i in ids)
+
+
+class FakeClassifier:
+    """
+    transformers text-classification pipeline 과 같은 호출 형식의 가짜 분류기
+    같은 문장은 항상 같은 결과 (해시 기반), forward 시간은 FAKE_MS + 문장 수 × FAKE_ITEM_MS
+    """
+    labels = ("positive", "negative", "neutral")
+
+    def __init__(self):
+        self.tokenizer = FakeTokenizer()
+
+    def _scores(self, text):
+        digest = hashlib.md5(text.encode("utf-8")).digest()
+        raw    = [b + 1 for b in digest[:3]]
+        total  = sum(raw)
+        return [{"label": label, "score": r / total} for label, r in zip(self.labels, raw)]
+
+    def __call__(self, texts, top_k=1, **kwargs):
+        single = isinstance(texts, str)
+        texts  = [texts] if single else list(texts)
+        time.sleep((FAKE_MS + FAKE_ITEM_MS * len(texts)) / 1000)
+        if top_k is None:
+            out = [self._scores(t) for t in texts]
+        else:
+            out = [max(self._scores(t), key=lambda s: s["score"]) for t in texts]
+        return out[0] if single and top_k is None else out
+
+
+def export_onnx(model_name: str, out_dir: Path = ONNX_DIR, quantize: bool = True) -> Path:
+    """
+    HF 모델 → ONNX 그래프 export (out_dir/model.onnx)
+    quantize=True 이면 동적 int8 양자화 그래프(out_dir/model_quantized.onnx)도 함께 저장
+    """
+    from transformers import AutoTokenizer
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    out_dir = Path(out_dir)
+    model   = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    model.save_pretrained(out_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(out_dir)
+
+    if quantize:
+        # 활성값은 실행 중 범위를 재는 동적 양자화 → 보정(calibration) 데이터가 필요 없음
+        quantizer = ORTQuantizer.from_pretrained(out_dir, file_name=ONNX_FILES["onnx"])
+        qconfig   = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=out_dir, quantization_config=qconfig)
+    return out_dir
+
+
+def _load_onnx(model_name: str, backend: str):
+    from transformers import AutoTokenizer, pipeline
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+
+    file_name = ONNX_FILES[backend]
+    if not (ONNX_DIR / file_name).exists():
+        export_onnx(model_name, ONNX_DIR, quantize=(backend == "onnx-int8"))
+    model     = ORTModelForSequenceClassification.from_pretrained(ONNX_DIR, file_name=file_name)
+    tokenizer = AutoTokenizer.from_pretrained(ONNX_DIR)
+    return pipeline("text-classification", model=model, tokenizer=tokenizer)
+
+
+def load_sentiment(model_name: str, backend: str = "torch"):
+    """backend 에 맞는 text-classification pipeline 생성"""
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 백엔드입니다: {backend} (가능: {', '.join(BACKENDS)})")
+
+    if backend == "fake":
+        return FakeClassifier()
+    if backend in ONNX_FILES:
+        return _load_onnx(model_name, backend)
+
+    from transformers import pipeline
+    classifier = pipeline("text-classification", model=model_name)
+    if backend == "int8":
+        import torch
+        classifier.model = torch.quantization.quantize_dynamic(
+            classifier.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return classifier
+
+
+def load_tokenizer(model_name: str, backend: str = "torch"):
+    """문장 분할 / 길이 정렬용 토크나이저만 로드 (process 풀의 본 프로세스용)"""
+    if backend == "fake":
+        return FakeTokenizer()
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(model_name)
+
+
+if __name__ == "__main__":
+    # 미리 export 해 두기 : python -m services.backends snunlp/KR-FinBert-SC
+    import sys
+    name = sys.argv[1] if len(sys.argv) > 1 else "snunlp/KR-FinBert-SC"
+    print(f"export 완료 → {export_onnx(name)}")
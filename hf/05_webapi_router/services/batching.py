@@ -0,0 +1,127 @@
+# services/batching.py
+# 동시에 들어온 추론 요청을 모아 한 번의 forward 로 처리하는 동적 배처
+
+import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+MAX_BATCH_SIZE = int(os.getenv("SENTIMENT_MAX_BATCH", "32"))
+MAX_WAIT_MS    = float(os.getenv("SENTIMENT_MAX_WAIT_MS", "10"))
+BATCH_WORKERS  = int(os.getenv("SENTIMENT_BATCH_WORKERS", "1"))
+MAX_QUEUE      = int(os.getenv("SENTIMENT_MAX_QUEUE", "256"))     # 대기 요청이 이보다 많으면 503
+
+
+class DynamicBatcher:
+    """
+    요청을 큐에 모았다가 (최대 max_batch_size 건 또는 첫 요청 후 max_wait_ms 경과 시)
+    infer_fn(list) 를 1회 호출해 배치로 추론합니다.
+
+    infer_fn 은 입력 리스트와 같은 길이·순서의 결과 리스트를 반환해야 합니다.
+    추론은 별도 스레드에서 실행되므로 이벤트 루프(다른 API)는 막히지 않습니다.
+    큐에 max_queue 건 이상 쌓여 있으면 새 요청은 기다리지 않고 503 으로 거절합니다.
+    """
+
+    def __init__(self, infer_fn, max_batch_size: int = MAX_BATCH_SIZE,
+                 max_wait_ms: float = MAX_WAIT_MS, workers: int = BATCH_WORKERS,
+                 max_queue: int = MAX_QUEUE):
+        self.infer_fn       = infer_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait       = max_wait_ms / 1000
+        self.workers        = workers
+        self.max_queue      = max_queue
+        self.executor       = None
+        self.queue          = None
+        self.tasks          = []
+
+        # 지표
+        self.batches     = 0
+        self.items       = 0
+        self.errors      = 0
+        self.rejected    = 0
+        self.infer_time  = 0.0
+        self.size_counts = {}          # 배치 크기 → 횟수
+
+    async def start(self):
+        self.queue    = asyncio.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batcher")
+        self.tasks    = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        if self.executor:
+            self.executor.shutdown(wait=False)
+
+    async def submit(self, item):
+        """item 1건을 큐에 넣고 배치 추론 결과를 기다립니다."""
+        if self.queue.qsize() >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="추론 요청이 많아 잠시 후 다시 시도해 주세요",
+                headers={"Retry-After": "1"},
+            )
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((item, future))
+        return await future
+
+    async def _collect(self) -> list:
+        loop     = asyncio.get_running_loop()
+        batch    = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(self.executor, self.infer_fn, items)
+            except Exception as e:
+                self.errors += 1
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.infer_time += time.perf_counter() - start
+            self.batches    += 1
+            self.items      += len(batch)
+            self.size_counts[len(batch)] = self.size_counts.get(len(batch), 0) + 1
+            for (_, future), result in zip(batch, results):
+                if not future.done():                   # 클라이언트가 끊긴 요청은 건너뜀
+                    future.set_result(result)
+
+    def metrics(self) -> dict:
+        return {
+            "queue_depth"      : self.queue.qsize() if self.queue else 0,
+            "batches"          : self.batches,
+            "items"            : self.items,
+            "errors"           : self.errors,
+            "rejected"         : self.rejected,
+            "avg_batch_size"   : round(self.items / self.batches, 2) if self.batches else 0.0,
+            "avg_batch_ms"     : round(self.infer_time / self.batches * 1000, 2) if self.batches else 0.0,
+            "batch_size_counts": dict(sorted(self.size_counts.items())),
+            "max_batch_size"   : self.max_batch_size,
+            "max_wait_ms"      : self.max_wait * 1000,
+            "workers"          : self.workers,
+            "max_queue"        : self.max_queue,
+        }
@@ -0,0 +1,172 @@
+# services/bulk.py
+# 대량 감성분석 — JSON 배열 / NDJSON 입력을 스트리밍으로 읽고, 결과를 NDJSON 으로 흘려보냄
+
+import json
+import codecs
+import asyncio
+import tempfile
+
+from fastapi import Request, HTTPException
+
+WINDOW_SIZE = 256      # 한 번에 메모리에 올리는 문장 수 (이 안에서 길이순 정렬)
+BATCH_SIZE  = 32       # forward 1회당 문장 수
+SPOOL_MAX_MEMORY = 1024 * 1024   # NDJSON 본문을 메모리에 두는 최대 크기 (넘으면 임시 파일로)
+BUSY_WAIT   = 0.05     # 추론 대기열이 가득 찼을 때(503) 다시 넣기 전 대기 시간 (초)
+
+
+def _to_text(obj) -> str:
+    """입력 1건 → 문자열 ("문장" 또는 {"text": "문장"} 모두 허용)"""
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, dict) and isinstance(obj.get("text"), str):
+        return obj["text"]
+    raise ValueError('각 항목은 문자열 또는 {"text": "..."} 형식이어야 합니다')
+
+
+async def _iter_lines(chunks):
+    """바이트 청크 스트림 → 한 줄씩 (UTF-8 경계가 청크 사이에 걸려도 안전)"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer  = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+async def _iter_file(f, block_size: int = 64 * 1024, close: bool = False):
+    """파일 객체 (UploadFile / SpooledTemporaryFile) → 블록 단위 바이트"""
+    try:
+        while True:
+            chunk = f.read(block_size)
+            if asyncio.iscoroutine(chunk):
+                chunk = await chunk
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        if close:
+            f.close()
+
+
+async def _iter_array(data):
+    for obj in data:
+        try:
+            yield _to_text(obj)
+        except ValueError as e:
+            yield e
+
+
+async def _iter_ndjson(lines):
+    async for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield _to_text(json.loads(line))
+        except ValueError as e:                     # JSONDecodeError 도 ValueError
+            yield ValueError(str(e))
+
+
+async def read_items(request: Request):
+    """
+    요청 본문 → 입력 항목 async 이터레이터 (각 항목은 str 또는 해당 줄의 ValueError)
+
+    · application/x-ndjson (또는 jsonl) : 본문을 SpooledTemporaryFile 로 받아 둔 뒤 한 줄씩 읽음
+    · multipart/form-data               : file 필드의 NDJSON 파일 (FastAPI 가 임시 파일로 저장)
+    · application/json                  : JSON 배열 (배열 특성상 본문 전체를 한 번에 파싱)
+
+    NDJSON 본문은 응답 스트리밍이 시작되기 전에 임시 파일로 옮겨 둡니다.
+    (uvicorn 은 응답 스트리밍 중 연결 종료 감지를 위해 receive 를 함께 호출하므로
+     요청 본문을 읽으면서 동시에 응답을 흘려보낼 수 없음) — 큰 본문은 디스크로 넘어가 메모리는 일정
+    """
+    content_type = request.headers.get("content-type", "")
+
+    if "ndjson" in content_type or "jsonl" in content_type:
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        return _iter_ndjson(_iter_lines(_iter_file(spool, close=True)))
+
+    if content_type.startswith("multipart/form-data"):
+        form   = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="file 필드에 NDJSON 파일을 첨부하세요")
+        return _iter_ndjson(_iter_lines(_iter_file(upload)))
+
+    try:
+        data = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="JSON 배열 또는 NDJSON 형식이어야 합니다")
+    if not isinstance(data, list):
+        raise HTTPException(status_code=400, detail="JSON 배열이어야 합니다")
+    return _iter_array(data)
+
+
+def _dump(obj) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def _classify(classify_batch, texts):
+    """
+    classify_batch(texts) 를 await — 추론 대기열이 가득 차 503 이면 잠시 기다렸다가 다시 넣음
+
+    이미 응답 스트리밍 중이라 503 을 돌려줄 수 없으므로, 대기열이 빌 때까지 입력을 읽지 않는 방식으로 속도를 맞춥니다.
+    """
+    while True:
+        try:
+            return await classify_batch(texts)
+        except HTTPException as e:
+            if e.status_code != 503:
+                raise
+        await asyncio.sleep(BUSY_WAIT)
+
+
+async def _score_window(window, classify_batch, length_fn, batch_size):
+    """
+    윈도우 1개를 토큰 길이순으로 정렬해 배치 추론 → NDJSON 줄 목록을 배치별로 yield
+
+    비슷한 길이끼리 묶으면 패딩이 줄어 forward 가 빨라집니다.
+    classify_batch 는 async 함수 — 단건 요청과 같은 추론 경로(배처 / 추론 실행기)로 보내야
+    forward 가 한 줄로 직렬화되고 대기열 한도도 함께 적용됩니다.
+    """
+    loop    = asyncio.get_running_loop()
+    texts   = [text for _, text in window]
+    lengths = await loop.run_in_executor(None, length_fn, texts)
+    order   = sorted(range(len(window)), key=lengths.__getitem__)
+
+    for start in range(0, len(order), batch_size):
+        part    = [window[i] for i in order[start:start + batch_size]]
+        results = await _classify(classify_batch, [text for _, text in part])
+        yield [_dump({"index": idx, "text": text, "label": r["label"], "score": round(r["score"], 4)})
+               for (idx, text), r in zip(part, results)]
+
+
+async def stream_sentiment(items, classify_batch, length_fn,
+                           window_size: int = WINDOW_SIZE, batch_size: int = BATCH_SIZE):
+    """
+    입력 항목 스트림 → 결과 NDJSON 스트림
+
+    window_size 건씩 모아 길이순 배치로 추론하고, 배치가 끝날 때마다 바로 내보냅니다.
+    메모리에는 윈도우 1개만 올라갑니다.
+    각 줄의 index 는 입력 순서 (0부터) — 출력은 윈도우 안에서 길이순이므로 필요하면 index 로 재정렬하세요.
+    """
+    window = []
+    index  = 0
+    async for item in items:
+        if isinstance(item, Exception):
+            yield _dump({"index": index, "error": str(item)})
+        else:
+            window.append((index, item))
+        index += 1
+        if len(window) >= window_size:
+            async for lines in _score_window(window, classify_batch, length_fn, batch_size):
+                yield b"".join(lines)
+            window = []
+    if window:
+        async for lines in _score_window(window, classify_batch, length_fn, batch_size):
+            yield b"".join(lines)
@@ -0,0 +1,146 @@
+# services/catalogue.py
+# 종목 카탈로그 — nasdaq_screener CSV 를 한 번 읽어 메모리 인덱스로 보관
+#   · id / 티커         : dict        → O(1)
+#   · 이름 / 티커 접두어 : 정렬 리스트 + bisect → O(log n + 결과 수)
+#   · 목록              : id 순 커서 페이지네이션 + 필드 선택
+
+import os
+import csv
+import base64
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from pathlib import Path
+
+# 서비스와 함께 배포하는 데이터 디렉터리 (05_webapi_router/data) — ITEMS_DATA_DIR 로 변경
+DATA_DIR  = Path(os.getenv("ITEMS_DATA_DIR", Path(__file__).resolve().parents[1] / "data"))
+ITEMS_CSV = os.getenv("ITEMS_CSV")       # 없으면 DATA_DIR 의 가장 최근 nasdaq_screener_*.csv
+
+FIELDS = ("id", "ticker", "name", "last_sale", "net_change", "pct_change",
+          "market_cap", "country", "ipo_year", "volume", "sector", "industry")
+
+
+def _number(text, cast=float):
+    """'$116.92' / '2.669%' / '' → 숫자 또는 None"""
+    text = text.strip().lstrip("$").rstrip("%").replace(",", "")
+    if not text:
+        return None
+    try:
+        return cast(float(text))
+    except ValueError:
+        return None
+
+
+def _find_csv():
+    if ITEMS_CSV:
+        return Path(ITEMS_CSV)
+    files = sorted(DATA_DIR.glob("nasdaq_screener_*.csv"))
+    return files[-1] if files else None
+
+
+def load_csv(path) -> list:
+    """screener CSV → 종목 dict 목록 (id 는 1부터 파일 순서대로)"""
+    items = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            items.append({
+                "id"        : len(items) + 1,
+                "ticker"    : row["Symbol"].strip(),
+                "name"      : row["Name"].strip(),
+                "last_sale" : _number(row["Last Sale"]),
+                "net_change": _number(row["Net Change"]),
+                "pct_change": _number(row["% Change"]),
+                "market_cap": _number(row["Market Cap"]),
+                "country"   : row["Country"].strip() or None,
+                "ipo_year"  : _number(row["IPO Year"], int),
+                "volume"    : _number(row["Volume"], int),
+                "sector"    : row["Sector"].strip() or None,
+                "industry"  : row["Industry"].strip() or None,
+            })
+    return items
+
+
+def encode_cursor(item_id: int) -> str:
+    return base64.urlsafe_b64encode(str(item_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """잘못된 커서면 ValueError"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return int(base64.urlsafe_b64decode(padded.encode()).decode())
+
+
+def project(item: dict, fields=None) -> dict:
+    return item if fields is None else {f: item.get(f) for f in fields}
+
+
+def parse_fields(text):
+    """'ticker,name' → ('ticker', 'name'), 비어 있으면 None (전체 필드), 모르는 필드면 ValueError"""
+    if not text:
+        return None
+    fields  = tuple(f.strip() for f in text.split(",") if f.strip())
+    unknown = [f for f in fields if f not in FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드: {', '.join(unknown)} (가능: {', '.join(FIELDS)})")
+    return fields
+
+
+class Catalogue:
+    def __init__(self, items: list):
+        self.items     = sorted(items, key=lambda item: item["id"])
+        self._ids      = [item["id"] for item in self.items]
+        self.by_id     = {item["id"]: item for item in self.items}
+        self.by_ticker = {item["ticker"].upper(): item for item in self.items}
+        # 접두어 검색용 정렬 인덱스 (소문자 키, id)
+        self._names    = sorted((item["name"].lower(), item["id"]) for item in self.items)
+        self._tickers  = sorted((item["ticker"].lower(), item["id"]) for item in self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, item_id: int):
+        return self.by_id.get(item_id)
+
+    def get_ticker(self, ticker: str):
+        return self.by_ticker.get(ticker.upper())
+
+    @staticmethod
+    def _prefix_ids(index, prefix):
+        """정렬 인덱스에서 prefix 로 시작하는 id 를 앞에서부터 (필요한 만큼만 순회)"""
+        for i in range(bisect_left(index, (prefix,)), len(index)):
+            key, item_id = index[i]
+            if not key.startswith(prefix):
+                break
+            yield item_id
+
+    def search(self, prefix: str, limit: int = 20) -> list:
+        """티커 또는 이름이 prefix 로 시작하는 종목 — 티커 정확히 일치 → 티커 접두어 → 이름 접두어 순"""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        exact = self.by_ticker.get(prefix.upper())
+        candidates = chain([exact["id"]] if exact else [],
+                           self._prefix_ids(self._tickers, prefix),
+                           self._prefix_ids(self._names, prefix))
+        seen, found = set(), []
+        for item_id in candidates:
+            if item_id not in seen:
+                seen.add(item_id)
+                found.append(self.by_id[item_id])
+                if len(found) >= limit:
+                    break
+        return found
+
+    def page(self, cursor: str = None, limit: int = 50) -> tuple:
+        """cursor 다음부터 limit 개 → (종목 목록, 다음 커서 또는 None)"""
+        start = bisect_right(self._ids, decode_cursor(cursor)) if cursor else 0
+        items = self.items[start:start + limit]
+        more  = start + limit < len(self.items)
+        return items, (encode_cursor(items[-1]["id"]) if items and more else None)
+
+
+def load_catalogue(fallback: list = None) -> Catalogue:
+    """CSV 카탈로그 로드 — 파일이 없으면 fallback 목록 사용"""
+    path = _find_csv()
+    if path is not None and path.exists():
+        return Catalogue(load_csv(path))
+    return Catalogue(fallback or [])
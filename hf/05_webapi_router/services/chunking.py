@@ -0,0 +1,187 @@
+# services/chunking.py
+# 긴 문서 감성분석 — 업로드 파일을 조금씩 읽어 문장 단위로 자르고,
+# 모델 최대 길이에 맞는 토큰 윈도우(겹침 포함)로 묶어 배치 추론 후 문서 단위로 집계
+
+import re
+import codecs
+import inspect
+
+from starlette.concurrency import run_in_threadpool
+
+READ_BLOCK     = 64 * 1024       # 업로드 파일 1회 읽기 크기 (byte)
+OVERLAP_TOKENS = 64              # 이웃 윈도우끼리 겹치는 토큰 수 (문맥 유지)
+BATCH_SIZE     = 16              # forward 1회당 윈도우 수
+PREVIEW_CHARS  = 100
+MAX_SENTENCE_CHARS = 4096        # 문장 부호 없이 이어지는 텍스트는 이 길이에서 강제로 자름
+TOKENIZE_BATCH = 64              # 스레드 풀에서 한 번에 토큰화하는 문장 수
+
+# 문장 끝 (. ! ? 。 … 뒤 공백) 또는 줄바꿈에서 자름
+SENTENCE_END = re.compile(r"(?<=[.!?。…])\s+|\n+")
+
+
+async def iter_sentences(upload, block_size: int = READ_BLOCK):
+    """UploadFile → 문장 async 제너레이터 (파일 전체를 메모리에 올리지 않음)"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer  = ""
+    while chunk := await upload.read(block_size):
+        buffer += decoder.decode(chunk)
+        *sentences, buffer = SENTENCE_END.split(buffer)
+        # 문장 끝이 오지 않는 긴 텍스트도 버퍼가 무한히 커지지 않도록 공백 기준으로 잘라냄
+        while len(buffer) > MAX_SENTENCE_CHARS:
+            cut = buffer.rfind(" ", 0, MAX_SENTENCE_CHARS)
+            cut = cut if cut > 0 else MAX_SENTENCE_CHARS
+            sentences.append(buffer[:cut])
+            buffer = buffer[cut:]
+        for sentence in sentences:
+            if sentence.strip():
+                yield sentence.strip()
+    buffer += decoder.decode(b"", final=True)
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def _max_tokens(tokenizer) -> int:
+    # 특수 토큰([CLS], [SEP]) 자리를 뺀 길이, 설정이 없으면 BERT 기본값 512 기준
+    limit = getattr(tokenizer, "model_max_length", 512)
+    return min(limit, 512) - tokenizer.num_special_tokens_to_add()
+
+
+async def iter_tokenized(sentences, tokenizer, batch_size: int = TOKENIZE_BATCH):
+    """
+    문장 스트림 → (문장, 토큰 id 목록) 스트림 — 토큰화는 batch_size 문장씩 스레드 풀에서 (이벤트 루프를 막지 않음)
+
+    tokenizer 는 추론 스레드의 모델과 공유하지 않는, 스레드 간 직렬화된 인스턴스여야 합니다. (get_tokenizer())
+    """
+    batch = []
+
+    async def encode():
+        encoded = await run_in_threadpool(tokenizer, batch, add_special_tokens=False)
+        return list(zip(batch, encoded["input_ids"]))
+
+    async for sentence in sentences:
+        batch.append(sentence)
+        if len(batch) >= batch_size:
+            for pair in await encode():
+                yield pair
+            batch = []
+    if batch:
+        for pair in await encode():
+            yield pair
+
+
+async def iter_windows(sentences, tokenizer, max_tokens: int = None, overlap: int = OVERLAP_TOKENS):
+    """
+    문장 스트림 → 토큰 윈도우 (text, 토큰 수) 스트림
+
+    문장을 max_tokens 까지 이어 붙이고, 다음 윈도우는 직전 윈도우의 마지막 문장들
+    (최대 overlap 토큰)로 시작합니다. max_tokens 보다 긴 문장은 토큰 단위로 잘라 씁니다.
+    """
+    max_tokens = max_tokens or _max_tokens(tokenizer)
+    window     = []            # [(문장, 토큰 수)]
+    n_tokens   = 0
+
+    def emit():
+        return " ".join(s for s, _ in window), n_tokens
+
+    async for sentence, ids in iter_tokenized(sentences, tokenizer):
+
+        if len(ids) > max_tokens:
+            # 아주 긴 문장 : 현재 윈도우를 먼저 내보내고, 문장을 토큰 단위 윈도우로 분할
+            if window:
+                yield emit()
+                window, n_tokens = [], 0
+            step = max_tokens - overlap
+            for start in range(0, len(ids), step):
+                part = ids[start:start + max_tokens]
+                yield await run_in_threadpool(tokenizer.decode, part), len(part)
+                if start + max_tokens >= len(ids):
+                    break
+            continue
+
+        if n_tokens + len(ids) > max_tokens and window:
+            yield emit()
+            # 겹침 : 뒤에서부터 overlap 토큰 이내의 문장만 남김
+            keep, kept = [], 0
+            for s, n in reversed(window):
+                if kept + n > overlap:
+                    break
+                keep.insert(0, (s, n))
+                kept += n
+            window, n_tokens = keep, kept
+
+        window.append((sentence, len(ids)))
+        n_tokens += len(ids)
+
+    if window:
+        yield emit()
+
+
+async def score_document(upload, classifier, detail: bool = False,
+                         batch_size: int = BATCH_SIZE, overlap: int = OVERLAP_TOKENS,
+                         classify_fn=None) -> dict:
+    """
+    업로드 문서 전체의 감성을 윈도우별 점수의 토큰 수 가중 평균으로 계산합니다.
+
+    메모리에는 읽기 블록 1개 + 윈도우 batch_size 개만 유지합니다.
+    detail=True 이면 윈도우별 결과(chunks)도 함께 반환합니다.
+    classify_fn(texts) 를 주면 classifier 대신 사용합니다. (모든 라벨 점수 목록을 반환해야 함)
+    classify_fn 이 async 함수면 그대로 await 하고 (추론 실행기 사용), 아니면 스레드 풀에서 실행합니다.
+    classifier 자리에는 토크나이저만 있는 객체를 넘겨도 됩니다. (classify_fn 을 줄 때)
+    """
+    tokenizer = getattr(classifier, "tokenizer", classifier)
+    if classify_fn is None:
+        def classify_fn(texts):
+            return classifier(texts, top_k=None, truncation=True, batch_size=len(texts))
+
+    totals, total_tokens, n_chunks = {}, 0, 0
+    chunks, preview      = [], ""
+    batch                = []
+
+    async def flush():
+        nonlocal total_tokens, n_chunks
+        texts = [text for text, _ in batch]
+        if inspect.iscoroutinefunction(classify_fn):
+            results = await classify_fn(texts)
+        else:
+            results = await run_in_threadpool(classify_fn, texts)
+        for (text, n), scores in zip(batch, results):
+            for s in scores:
+                totals[s["label"]] = totals.get(s["label"], 0.0) + s["score"] * n
+            total_tokens += n
+            n_chunks     += 1
+            if detail:
+                best = max(scores, key=lambda s: s["score"])
+                chunks.append({
+                    "index"  : n_chunks - 1,
+                    "tokens" : n,
+                    "label"  : best["label"],
+                    "score"  : round(best["score"], 4),
+                    "preview": text[:PREVIEW_CHARS],
+                })
+        batch.clear()
+
+    async for text, n in iter_windows(iter_sentences(upload), tokenizer, overlap=overlap):
+        if not preview:
+            preview = text[:PREVIEW_CHARS]
+        batch.append((text, n))
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+
+    if not total_tokens:
+        return {"label": None, "score": 0.0, "scores": {}, "n_chunks": 0, "preview": ""}
+
+    scores = {label: round(v / total_tokens, 4) for label, v in totals.items()}
+    label  = max(scores, key=scores.get)
+    result = {
+        "label"   : label,
+        "score"   : scores[label],
+        "scores"  : scores,
+        "n_chunks": n_chunks,
+        "tokens"  : total_tokens,
+        "preview" : preview,
+    }
+    if detail:
+        result["chunks"] = chunks
+    return result
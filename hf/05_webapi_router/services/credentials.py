@@ -0,0 +1,247 @@
+# services/credentials.py
+# 로그인용 자격증명 저장소
+#   · 비밀번호는 사용자별 salt + PBKDF2-SHA256 해시로만 보관 (반복 횟수 AUTH_PBKDF2_ITERATIONS 로 조절)
+#   · 비교는 hmac.compare_digest (상수 시간), 없는 사용자도 가짜 해시를 계산해 응답 시간을 맞춤
+#   · 해시는 전용 스레드(AUTH_MAX_HASHING 개)에서 계산 — 대량 로그인 시도에 CPU / 공용 스레드 풀이 잠기지 않도록
+#     대기 줄(AUTH_MAX_QUEUE)까지는 스레드를 잡지 않고 기다리고, 그보다 많으면 바로 거절 (503)
+#   · 로그인 성공 시 세션 토큰 발급 → 이후 요청은 토큰만 확인 (해시 계산 없음)
+#
+# 반복 횟수 정하기 : python -m services.credentials --target-ms 100
+
+import os
+import time
+import asyncio
+import hmac
+import base64
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+ALGORITHM    = "pbkdf2_sha256"
+ITERATIONS   = int(os.getenv("AUTH_PBKDF2_ITERATIONS", "200000"))
+MAX_HASHING  = int(os.getenv("AUTH_MAX_HASHING", "4"))          # 동시에 계산하는 해시 최대 수
+MAX_QUEUE    = int(os.getenv("AUTH_MAX_QUEUE", "16"))           # 해시 차례를 기다리는 로그인 최대 수
+SESSION_TTL  = float(os.getenv("AUTH_SESSION_TTL", "3600"))     # 세션 토큰 유효 시간 (초)
+SESSION_MAX  = int(os.getenv("AUTH_SESSION_MAX", "100000"))     # 보관하는 세션 최대 수
+SALT_BYTES   = 16
+
+
+class TooManyAttempts(Exception):
+    """해시 계산 대기 줄이 가득 참 (잠시 후 재시도)"""
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+def hash_password(password: str, iterations: int = ITERATIONS, salt: bytes = None) -> str:
+    """'pbkdf2_sha256$반복횟수$salt$해시' 형식 문자열"""
+    salt   = salt or secrets.token_bytes(SALT_BYTES)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return f"{ALGORITHM}${iterations}${_b64(salt)}${_b64(digest)}"
+
+
+def check_password(password: str, encoded: str) -> bool:
+    algorithm, iterations, salt, expected = encoded.split("$")
+    if algorithm != ALGORITHM:
+        raise ValueError(f"지원하지 않는 해시 형식입니다: {algorithm}")
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), _unb64(salt), int(iterations))
+    return hmac.compare_digest(digest, _unb64(expected))
+
+
+def needs_rehash(encoded: str, iterations: int = ITERATIONS) -> bool:
+    """저장된 해시의 반복 횟수가 현재 설정과 다르면 True (로그인 성공 시 새 설정으로 다시 저장)"""
+    return int(encoded.split("$")[1]) != iterations
+
+
+class SessionCache:
+    """토큰 → 사용자 (TTL + 최대 개수 LRU), 토큰 자체가 아니라 SHA-256 값을 키로 보관"""
+
+    def __init__(self, ttl: float = SESSION_TTL, maxsize: int = SESSION_MAX):
+        self.ttl      = ttl
+        self.maxsize  = maxsize
+        self._entries = OrderedDict()            # sha256(token) → (username, 만료 시각)
+        self._lock    = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def issue(self, username: str) -> str:
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._entries[self._key(token)] = (username, time.monotonic() + self.ttl)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return token
+
+    def lookup(self, token: str):
+        """유효한 토큰이면 사용자 이름, 아니면 None"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            username, expires = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return username
+
+    def revoke(self, token: str):
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def revoke_user(self, username: str):
+        with self._lock:
+            for key in [k for k, (u, _) in self._entries.items() if u == username]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CredentialStore:
+    def __init__(self, hashes: dict = None, iterations: int = ITERATIONS, max_hashing: int = MAX_HASHING,
+                 max_queue: int = MAX_QUEUE):
+        self.iterations  = iterations
+        self._hashes     = dict(hashes or {})      # 사용자 → 인코딩된 해시
+        self._lock       = threading.Lock()
+        self._executor   = ThreadPoolExecutor(max_workers=max_hashing, thread_name_prefix="auth-hash")
+        self.max_pending = max_hashing + max_queue  # 계산 중 + 대기 중
+        self._pending    = 0
+        # 없는 사용자에게도 같은 비용의 해시를 계산해 응답 시간으로 사용자 존재 여부가 드러나지 않게 함
+        self._dummy      = hash_password(secrets.token_urlsafe(16), iterations)
+        self.sessions    = SessionCache()
+
+        # 지표 (여러 스레드에서 갱신 → _stats_lock)
+        self._stats_lock = threading.Lock()
+        self.verified  = 0
+        self.failed    = 0
+        self.rejected  = 0
+        self.hash_time = 0.0
+        self.wait_time = 0.0
+
+    @classmethod
+    def from_plaintext(cls, users: dict, **kwargs):
+        """{사용자: 평문 비밀번호} → 해시 저장소 (예제 / 테스트용)"""
+        store = cls(**kwargs)
+        for username, password in users.items():
+            store.set_password(username, password)
+        return store
+
+    def _store(self, username: str, password: str):
+        encoded = hash_password(password, self.iterations)
+        with self._lock:
+            self._hashes[username] = encoded
+
+    def set_password(self, username: str, password: str):
+        """비밀번호 변경 — 기존 세션 토큰은 모두 무효화"""
+        self._store(username, password)
+        self.sessions.revoke_user(username)
+
+    def verify(self, username: str, password: str) -> bool:
+        """비밀번호 확인 (PBKDF2 계산, 블로킹) — 사용자가 없어도 같은 시간이 걸립니다."""
+        with self._lock:
+            encoded = self._hashes.get(username)
+        start = time.perf_counter()
+        ok    = check_password(password, encoded or self._dummy) and encoded is not None
+        done  = time.perf_counter()
+
+        if ok and needs_rehash(encoded, self.iterations):
+            self._store(username, password)             # 반복 횟수를 바꾼 뒤 첫 로그인 때 갱신
+        with self._stats_lock:
+            self.hash_time += done - start
+            if ok:
+                self.verified += 1
+            else:
+                self.failed += 1
+        return ok
+
+    def _verify_queued(self, queued: float, username: str, password: str) -> bool:
+        with self._stats_lock:
+            self.wait_time += time.perf_counter() - queued
+        return self.verify(username, password)
+
+    async def averify(self, username: str, password: str) -> bool:
+        """
+        verify() 를 해시 전용 스레드에서 실행 — 기다리는 동안 이벤트 루프 / 공용 스레드 풀을 잡지 않음
+        계산 중 + 대기 중인 요청이 max_pending 이상이면 기다리지 않고 TooManyAttempts
+        """
+        with self._stats_lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise TooManyAttempts()
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._verify_queued,
+                                              time.perf_counter(), username, password)
+        finally:
+            with self._stats_lock:
+                self._pending -= 1
+
+    async def login(self, username: str, password: str):
+        """비밀번호가 맞으면 세션 토큰, 아니면 None"""
+        if not await self.averify(username, password):
+            return None
+        return self.sessions.issue(username)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            verified, failed, rejected = self.verified, self.failed, self.rejected
+            hash_time, wait_time       = self.hash_time, self.wait_time
+            pending                    = self._pending
+        attempts = verified + failed
+        return {
+            "algorithm"   : ALGORITHM,
+            "iterations"  : self.iterations,
+            "users"       : len(self._hashes),
+            "sessions"    : len(self.sessions),
+            "verified"    : verified,
+            "failed"      : failed,
+            "rejected"    : rejected,
+            "pending"     : pending,
+            "max_pending" : self.max_pending,
+            "avg_hash_ms" : round(hash_time / attempts * 1000, 2) if attempts else 0.0,
+            "avg_wait_ms" : round(wait_time / attempts * 1000, 2) if attempts else 0.0,
+        }
+
+
+# ── 반복 횟수 벤치마크 ────────────────────────────────────────────
+
+def time_hash(iterations: int, repeat: int = 5) -> float:
+    """PBKDF2 1회 계산 시간 (ms, 중앙값)"""
+    salt, samples = secrets.token_bytes(SALT_BYTES), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hashlib.pbkdf2_hmac("sha256", b"benchmark-password", salt, iterations)
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)[len(samples) // 2]
+
+
+def calibrate(target_ms: float) -> int:
+    """이 서버에서 해시 1회가 target_ms 정도 걸리는 반복 횟수 (1만 단위로 반올림)"""
+    probe = 100_000
+    per_iteration = time_hash(probe) / probe
+    return max(10_000, int(round(target_ms / per_iteration / 10_000)) * 10_000)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="PBKDF2 반복 횟수 벤치마크")
+    parser.add_argument("--target-ms", type=float, default=100, help="로그인 1회 해시 목표 시간")
+    args = parser.parse_args()
+
+    print(f"{'반복 횟수':>10}  {'해시 ms':>8}  {'코어당 로그인/초':>14}")
+    for iterations in (50_000, 100_000, 200_000, 400_000, 600_000):
+        ms = time_hash(iterations)
+        print(f"{iterations:>10,}  {ms:>8.1f}  {1000 / ms:>14.1f}")
+    print(f"\n목표 {args.target_ms:.0f} ms → AUTH_PBKDF2_ITERATIONS={calibrate(args.target_ms)}  (현재 {ITERATIONS:,})")
@@ -0,0 +1,115 @@
+# services/inference.py
+# 추론 실행기 — 모델 호출을 이벤트 루프 밖(스레드 풀 / 프로세스 풀)에서 실행하고,
+# 대기 중인 작업이 한도를 넘으면 바로 503 으로 거절 (무한히 쌓이며 모든 요청이 느려지는 것을 막음)
+#
+#   SENTIMENT_POOL        : thread (기본) / process
+#   SENTIMENT_WORKERS     : 풀 크기 (기본 1 — torch 는 한 번의 forward 가 이미 여러 코어를 사용)
+#   SENTIMENT_MAX_PENDING : 실행 중 + 대기 중 작업 최대 수 (기본 32)
+#
+# process 풀은 각 워커 프로세스가 모델을 따로 로드합니다 (메모리 × 워커 수).
+# 제출하는 함수는 모듈 최상위 함수여야 합니다 (피클 가능).
+
+import os
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from fastapi import HTTPException
+
+POOL        = os.getenv("SENTIMENT_POOL", "thread")
+WORKERS     = int(os.getenv("SENTIMENT_WORKERS", "1"))
+MAX_PENDING = int(os.getenv("SENTIMENT_MAX_PENDING", "32"))
+RETRY_AFTER = "1"      # 503 응답의 Retry-After (초)
+
+
+def _init_worker():
+    # 프로세스 풀 워커 시작 시 모델 로드 (첫 요청이 로드를 기다리지 않도록)
+    from .model_registry import registry
+    registry.warmup(["sentiment"])
+
+
+def _ping():
+    return os.getpid()
+
+
+class InferenceExecutor:
+    def __init__(self, kind: str = POOL, workers: int = WORKERS, max_pending: int = MAX_PENDING):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"SENTIMENT_POOL 은 thread 또는 process 여야 합니다: {kind}")
+        self.kind        = kind
+        self.workers     = workers
+        self.max_pending = max_pending
+        self.pool        = None
+        self.pending     = 0
+
+        # 지표
+        self.completed = 0
+        self.rejected  = 0
+        self.errors    = 0
+
+    def _create_pool(self):
+        if self.kind == "process":
+            # torch 가 올라간 프로세스를 fork 하면 내부 스레드 락 때문에 멈출 수 있어 spawn 사용
+            return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       mp_context=multiprocessing.get_context("spawn"))
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inference")
+
+    async def start(self):
+        """풀 생성 + 모델 미리 로드 — lifespan 시작 시 호출"""
+        if self.pool is not None:
+            return
+        from .model_registry import registry
+        self.pool = self._create_pool()
+        loop = asyncio.get_running_loop()
+        if self.kind == "process":
+            # 워커 프로세스를 모두 띄워 initializer(모델 로드)를 끝내 둠, 본 프로세스는 토크나이저만 로드
+            await asyncio.gather(*[loop.run_in_executor(self.pool, _ping) for _ in range(self.workers)])
+            await loop.run_in_executor(None, registry.warmup, ["sentiment_tokenizer"])
+        else:
+            await loop.run_in_executor(self.pool, registry.warmup, ["sentiment"])
+            await loop.run_in_executor(None, registry.warmup, ["sentiment_tokenizer"])
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    async def run(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) 를 풀에서 실행 — 대기열이 가득 차면 503"""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="추론 요청이 많아 잠시 후 다시 시도해 주세요",
+                headers={"Retry-After": RETRY_AFTER},
+            )
+        if self.pool is None:                   # lifespan 없이 쓰는 경우 첫 호출 때 생성
+            self.pool = self._create_pool()
+
+        self.pending += 1
+        try:
+            loop   = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.pool, functools.partial(fn, *args, **kwargs))
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        return result
+
+    def metrics(self) -> dict:
+        return {
+            "pool"       : self.kind,
+            "workers"    : self.workers,
+            "pending"    : self.pending,
+            "max_pending": self.max_pending,
+            "completed"  : self.completed,
+            "rejected"   : self.rejected,
+            "errors"     : self.errors,
+        }
+
+
+# 프로세스 공용 실행기 — 추론이 필요한 라우터가 함께 사용
+inference = InferenceExecutor()
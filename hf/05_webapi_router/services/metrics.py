@@ -0,0 +1,213 @@
+# services/metrics.py
+# 요청 지표 수집 — ASGI 미들웨어 + Prometheus 텍스트 형식 /metrics
+#   http_request_duration_seconds   : 라우트별 응답 시간 히스토그램
+#   http_requests_total             : 라우트 · 상태코드별 요청 수
+#   http_requests_in_flight         : 메서드별 처리 중인 요청 수
+#   http_request_size_bytes / http_response_size_bytes : 본문 크기 히스토그램
+#   model_phase_duration_seconds    : 모델 라우트의 단계별 시간 (parse / inference / serialize)
+#
+# 사용 : install_metrics(app)
+# 모델 라우트에서는 핸들러 시작 시 mark_parsed(), 추론은 with phase("inference"): 로 감쌉니다.
+# 지표는 프로세스별로 집계됩니다. (uvicorn --workers N 이면 워커마다 따로)
+
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from starlette.responses import PlainTextResponse
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS    = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+UNMATCHED       = "<unmatched>"      # 없는 경로는 하나로 묶음 (라벨 수가 무한히 늘지 않도록)
+
+# 현재 요청의 단계별 시간 기록 — {"start": ..., "last": ..., "phases": {이름: 초}}
+_current = ContextVar("request_phases", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts  = [0] * len(buckets)
+        self.sum     = 0.0
+        self.count   = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum   += value
+        self.count += 1
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values) -> str:
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}" if pairs else ""
+
+
+class Metrics:
+    def __init__(self):
+        self._lock      = threading.Lock()
+        self.latency    = {}        # (method, route) → Histogram
+        self.req_size   = {}
+        self.resp_size  = {}
+        self.phases     = {}        # (route, phase) → Histogram
+        self.requests   = {}        # (method, route, status) → 횟수
+        self.in_flight  = {}        # method → 처리 중 요청 수
+
+    @staticmethod
+    def _hist(table, key, buckets) -> Histogram:
+        hist = table.get(key)
+        if hist is None:
+            hist = table[key] = Histogram(buckets)
+        return hist
+
+    def begin(self, method):
+        with self._lock:
+            self.in_flight[method] = self.in_flight.get(method, 0) + 1
+
+    def end(self, key, status, seconds, in_bytes, out_bytes, phases):
+        with self._lock:
+            self.in_flight[key[0]] -= 1
+            self.requests[(*key, status)] = self.requests.get((*key, status), 0) + 1
+            self._hist(self.latency, key, LATENCY_BUCKETS).observe(seconds)
+            self._hist(self.req_size, key, SIZE_BUCKETS).observe(in_bytes)
+            self._hist(self.resp_size, key, SIZE_BUCKETS).observe(out_bytes)
+            for name, value in phases.items():
+                self._hist(self.phases, (key[1], name), LATENCY_BUCKETS).observe(value)
+
+    def _render_hist(self, lines, name, help_text, table, label_names):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, hist in sorted(table.items()):
+            cumulative = 0
+            for bound, n in zip(hist.buckets, hist.counts):
+                cumulative += n
+                lines.append(f"{name}_bucket{_labels((*label_names, 'le'), (*key, bound))} {cumulative}")
+            lines.append(f"{name}_bucket{_labels((*label_names, 'le'), (*key, '+Inf'))} {hist.count}")
+            lines.append(f"{name}_sum{_labels(label_names, key)} {hist.sum:.6f}")
+            lines.append(f"{name}_count{_labels(label_names, key)} {hist.count}")
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (exposition format 0.0.4)"""
+        with self._lock:
+            lines = ["# HELP http_requests_total 처리한 요청 수",
+                     "# TYPE http_requests_total counter"]
+            for key, n in sorted(self.requests.items()):
+                lines.append(f"http_requests_total{_labels(('method', 'route', 'status'), key)} {n}")
+            lines += ["# HELP http_requests_in_flight 처리 중인 요청 수",
+                      "# TYPE http_requests_in_flight gauge"]
+            for method, n in sorted(self.in_flight.items()):
+                lines.append(f"http_requests_in_flight{_labels(('method',), (method,))} {n}")
+            self._render_hist(lines, "http_request_duration_seconds", "요청 처리 시간 (초)",
+                              self.latency, ("method", "route"))
+            self._render_hist(lines, "http_request_size_bytes", "요청 본문 크기 (byte)",
+                              self.req_size, ("method", "route"))
+            self._render_hist(lines, "http_response_size_bytes", "응답 본문 크기 (byte)",
+                              self.resp_size, ("method", "route"))
+            self._render_hist(lines, "model_phase_duration_seconds", "모델 라우트 단계별 시간 (초)",
+                              self.phases, ("route", "phase"))
+        return "\n".join(lines) + "\n"
+
+
+# ── 단계별 시간 기록 ─────────────────────────────────────────────
+
+def _record(name, seconds, now):
+    state = _current.get()
+    if state is None:                       # 미들웨어 밖 (테스트 등) 에서는 무시
+        return
+    state["phases"][name] = state["phases"].get(name, 0.0) + seconds
+    state["last"] = now
+
+
+def mark_parsed():
+    """핸들러 시작 시 호출 — 요청 수신부터 여기까지(본문 읽기 + 검증)를 parse 단계로 기록"""
+    state = _current.get()
+    if state is not None:
+        now = time.perf_counter()
+        _record("parse", now - state["start"], now)
+
+
+@contextmanager
+def phase(name: str):
+    """with phase("inference"): ... — 블록 실행 시간을 단계로 기록
+    마지막 단계가 끝난 뒤부터 응답 전송 완료까지는 serialize 단계로 자동 기록됩니다."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        now = time.perf_counter()
+        _record(name, now - start, now)
+
+
+# ── ASGI 미들웨어 ───────────────────────────────────────────────
+
+def _route_path(scope) -> str:
+    # 경로 템플릿 (/items/{item_id}) 으로 집계 — 실제 경로를 쓰면 라벨이 무한히 늘어남
+    # 라우팅이 끝나면 FastAPI 가 scope["route"] 에 매칭된 라우트를 넣어 둠
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED)
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 미들웨어 (BaseHTTPMiddleware 와 달리 StreamingResponse 를 버퍼링하지 않음)
+    응답 시간은 마지막 본문 청크를 보낸 시점까지 잽니다.
+    """
+
+    def __init__(self, app, metrics):
+        self.app     = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        state  = {"start": time.perf_counter(), "last": None, "phases": {}}
+        token  = _current.set(state)
+        sizes  = {"in": 0, "out": 0}
+        status = {"code": 500}
+
+        async def receive_wrapper():
+            message = await receive()
+            if message["type"] == "http.request":
+                sizes["in"] += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            elif message["type"] == "http.response.body":
+                sizes["out"] += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.begin(method)
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            end    = time.perf_counter()
+            phases = state["phases"]
+            if phases:
+                phases["serialize"] = end - state["last"]
+            key = (method, _route_path(scope))
+            self.metrics.end(key, status["code"], end - state["start"], sizes["in"], sizes["out"], phases)
+            _current.reset(token)
+
+
+def install_metrics(app, path: str = "/metrics") -> Metrics:
+    """app 에 지표 미들웨어와 Prometheus 엔드포인트 추가"""
+    metrics = Metrics()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get(path, include_in_schema=False)
+    def prometheus_metrics():
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+    return metrics
@@ -0,0 +1,160 @@
+# services/model_registry.py
+# 모델 레지스트리 — 이름별로 모델을 프로세스당 1번만 로드하고 모든 라우터가 같은 객체를 사용
+#   · 처음 get() 할 때 로드 (lazy) 또는 FastAPI lifespan 에서 warmup() 으로 미리 로드
+#   · 모델별 로드 시간 / 메모리 사용량 기록 → info()
+#   · SENTIMENT_PRELOAD=1 이면 import 시점에 로드
+#     (gunicorn --preload 로 띄우면 마스터에서 1번 로드한 메모리를 fork 한 워커들이 공유)
+
+import os
+import time
+import threading
+
+SENTIMENT_MODEL   = os.getenv("SENTIMENT_MODEL", "snunlp/KR-FinBert-SC")
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "torch")     # torch / int8 / onnx / onnx-int8 (services/backends.py)
+PRELOAD           = os.getenv("SENTIMENT_PRELOAD", "0") == "1"
+
+
+def _rss_bytes():
+    """현재 프로세스 상주 메모리 (byte), 알 수 없으면 None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return None
+
+
+def _param_bytes(model):
+    """transformers pipeline / torch 모델의 파라미터 크기 (byte), 알 수 없으면 None"""
+    module = getattr(model, "model", model)
+    if not hasattr(module, "parameters"):
+        return None
+    try:
+        return sum(p.numel() * p.element_size() for p in module.parameters())
+    except (TypeError, AttributeError):
+        return None
+
+
+def _mb(n):
+    return round(n / 1024 ** 2, 1) if n is not None else None
+
+
+class ModelRegistry:
+    def __init__(self):
+        self._loaders = {}          # 이름 → 로더 함수 () -> 모델
+        self._models  = {}          # 이름 → 로드된 모델
+        self._info    = {}          # 이름 → 로드 시간 / 메모리
+        self._locks   = {}          # 이름 → 로드용 락 (같은 모델을 동시에 두 번 로드하지 않도록)
+        self._meta    = {}          # 이름 → 등록 시 넘긴 부가 정보
+        self._lock    = threading.Lock()
+
+    def register(self, name: str, loader, **meta):
+        """meta : info() 에 함께 보여줄 정보 (예: backend="onnx")"""
+        with self._lock:
+            self._loaders[name] = loader
+            self._meta[name]    = meta
+            self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name: str):
+        """이름으로 모델 조회 — 아직 로드 전이면 이 자리에서 로드"""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        if name not in self._loaders:
+            raise KeyError(f"등록되지 않은 모델입니다: {name}")
+        with self._locks[name]:
+            if name not in self._models:            # 락을 기다리는 동안 다른 스레드가 로드했을 수 있음
+                self._load(name)
+        return self._models[name]
+
+    def _load(self, name: str):
+        rss_before = _rss_bytes()
+        start      = time.perf_counter()
+        model      = self._loaders[name]()
+        seconds    = time.perf_counter() - start
+        rss_after  = _rss_bytes()
+        self._info[name] = {
+            "load_seconds": round(seconds, 3),
+            "rss_delta_mb": _mb(rss_after - rss_before) if rss_before is not None else None,
+            "params_mb"   : _mb(_param_bytes(model)),
+            "loaded_at"   : time.strftime("%Y-%m-%d %H:%M:%S"),
+            "pid"         : os.getpid(),
+        }
+        self._models[name] = model
+
+    def warmup(self, names=None):
+        """등록된 모델(또는 names)을 미리 로드 — lifespan 시작 시 호출"""
+        for name in names or list(self._loaders):
+            self.get(name)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def info(self) -> dict:
+        return {
+            name: {"loaded": name in self._models, **self._meta[name], **self._info.get(name, {})}
+            for name in self._loaders
+        }
+
+
+def _load_sentiment():
+    from .backends import load_sentiment
+    return load_sentiment(SENTIMENT_MODEL, SENTIMENT_BACKEND)
+
+
+class SerializedTokenizer:
+    """
+    토크나이저를 한 번에 한 스레드만 쓰도록 감싼 객체 (__call__ / decode / num_special_tokens_to_add 는 락 안에서)
+
+    Rust fast 토크나이저는 여러 스레드가 동시에 쓰면 'Already borrowed' 오류가 납니다.
+    그 밖의 속성(model_max_length 등)은 원래 토크나이저에서 그대로 읽습니다.
+    """
+
+    def __init__(self, tokenizer):
+        self._tokenizer = tokenizer
+        self._lock      = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            return self._tokenizer(*args, **kwargs)
+
+    def decode(self, *args, **kwargs):
+        with self._lock:
+            return self._tokenizer.decode(*args, **kwargs)
+
+    def num_special_tokens_to_add(self, *args, **kwargs):
+        with self._lock:
+            return self._tokenizer.num_special_tokens_to_add(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._tokenizer, name)
+
+
+def _load_sentiment_tokenizer():
+    from .backends import load_tokenizer
+    return SerializedTokenizer(load_tokenizer(SENTIMENT_MODEL, SENTIMENT_BACKEND))
+
+
+# 프로세스 공용 레지스트리 — 04_main 과 routers/file_upload 가 함께 사용
+registry = ModelRegistry()
+registry.register("sentiment", _load_sentiment, model=SENTIMENT_MODEL, backend=SENTIMENT_BACKEND)
+registry.register("sentiment_tokenizer", _load_sentiment_tokenizer, model=SENTIMENT_MODEL)
+
+
+def get_classifier():
+    """금융뉴스 감성분석 모델 (KR-FinBert-SC)"""
+    return registry.get("sentiment")
+
+
+def get_tokenizer():
+    """감성분석 토크나이저 — 문장 분할 / 길이 정렬용으로 모델과 따로 로드한 인스턴스 (스레드 간 직렬화)
+    추론 스레드가 쓰는 모델 안의 토크나이저와 공유하지 않으므로, 추론 중에도 'Already borrowed' 가 나지 않음"""
+    return registry.get("sentiment_tokenizer")
+
+
+if PRELOAD:
+    registry.warmup()
@@ -0,0 +1,199 @@
+# services/sentiment_cache.py
+# 감성분석 결과 캐시 — 정규화한 텍스트의 해시를 키로 사용
+#   1단계 : 프로세스 메모리 LRU (크기 제한)
+#   2단계 : SQLite 파일 (선택, 서버 재시작 후에도 유지 / 여러 프로세스가 함께 사용)
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import inspect
+import threading
+import unicodedata
+from collections import OrderedDict
+
+from starlette.concurrency import run_in_threadpool
+
+from .model_registry import SENTIMENT_MODEL, SENTIMENT_BACKEND
+
+CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "50000"))
+CACHE_DB   = os.getenv("SENTIMENT_CACHE_DB")          # 예: sentiment_cache.db (없으면 메모리만 사용)
+
+
+def normalize(text: str) -> str:
+    """유니코드 정규화(NFKC) + 앞뒤 공백 제거 + 연속 공백 1칸으로"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class SentimentCache:
+    def __init__(self, maxsize: int = CACHE_SIZE, db_path: str = None, model: str = f"{SENTIMENT_MODEL}@{SENTIMENT_BACKEND}"):
+        self.maxsize = maxsize
+        self.model   = model
+        self.db_path = db_path
+        self._memory  = OrderedDict()
+        self._lock    = threading.Lock()       # 메모리 LRU + 지표
+        self._db_lock = threading.Lock()       # SQLite 연결 — 디스크 I/O 중에도 메모리 조회는 막지 않도록 따로
+        self._db      = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")       # 여러 워커 프로세스 동시 읽기
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+        self.memory_hits = 0
+        self.disk_hits   = 0
+        self.misses      = 0
+
+    def make_key(self, text: str, kind: str = "top1") -> str:
+        # 모델(백엔드 포함)·결과 형식(kind)이 다르면 다른 키
+        raw = f"{self.model}\0{kind}\0{normalize(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _from_memory(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+        return None
+
+    def _from_disk(self, key):
+        """SQLite 조회 (블로킹 I/O) — 없으면 miss 로 집계"""
+        row = None
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute("SELECT value FROM sentiment WHERE key = ?", (key,)).fetchone()
+        with self._lock:
+            if row:
+                value = json.loads(row[0])
+                self._remember(key, value)
+                self.disk_hits += 1
+                return value
+            self.misses += 1
+            return None
+
+    def get(self, text: str, kind: str = "top1"):
+        key   = self.make_key(text, kind)
+        value = self._from_memory(key)
+        return value if value is not None else self._from_disk(key)
+
+    async def aget(self, text: str, kind: str = "top1"):
+        """get() 의 async 버전 — 메모리 LRU 는 바로 확인하고, SQLite 조회만 스레드 풀에서 실행"""
+        key   = self.make_key(text, kind)
+        value = self._from_memory(key)
+        if value is not None:
+            return value
+        if self._db is None:
+            return self._from_disk(key)              # 메모리만 사용 — miss 집계만
+        return await run_in_threadpool(self._from_disk, key)
+
+    def set_many(self, texts, values, kind: str = "top1"):
+        rows = [(self.make_key(t, kind), v) for t, v in zip(texts, values)]
+        with self._lock:
+            for key, value in rows:
+                self._remember(key, value)
+        if self._db is not None:
+            now    = time.time()
+            params = [(key, json.dumps(value, ensure_ascii=False), now) for key, value in rows]
+            with self._db_lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO sentiment (key, value, created) VALUES (?, ?, ?)", params,
+                )
+
+    def set(self, text: str, value, kind: str = "top1"):
+        self.set_many([text], [value], kind)
+
+    def _lookup(self, texts, kind):
+        results = [self.get(t, kind) for t in texts]
+        return results, [i for i, r in enumerate(results) if r is None]
+
+    @staticmethod
+    def _merge(results, missing, computed):
+        for i, r in zip(missing, computed):
+            results[i] = r
+        return results
+
+    def _fill(self, texts, results, missing, computed, kind):
+        self.set_many([texts[i] for i in missing], computed, kind)
+        return self._merge(results, missing, computed)
+
+    async def _offload(self, fn, *args):
+        # SQLite 를 쓰면 조회 / 저장을 스레드 풀에서 (이벤트 루프를 막지 않음), 메모리만이면 바로 실행
+        if self._db is None:
+            return fn(*args)
+        return await run_in_threadpool(fn, *args)
+
+    def wrap(self, classify_fn, kind: str = "top1", store: bool = True):
+        """
+        classify_fn(texts) → 캐시 적용 버전 (classify_fn 이 async 함수면 async 버전)
+
+        캐시에 없는 텍스트만 모아 classify_fn 에 넘기고, 결과를 저장한 뒤 원래 순서로 반환합니다.
+        store=False 면 조회만 (classify_fn 이 이미 storing() 으로 저장하는 경우)
+        """
+        if inspect.iscoroutinefunction(classify_fn):
+            async def cached_async(texts):
+                results, missing = await self._offload(self._lookup, texts, kind)
+                if missing:
+                    computed = await classify_fn([texts[i] for i in missing])
+                    if store:
+                        await self._offload(self._fill, texts, results, missing, computed, kind)
+                    else:
+                        self._merge(results, missing, computed)
+                return results
+            return cached_async
+
+        def cached(texts):
+            results, missing = self._lookup(texts, kind)
+            if missing:
+                computed = classify_fn([texts[i] for i in missing])
+                if store:
+                    self._fill(texts, results, missing, computed, kind)
+                else:
+                    self._merge(results, missing, computed)
+            return results
+        return cached
+
+    def storing(self, classify_fn, kind: str = "top1"):
+        """classify_fn(texts) 결과를 캐시에 저장만 하는 버전 (조회는 호출하는 쪽에서 먼저 한 경우)"""
+        def store(texts):
+            results = classify_fn(texts)
+            self.set_many(texts, results, kind)
+            return results
+        return store
+
+    def stats(self) -> dict:
+        hits  = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        disk_size = None
+        if self._db is not None:
+            with self._db_lock:
+                disk_size = self._db.execute("SELECT COUNT(*) FROM sentiment").fetchone()[0]
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits"  : self.disk_hits,
+            "misses"     : self.misses,
+            "hit_rate"   : round(hits / total, 4) if total else 0.0,
+            "memory_size": len(self._memory),
+            "maxsize"    : self.maxsize,
+            "disk_path"  : self.db_path,
+            "disk_size"  : disk_size,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM sentiment")
+
+
+# 프로세스 공용 캐시 — /sentiment (04_main) 와 /analysis/sentiment (file_upload) 가 함께 사용
+sentiment_cache = SentimentCache(db_path=CACHE_DB)
@@ -1,8 +1,9 @@
 #웹 서비스 구동
+import time
 import streamlit as st
 from search.stock_search import stock_search
 from stock_info.stock_info import Stock as StockInfo
-from report_service.investment_report import investment_report
+from report_service.investment_report import investment_report_stream
 
 class SearchResult:
   def __init__(self, item ):
@@ -27,10 +28,19 @@ search_results = [SearchResult(hit) for hit in hits_list]
 
 selected = st.selectbox('검색 결과 목록', search_results)
 
+page_started = time.perf_counter()
+stock = StockInfo(selected.symbol) #ticker — 기본정보 / 재무제표 4종을 백그라운드에서 동시에 조회 시작
+
 st.header(f'{selected} 기본정보')
-stock = StockInfo(selected.symbol) #ticker
 st.write(stock.get_basic_info()) #기본정보
 st.write(stock.get_financial_statement()) #재무정보
 
 st.header('투자보고서')
-st.write(investment_report(selected.symbol, selected.name, stock))
\ No newline at end of file
+# 토큰이 오는 대로 화면에 출력 (전체 응답을 기다리지 않음)
+report = investment_report_stream(selected.symbol, selected.name, stock, started=page_started)
+st.write_stream(report)
+seconds = lambda value: "—" if value is None else f"{value:.2f}초"   # 응답이 비어 있으면 첫 토큰 없음
+st.caption(
+  f"데이터 조회 {seconds(report.data_seconds)} · 첫 토큰 {seconds(report.ttft)} · 전체 {seconds(report.elapsed)}"
+  + (" · 저장된 보고서" if report.cached else "")
+)
\ No newline at end of file
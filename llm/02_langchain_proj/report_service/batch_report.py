@@ -0,0 +1,266 @@
+# 여러 종목 투자보고서 일괄 생성 — 관심 종목 목록 / nasdaq_screener 섹터 단위로 밤새 돌리는 용도
+#   · 데이터 조회(Stock)와 LLM 호출(investment_report)을 각각 따로 동시 실행 수 제한 (세마포어)
+#   · 일시적 오류(연결 / 타임아웃 / 429 / 5xx)만 지수 백오프(+ 지터)로 재시도, 그 밖의 오류는 바로 실패 처리
+#     실패한 종목은 체크포인트에 남기지 않으므로 다음 실행 때 다시 시도
+#   · 끝난 종목은 checkpoint.jsonl 에 기록 → 중간에 멈춰도 다시 실행하면 이어서 진행
+#   · 보고서는 <출력 폴더>/<심볼>.md, 실행 결과(분당 종목 수 / 단계별 지연)는 summary.json
+#
+# 실행 예 (llm/02_langchain_proj 에서):
+#   python -m report_service.batch_report --watchlist AAPL,MSFT,NVDA
+#   python -m report_service.batch_report --watchlist watchlist.txt --out reports/watch
+#   python -m report_service.batch_report --sector Technology --limit 50 --fetch-concurrency 8 --llm-concurrency 4
+#   REPORT_LLM=fake STOCK_SOURCE=fake python -m report_service.batch_report --sector Energy --limit 20
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from search.local_index import StockIndex
+from stock_info.stock_info import Stock
+from report_service.investment_report import investment_report, safe_name
+
+OUT_DIR           = Path(os.getenv("BATCH_REPORT_DIR", Path(__file__).parent / "reports"))
+FETCH_CONCURRENCY = 8         # 동시에 데이터를 받는 종목 수
+LLM_CONCURRENCY   = 4         # 동시에 진행하는 LLM 호출 수 (API rate limit 에 맞춰 조절)
+RETRIES           = 3         # 첫 시도 이후 재시도 횟수
+BACKOFF           = 1.0       # 첫 재시도 대기(초), 이후 2배씩
+
+
+# ── 대상 종목 ────────────────────────────────────────────────────
+def load_watchlist(value: str) -> list:
+    """쉼표로 구분한 심볼 목록 또는 한 줄에 하나씩 적은 파일 (# 뒤는 주석)"""
+    path = Path(value)
+    if path.is_file():
+        text = "\n".join(line.split("#")[0] for line in path.read_text(encoding="utf-8").splitlines())
+    else:
+        text = value
+    symbols = [s.strip().upper() for s in text.replace(",", "\n").split()]
+    return list(dict.fromkeys(s for s in symbols if s))          # 순서 유지 + 중복 제거
+
+
+def select_targets(index: StockIndex, watchlist: str = None, sector: str = None, limit: int = None) -> list:
+    """[(심볼, 회사명)] — 섹터는 시가총액 큰 순"""
+    if watchlist:
+        targets = []
+        for symbol in load_watchlist(watchlist):
+            i = index.symbols.get(symbol.lower())
+            targets.append((symbol, index.docs[i]["Name"] if i is not None else symbol))
+    else:
+        sector  = sector.strip().lower()
+        targets = [(d["Symbol"], d["Name"]) for d in index.docs
+                   if (d.get("Sector") or "").strip().lower() == sector]
+        if not targets:
+            sectors = sorted({d.get("Sector") for d in index.docs if d.get("Sector")})
+            raise ValueError(f"섹터를 찾을 수 없습니다: {sector!r} (가능한 값: {', '.join(sectors)})")
+    return targets[:limit] if limit else targets
+
+
+# ── 체크포인트 ───────────────────────────────────────────────────
+class Checkpoint:
+    """끝난 종목을 한 줄씩 추가 기록 (jsonl) — 중간에 죽어도 이미 쓴 줄은 남음"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.done = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue                        # 쓰다 만 마지막 줄
+                    self.done[entry["symbol"]] = entry
+        except OSError:
+            pass
+
+    def __contains__(self, symbol):
+        return symbol in self.done
+
+    def add(self, entry: dict):
+        self.done[entry["symbol"]] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def write_report(out_dir: Path, symbol: str, report: str) -> Path:
+    target = out_dir / f"{safe_name(symbol)}.md"
+    tmp    = target.with_suffix(".md.tmp")
+    tmp.write_text(report, encoding="utf-8")
+    tmp.replace(target)
+    return target
+
+
+# ── 실행 ─────────────────────────────────────────────────────────
+# 재시도할 오류 (허용 목록) — requests / httpx / openai / yfinance 를 import 하지 않고 클래스 이름으로 판별
+TRANSIENT_NAMES = {
+    "ConnectionError", "ConnectTimeout", "ReadTimeout", "Timeout", "TimeoutException", "ChunkedEncodingError",
+    "APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError", "YFRateLimitError",
+}
+
+
+def _status_code(e: Exception):
+    code = getattr(e, "status_code", None)
+    if code is None:
+        code = getattr(getattr(e, "response", None), "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_transient(e: Exception) -> bool:
+    """다시 시도하면 풀릴 수 있는 오류만 True — 연결 오류 / 타임아웃 / 429 / 5xx (인증 · 잘못된 요청 · 파일 오류는 False)"""
+    code = _status_code(e)
+    if code is not None:
+        return code == 429 or code >= 500
+    if isinstance(e, (ConnectionError, TimeoutError)):
+        return True
+    return any(cls.__name__ in TRANSIENT_NAMES for cls in type(e).__mro__)
+
+
+async def retry(fn, *args, retries: int = RETRIES, backoff: float = BACKOFF, label: str = ""):
+    """fn(*args) 를 스레드에서 실행, 일시적 오류면 backoff · 2^n (±50% 지터) 만큼 쉬고 다시"""
+    for attempt in range(retries + 1):
+        try:
+            return await asyncio.to_thread(fn, *args)
+        except Exception as e:
+            if attempt == retries or not is_transient(e):
+                raise
+            delay = backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+            print(f"  {label} 실패 ({type(e).__name__}: {e}) — {delay:.1f}초 후 재시도 {attempt + 1}/{retries}",
+                  file=sys.stderr)
+            await asyncio.sleep(delay)
+
+
+def _fetch(symbol: str):
+    stock = Stock(symbol)
+    stock.get_basic_info()                      # 4종 데이터 + 마크다운을 여기서 미리 완성
+    stock.get_financial_statement()
+    return stock
+
+
+class BatchRunner:
+    def __init__(self, out_dir: Path = OUT_DIR, fetch_concurrency: int = FETCH_CONCURRENCY,
+                 llm_concurrency: int = LLM_CONCURRENCY, retries: int = RETRIES, backoff: float = BACKOFF):
+        self.out_dir    = Path(out_dir)
+        self.checkpoint = Checkpoint(self.out_dir / "checkpoint.jsonl")
+        self.fetch_concurrency = fetch_concurrency
+        self.llm_concurrency   = llm_concurrency
+        self.retries    = retries
+        self.backoff    = backoff
+        self.latency    = {"fetch": [], "llm": [], "total": []}   # 성공한 종목의 단계별 소요 시간(초)
+        self.failed     = {}                                       # 심볼 → 마지막 오류
+
+    async def _one(self, symbol: str, company: str):
+        start = time.perf_counter()
+        try:
+            async with self._fetch_sem:
+                t0    = time.perf_counter()
+                stock = await retry(_fetch, symbol, retries=self.retries, backoff=self.backoff,
+                                    label=f"{symbol} 데이터")
+                fetch_s = time.perf_counter() - t0
+            # 데이터 슬롯을 반납한 뒤 LLM 을 기다림 → 다른 종목의 조회가 LLM 대기에 막히지 않음
+            async with self._llm_sem:
+                t0     = time.perf_counter()
+                report = await retry(investment_report, symbol, company, stock, retries=self.retries,
+                                     backoff=self.backoff, label=f"{symbol} 보고서")
+                llm_s  = time.perf_counter() - t0
+            # 저장 / 체크포인트 실패도 이 종목만 실패 처리 (gather 전체를 멈추지 않음)
+            path = write_report(self.out_dir, symbol, report)
+            self.checkpoint.add({"symbol": symbol, "company": company, "file": path.name,
+                                 "fetch_s": round(fetch_s, 3), "llm_s": round(llm_s, 3),
+                                 "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S")})
+        except Exception as e:
+            self.failed[symbol] = f"{type(e).__name__}: {e}"
+            print(f"✗ {symbol} — {self.failed[symbol]}", file=sys.stderr)
+            return
+
+        self.latency["fetch"].append(fetch_s)
+        self.latency["llm"].append(llm_s)
+        self.latency["total"].append(time.perf_counter() - start)
+        print(f"✓ {symbol:<6} 데이터 {fetch_s:6.2f}초  보고서 {llm_s:6.2f}초")
+
+    async def run(self, targets: list) -> dict:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        todo    = [(s, c) for s, c in targets if s not in self.checkpoint]
+        skipped = len(targets) - len(todo)
+        print(f"대상 {len(targets)} 종목 — 완료 {skipped} 건너뜀, {len(todo)} 진행 "
+              f"(데이터 동시 {self.fetch_concurrency}, LLM 동시 {self.llm_concurrency})")
+
+        # to_thread 가 쓰는 기본 스레드 수가 두 제한의 합보다 작으면 세마포어만큼 동시에 돌지 못함
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(self.fetch_concurrency + self.llm_concurrency,
+                                                     thread_name_prefix="batch-report"))
+        self._fetch_sem = asyncio.Semaphore(self.fetch_concurrency)
+        self._llm_sem   = asyncio.Semaphore(self.llm_concurrency)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(self._one(s, c) for s, c in todo))
+        elapsed = time.perf_counter() - start
+
+        summary = self.summary(len(targets), skipped, elapsed)
+        (self.out_dir / "summary.json").write_text(json.dumps(summary, ensure_ascii=False, indent=2),
+                                                   encoding="utf-8")
+        return summary
+
+    def summary(self, total: int, skipped: int, elapsed: float) -> dict:
+        done = len(self.latency["total"])
+        return {
+            "targets"           : total,
+            "skipped"           : skipped,
+            "succeeded"         : done,
+            "failed"            : self.failed,
+            "elapsed_s"         : round(elapsed, 2),
+            "symbols_per_minute": round(done / elapsed * 60, 2) if elapsed else 0.0,
+            "latency"           : {stage: _describe(values) for stage, values in self.latency.items()},
+            "fetch_concurrency" : self.fetch_concurrency,
+            "llm_concurrency"   : self.llm_concurrency,
+        }
+
+
+def _describe(values: list) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        "mean": round(statistics.fmean(ordered), 3),
+        "p50" : round(ordered[len(ordered) // 2], 3),
+        "p95" : round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max" : round(ordered[-1], 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 종목 투자보고서 일괄 생성")
+    group  = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--watchlist", help="AAPL,MSFT,... 또는 한 줄에 심볼 하나씩 적은 파일")
+    group.add_argument("--sector", help="nasdaq_screener CSV 의 Sector 값 (예: Technology)")
+    parser.add_argument("--limit", type=int, help="앞에서부터 N 종목만 (섹터는 시가총액 큰 순)")
+    parser.add_argument("--out", default=OUT_DIR, type=Path, help=f"보고서 폴더 (기본 {OUT_DIR})")
+    parser.add_argument("--fetch-concurrency", type=int, default=FETCH_CONCURRENCY)
+    parser.add_argument("--llm-concurrency", type=int, default=LLM_CONCURRENCY)
+    parser.add_argument("--retries", type=int, default=RETRIES)
+    parser.add_argument("--backoff", type=float, default=BACKOFF)
+    args = parser.parse_args(argv)
+
+    targets = select_targets(StockIndex.load(), args.watchlist, args.sector, args.limit)
+    runner  = BatchRunner(args.out, args.fetch_concurrency, args.llm_concurrency, args.retries, args.backoff)
+    summary = asyncio.run(runner.run(targets))
+
+    print(f"\n성공 {summary['succeeded']} / 실패 {len(summary['failed'])} / 건너뜀 {summary['skipped']} — "
+          f"{summary['elapsed_s']}초, 분당 {summary['symbols_per_minute']} 종목")
+    for stage, stats in summary["latency"].items():
+        if stats:
+            print(f"  {stage:<6} 평균 {stats['mean']:.2f}초  p50 {stats['p50']:.2f}  "
+                  f"p95 {stats['p95']:.2f}  최대 {stats['max']:.2f}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
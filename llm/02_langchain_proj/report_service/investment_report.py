@@ -2,26 +2,56 @@ from dotenv import load_dotenv
 import os
 load_dotenv()
 
-OPENAI_API_KEY = os.environ['OPENAI_API_KEY']
+# REPORT_LLM=fake 이면 API 키 / 네트워크 없이 가짜 LLM 으로 스트리밍 (오프라인 테스트용)
+REPORT_LLM = os.getenv("REPORT_LLM", "openai")
+if REPORT_LLM != "fake":
+  OPENAI_API_KEY = os.environ['OPENAI_API_KEY']
 
 #종목 투자보고서 프롬프트 실행
 
-from langchain_openai import ChatOpenAI
+import re
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+MODEL = "gpt-4o-mini"
+TEMPERATURE = 0.3
+# 생성한 보고서 저장 위치 — 같은 종목 + 같은 기본정보 / 재무제표면 LLM 을 다시 부르지 않음
+REPORT_CACHE_DIR = Path(os.getenv("REPORT_CACHE_DIR", Path(__file__).parent / ".cache"))
 
-def investment_report(symbol, company, stock):
-  prompt = ChatPromptTemplate.from_messages(
-    [
-      ('system', '''
+FAKE_REPORT = """## 투자 보고서 (테스트용 가짜 응답)
+
+### 1. 기업 개요
+기본정보 표를 바탕으로 한 요약이 들어갈 자리입니다.
+
+### 2. 재무 분석
+분기별 매출, 영업이익, 순이익 추이를 설명합니다.
+
+### 3. 투자 의견
+**중립** — 실제 보고서는 REPORT_LLM 설정 없이 실행하세요.
+"""
+
+if REPORT_LLM == "fake":
+  from langchain_core.language_models import FakeListChatModel
+  MODEL = "fake"
+  # 글자 단위로 REPORT_FAKE_DELAY 초 간격으로 흘려보냄
+  llm = FakeListChatModel(responses=[FAKE_REPORT], sleep=float(os.getenv("REPORT_FAKE_DELAY", "0.005")))
+else:
+  from langchain_openai import ChatOpenAI
+  llm = ChatOpenAI(model=MODEL, temperature=TEMPERATURE)
+
+SYSTEM_PROMPT = '''
             Want assistance provided by qualified individuals enabled with experience on understanding charts 
             using technical analysis tools while interpreting macroeconomic environment prevailing across world 
             consequently assisting customers acquire long term advantages requires clear verdicts 
             therefore seeking same through informed predictions written down precisely!
-        '''),
-      ('user', '''
+        '''
+USER_PROMPT = '''
             {company}에 주식을 투자하려고 합니다. 아래의 기본정보, 재무제표를 참고해 마크다운 형식의 투자 보고서를 한글로 작성하세요.
             
             - 기본정보 : 
@@ -29,16 +59,193 @@ def investment_report(symbol, company, stock):
             
             - 재무제표 : 
             {financial_statements}
-       ''')
-    ]
-  )
-  output_parser = StrOutputParser()
-  
-  chain = prompt | llm | output_parser
-  response = chain.invoke({
+       '''
+
+# 프롬프트 / 체인은 모듈 로드 시 1번만 생성
+prompt = ChatPromptTemplate.from_messages(
+  [
+    ('system', SYSTEM_PROMPT),
+    ('user', USER_PROMPT)
+  ]
+)
+output_parser = StrOutputParser()
+chain = prompt | llm | output_parser
+
+logger = logging.getLogger(__name__)
+
+# 진행 중인 보고서 — 키마다 LLM 스트림 1개 (_SharedStream)
+# 블로킹 호출(investment_report)과 스트리밍(ReportStream)이 같은 스트림을 함께 읽으므로 키당 생성은 1번
+_streams = {}
+_streams_lock = threading.Lock()
+
+
+def safe_name(symbol):
+  """파일 이름에 쓸 수 있는 심볼 (BRK/A → BRK_A) — 원래 심볼은 해시에 들어가므로 겹치지 않음"""
+  return re.sub(r"[^0-9A-Za-z._-]", "_", symbol)
+
+
+def report_key(symbol, company, business_info, financial_statements):
+  """종목 + 입력 마크다운 + 모델 / 프롬프트 설정의 해시 (하나라도 바뀌면 새 보고서)"""
+  raw = "\0".join([MODEL, str(TEMPERATURE), SYSTEM_PROMPT, USER_PROMPT,
+                   symbol, company, business_info, financial_statements])
+  return f"{safe_name(symbol)}_{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]}"
+
+
+def _cache_file(key):
+  return REPORT_CACHE_DIR / f"{key}.md"
+
+
+def load_cached_report(key):
+  try:
+    return _cache_file(key).read_text(encoding="utf-8")
+  except OSError:
+    return None
+
+
+def save_report(key, report):
+  """캐시에 저장 — 실패해도 보고서는 그대로 돌려주도록 로그만 남기고 False"""
+  try:
+    REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    target = _cache_file(key)
+    tmp = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(report, encoding="utf-8")
+    tmp.replace(target)          # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 교체
+    return True
+  except OSError:
+    logger.exception("보고서 캐시 저장 실패: %s", key)
+    return False
+
+
+def investment_report(symbol, company, stock):
+  business_info = stock.get_basic_info()
+  financial_statements = stock.get_financial_statement()
+  key = report_key(symbol, company, business_info, financial_statements)
+
+  cached = load_cached_report(key)
+  if cached is not None:
+    return cached
+
+  # 같은 키를 생성 중인 스트림이 있으면 (다른 배치 작업 / 스트리밍 세션) 그 결과를 함께 받음
+  # 실패하면 기다리던 쪽도 같은 오류를 받음 (실패는 캐시하지 않음)
+  return "".join(_shared_stream(key, {
     'company':company,
-    'business_info': stock.get_basic_info(),
-    'financial_statements': stock.get_financial_statement()
-  })
-  
-  return response
\ No newline at end of file
+    'business_info': business_info,
+    'financial_statements': financial_statements
+  }))
+
+
+class _SharedStream:
+  """LLM 스트림 1개를 여러 세션이 함께 읽음 — 받은 조각을 모아 두고, 늦게 온 세션은 처음부터 따라 읽음"""
+
+  def __init__(self):
+    self.chunks = []
+    self.done = False
+    self.error = None
+    self._cond = threading.Condition()
+
+  def put(self, chunk):
+    with self._cond:
+      self.chunks.append(chunk)
+      self._cond.notify_all()
+
+  def close(self, error=None):
+    with self._cond:
+      self.done = True
+      self.error = error
+      self._cond.notify_all()
+
+  def __iter__(self):
+    read = 0
+    while True:
+      with self._cond:
+        while read == len(self.chunks) and not self.done:
+          self._cond.wait()
+        new = self.chunks[read:]
+        done, error = self.done, self.error
+      read += len(new)
+      yield from new
+      if done:
+        if error is not None:
+          raise error
+        return
+
+
+def _drive(key, inputs, stream):
+  # 읽는 세션이 중간에 떠나도 (Streamlit rerun 등) 끝까지 받아 캐시에 저장
+  try:
+    for chunk in chain.stream(inputs):
+      stream.put(chunk)
+  except Exception as e:
+    with _streams_lock:
+      _streams.pop(key, None)
+    stream.close(e)              # 실패는 캐시하지 않음
+    return
+  if stream.chunks:              # 빈 응답은 저장하지 않음
+    save_report(key, "".join(stream.chunks))
+  with _streams_lock:
+    _streams.pop(key, None)
+  stream.close()
+
+
+def _shared_stream(key, inputs):
+  with _streams_lock:
+    stream = _streams.get(key)
+    if stream is None:
+      stream = _streams[key] = _SharedStream()
+      threading.Thread(target=_drive, args=(key, inputs, stream), name=f"report-{key}", daemon=True).start()
+  return stream
+
+
+class ReportStream:
+  """
+  투자 보고서 스트리밍 — for 로 돌거나 st.write_stream(...) 에 넘기면 토큰을 받는 대로 내보냄
+
+  started 에 페이지 시작 시각(time.perf_counter())을 넘기면 데이터 조회부터 첫 토큰까지 잽니다.
+  끝나면 data_seconds(데이터 대기) / ttft(첫 토큰) / elapsed(전체) / cached / text 를 확인할 수 있습니다.
+  캐시에 있는 보고서는 한 번에 내보내고, 같은 보고서를 여러 세션이 동시에 요청하면 LLM 스트림 1개를 함께 읽습니다.
+  """
+
+  def __init__(self, symbol, company, stock, started=None):
+    self.symbol = symbol
+    self.company = company
+    self.stock = stock
+    self.started = started or time.perf_counter()
+    self.data_seconds = None
+    self.ttft = None
+    self.elapsed = None
+    self.cached = False
+    self.text = ""
+
+  def __iter__(self):
+    try:
+      # Stock 은 생성될 때 이미 4종 데이터를 병렬로 요청해 둠 → 여기서는 남은 것만 기다림
+      business_info = self.stock.get_basic_info()
+      financial_statements = self.stock.get_financial_statement()
+      self.data_seconds = time.perf_counter() - self.started
+      key = report_key(self.symbol, self.company, business_info, financial_statements)
+
+      cached = load_cached_report(key)
+      if cached is not None:
+        self.cached = True
+        self.ttft = time.perf_counter() - self.started
+        self.text = cached
+        yield cached
+        return
+
+      parts = []
+      for chunk in _shared_stream(key, {
+        'company': self.company,
+        'business_info': business_info,
+        'financial_statements': financial_statements
+      }):
+        if self.ttft is None:
+          self.ttft = time.perf_counter() - self.started
+        parts.append(chunk)
+        yield chunk
+      self.text = "".join(parts)
+    finally:
+      self.elapsed = time.perf_counter() - self.started
+
+
+def investment_report_stream(symbol, company, stock, started=None):
+  return ReportStream(symbol, company, stock, started)
@@ -0,0 +1,198 @@
+# 종목 검색 로컬 인덱스 — nasdaq_screener CSV 를 프로세스 안에서 바로 검색 (Meilisearch 서버 불필요)
+#   · 접두어 표 : 심볼 / 이름 단어의 접두어(최대 MAX_PREFIX 글자) → 종목 번호 목록 (시가총액 순으로 미리 정렬)
+#                 트라이를 펼쳐 놓은 형태라 조회는 dict 1번
+#   · 오타 허용 : 단어 3-gram 역색인 → 겹치는 3-gram 비율로 후보 점수
+#   · 순위      : 심볼 일치 → 심볼 접두어 → 이름 접두어 → 오타 허용 결과, 같은 단계에서는 시가총액 큰 순
+#   · 만든 인덱스는 pickle 로 저장 → 다음 실행부터 CSV 를 다시 파싱하지 않음 (CSV 가 바뀌면 다시 생성)
+import re
+import csv
+import time
+import pickle
+from pathlib import Path
+from collections import Counter
+
+DATA_DIR   = Path(__file__).resolve().parent.parent
+INDEX_PATH = Path(__file__).resolve().parent / ".index" / "nasdaq.pkl"
+MAX_PREFIX = 10           # 이 길이까지의 접두어만 표에 저장 (더 긴 질의는 앞 MAX_PREFIX 글자로 찾고 다시 확인)
+MIN_FUZZY  = 0.5          # 오타 허용 결과로 인정할 최소 3-gram 일치 비율
+MAX_POSTING = 1500        # 이보다 흔한 3-gram 은 후보 계산에서 제외 (변별력 없음)
+VERSION    = 1
+
+# 이름에 너무 흔해서 오타 허용 검색에 쓰지 않는 단어
+STOP_WORDS = {"common", "stock", "inc", "shares", "a", "class", "ordinary", "corporation", "corp",
+              "holdings", "series", "depositary", "preferred", "of", "limited", "ltd", "share",
+              "representing", "each", "the", "and", "&", "plc", "co", "in"}
+
+TOKEN = re.compile(r"[0-9a-z]+")
+
+
+def _tokens(text: str) -> list:
+    return TOKEN.findall(text.lower())
+
+
+def _trigrams(word: str) -> set:
+    padded = f"_{word}_"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _market_cap(text: str) -> float:
+    try:
+        return float(text or 0)
+    except ValueError:
+        return 0.0
+
+
+def find_csv() -> Path:
+    files = sorted(DATA_DIR.glob("nasdaq_screener_*.csv"))
+    if not files:
+        raise FileNotFoundError(f"{DATA_DIR} 에 nasdaq_screener_*.csv 가 없습니다")
+    return files[-1]
+
+
+class StockIndex:
+    def __init__(self, docs: list):
+        # 시가총액 큰 순으로 번호를 매겨 두면 접두어 목록이 자연히 순위 순이 됨
+        self.docs = sorted(docs, key=lambda d: -_market_cap(d.get("Market Cap")))
+        self.symbols  = {}            # 심볼(소문자) → 번호
+        self.sym_pref = {}            # 심볼 접두어 → [번호]
+        self.name_pref = {}           # 이름 단어 접두어 → [번호]
+        self.grams    = {}            # 3-gram → [번호]
+        self.words    = []            # 번호 → 이름 단어 목록 (MAX_PREFIX 보다 긴 질의 확인용)
+
+        for i, doc in enumerate(self.docs):
+            symbol = doc["Symbol"].strip().lower()
+            words  = _tokens(doc["Name"])
+            self.symbols.setdefault(symbol, i)
+            self.words.append(words)
+            for n in range(1, min(len(symbol), MAX_PREFIX) + 1):
+                self.sym_pref.setdefault(symbol[:n], []).append(i)
+            for word in set(words):
+                for n in range(1, min(len(word), MAX_PREFIX) + 1):
+                    lst = self.name_pref.setdefault(word[:n], [])
+                    if not lst or lst[-1] != i:
+                        lst.append(i)
+            grams = _trigrams(symbol)
+            for word in words:
+                if word not in STOP_WORDS:
+                    grams |= _trigrams(word)
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(i)
+
+    # ── 저장 / 불러오기 ──────────────────────────────────────────
+    @staticmethod
+    def _stamp(csv_path: Path) -> tuple:
+        stat = csv_path.stat()
+        return (VERSION, csv_path.name, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def from_csv(cls, csv_path: Path):
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            return cls([{k: (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
+                        for row in csv.DictReader(f)])
+
+    @classmethod
+    def load(cls, csv_path: Path = None, index_path: Path = INDEX_PATH):
+        """저장된 인덱스가 같은 CSV 로 만든 것이면 그대로, 아니면 CSV 로 새로 만들어 저장"""
+        csv_path = Path(csv_path) if csv_path else find_csv()
+        stamp    = cls._stamp(csv_path)
+        try:
+            with open(index_path, "rb") as f:
+                saved_stamp, index = pickle.load(f)
+            if saved_stamp == stamp:
+                return index
+        except (OSError, pickle.PickleError, EOFError, ValueError, AttributeError):
+            pass
+        index = cls.from_csv(csv_path)
+        index.save(stamp, index_path)
+        return index
+
+    def save(self, stamp, index_path: Path = INDEX_PATH):
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((stamp, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(index_path)
+
+    # ── 검색 ─────────────────────────────────────────────────────
+    def _name_matches(self, token: str) -> list:
+        ids = self.name_pref.get(token[:MAX_PREFIX], [])
+        if len(token) > MAX_PREFIX:
+            ids = [i for i in ids if any(w.startswith(token) for w in self.words[i])]
+        return ids
+
+    def _prefix_ids(self, tokens: list, limit: int) -> list:
+        """모든 질의 단어가 (심볼 또는) 이름 단어의 접두어인 종목 — 순위 순"""
+        found, seen = [], set()
+
+        def add(ids):
+            for i in ids:
+                if i not in seen:
+                    seen.add(i)
+                    found.append(i)
+                    if len(found) >= limit:
+                        return True
+            return False
+
+        query = "".join(tokens)
+        if query in self.symbols and add([self.symbols[query]]):
+            return found
+        if len(tokens) == 1 and add(self.sym_pref.get(query[:MAX_PREFIX], [])):
+            return found
+
+        # 첫 단어 후보를 순위 순으로 돌며 나머지 단어도 모두 맞는지 확인
+        rest = [set(self._name_matches(t)) for t in tokens[1:]]
+        for i in self._name_matches(tokens[0]):
+            if i not in seen and all(i in r for r in rest):
+                seen.add(i)
+                found.append(i)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def _fuzzy_ids(self, tokens: list, exclude: set, limit: int) -> list:
+        grams = set()
+        for t in tokens:
+            grams |= _trigrams(t)
+        counts = Counter()
+        for gram in grams:
+            posting = self.grams.get(gram, ())
+            if len(posting) <= MAX_POSTING:
+                counts.update(posting)
+        need   = max(1, int(len(grams) * MIN_FUZZY + 0.999))
+        scored = [(-n, i) for i, n in counts.items() if n >= need and i not in exclude]
+        scored.sort()                                  # 일치 개수 많은 순 → 번호(시가총액) 순
+        return [i for _, i in scored[:limit]]
+
+    def search(self, query: str, limit: int = 20) -> dict:
+        """Meilisearch 검색 응답과 같은 형태 {'hits': [...], ...}"""
+        start  = time.perf_counter()
+        tokens = _tokens(query)
+        if not tokens:
+            ids = list(range(min(limit, len(self.docs))))
+        else:
+            ids = self._prefix_ids(tokens, limit)
+            if len(ids) < limit:
+                ids += self._fuzzy_ids(tokens, set(ids), limit - len(ids))
+        return {
+            "hits"              : [self.docs[i] for i in ids],
+            "query"             : query,
+            "processingTimeMs"  : round((time.perf_counter() - start) * 1000, 3),
+            "limit"             : limit,
+            "offset"            : 0,
+            "estimatedTotalHits": len(ids),
+        }
+
+
+if __name__ == "__main__":
+    # 인덱스 생성 + 검색 속도 확인 : python -m search.local_index apple nvda "micro soft" aple
+    import sys
+    t0    = time.perf_counter()
+    index = StockIndex.load()
+    print(f"인덱스 로드 {(time.perf_counter() - t0) * 1000:.1f} ms  ({len(index.docs):,} 종목)")
+    for q in sys.argv[1:] or ["apple", "nvda", "micro soft", "aple", "tesla"]:
+        n, t0 = 1000, time.perf_counter()
+        for _ in range(n):
+            result = index.search(q)
+        us = (time.perf_counter() - t0) / n * 1e6
+        print(f"{q!r:>14} {us:>8.1f} µs  " + ", ".join(h["Symbol"] for h in result["hits"][:5]))
@@ -1,11 +1,24 @@
-import meilisearch
-import json
+# 종목 검색 — 기본은 프로세스 안의 로컬 인덱스 (search/local_index.py)
+# STOCK_SEARCH_BACKEND=meilisearch 로 바꾸면 기존처럼 Meilisearch 서버(localhost:7700)의 nasdaq 인덱스 사용
 import os
 from dotenv import load_dotenv
 load_dotenv()
-search_key = os.getenv("MIELIE_SEARCH_KEY")
 
-client = meilisearch.Client('http://localhost:7700', search_key)
+BACKEND = os.getenv("STOCK_SEARCH_BACKEND", "local")
 
-def stock_search(query):
-  return client.index('nasdaq').search(query)
\ No newline at end of file
+if BACKEND == "meilisearch":
+  import meilisearch
+  search_key = os.getenv("MIELIE_SEARCH_KEY")
+  client = meilisearch.Client('http://localhost:7700', search_key)
+
+  def stock_search(query):
+    return client.index('nasdaq').search(query)
+
+else:
+  from search.local_index import StockIndex
+
+  # 저장된 인덱스를 읽어 옴 (없거나 CSV 가 바뀌었으면 새로 만들어 저장)
+  index = StockIndex.load()
+
+  def stock_search(query, limit=20):
+    return index.search(query, limit)
@@ -0,0 +1,81 @@
+# 종목 데이터 캐시 — 메모리(LRU, 최대 STOCK_CACHE_MAX 개) + 디스크(pickle), (소스, 심볼, 종류)별 TTL
+# Streamlit 이 다시 실행되거나 서버를 재시작해도 TTL 안에서는 yfinance 를 다시 부르지 않습니다.
+import os
+import time
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+CACHE_DIR = Path(os.getenv("STOCK_CACHE_DIR", Path(__file__).parent / ".cache"))
+CACHE_TTL = float(os.getenv("STOCK_CACHE_TTL", str(6 * 3600)))     # 초 (재무제표는 분기 단위라 길게)
+CACHE_MAX = int(os.getenv("STOCK_CACHE_MAX", "2000"))               # 메모리에 두는 항목 수 (종목당 4개)
+
+
+class StockCache:
+    def __init__(self, path=CACHE_DIR, ttl: float = CACHE_TTL, maxsize: int = CACHE_MAX):
+        self.path    = Path(path) if path else None       # None 이면 메모리만 사용
+        self.ttl     = ttl
+        self.maxsize = maxsize
+        self._memory = OrderedDict()                      # key → (저장 시각, 값), 오래 안 쓴 순
+        self._lock   = threading.Lock()
+        self.hits    = 0
+        self.misses  = 0
+
+    def _file(self, key) -> Path:
+        name = hashlib.sha1("\0".join(key).encode("utf-8")).hexdigest()
+        return self.path / f"{name}.pkl"
+
+    def get(self, key):
+        """TTL 안의 값이면 반환, 없거나 만료면 None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None and self.path is not None:
+            try:
+                with open(self._file(key), "rb") as f:
+                    entry = pickle.load(f)
+            except (OSError, pickle.PickleError, EOFError):
+                entry = None
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None or now - entry[0] > self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value):
+        entry = (time.time(), value)
+        self._remember(key, entry)
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체 → 다른 프로세스가 반쯤 쓴 파일을 읽지 않음
+            target = self._file(key)
+            tmp    = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, target)
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:       # 밀려난 항목은 디스크에서 다시 읽음
+                self._memory.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.path is not None and self.path.exists():
+            for file in self.path.glob("*.pkl"):
+                file.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "memory_size": len(self._memory), "memory_max": self.maxsize, "path": str(self.path) if self.path else None}
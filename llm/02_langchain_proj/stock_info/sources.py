@@ -0,0 +1,66 @@
+# 종목 데이터 소스 — yfinance (기본) / 가짜 데이터 (오프라인 테스트용)
+# STOCK_SOURCE=fake 로 바꾸면 네트워크 없이 항상 같은 값을 돌려줍니다.
+import os
+import time
+import zlib
+import pandas as pd
+
+# Stock 이 요청하는 데이터 4종
+KINDS = ("info", "income", "balance", "cash_flow")
+
+
+class YFinanceSource:
+    name = "yfinance"
+
+    def fetch(self, symbol: str, kind: str):
+        import yfinance as yf
+        ticker = yf.Ticker(symbol)
+        if kind == "info":
+            return ticker.info
+        if kind == "income":
+            return ticker.quarterly_income_stmt
+        if kind == "balance":
+            return ticker.quarterly_balance_sheet
+        if kind == "cash_flow":
+            return ticker.quarterly_cash_flow
+        raise ValueError(f"알 수 없는 데이터 종류: {kind}")
+
+
+class FakeSource:
+    """심볼마다 항상 같은 값을 만드는 가짜 소스 (yfinance 와 같은 행 이름 / 분기 컬럼)"""
+    name = "fake"
+
+    ROWS = {
+        "income"   : ["Total Revenue", "Gross Profit", "Operating Income", "Net Income"],
+        "balance"  : ["Total Assets", "Total Liabilities Net Minority Interest", "Stockholders Equity"],
+        "cash_flow": ["Operating Cash Flow", "Investing Cash Flow", "Financing Cash Flow"],
+    }
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay          # 네트워크 지연 흉내 (초)
+        self.calls = []             # (symbol, kind) 호출 기록 — 캐시 / 병렬 확인용
+
+    def fetch(self, symbol: str, kind: str):
+        self.calls.append((symbol, kind))
+        if self.delay:
+            time.sleep(self.delay)
+        seed = zlib.crc32(symbol.encode("utf-8"))
+        if kind == "info":
+            return {
+                "longName"         : f"{symbol} Corporation",
+                "industry"         : "Software",
+                "sector"           : "Technology",
+                "marketCap"        : (seed % 1000 + 1) * 10 ** 9,
+                "sharesOutstanding": (seed % 100 + 1) * 10 ** 7,
+            }
+        if kind not in self.ROWS:
+            raise ValueError(f"알 수 없는 데이터 종류: {kind}")
+        quarters = pd.date_range("2024-03-31", periods=4, freq="QE")[::-1]
+        rows     = self.ROWS[kind]
+        values   = [[float((seed >> (i + j)) % 1000 * 10 ** 6) for j in range(len(quarters))]
+                    for i in range(len(rows))]
+        return pd.DataFrame(values, index=rows, columns=quarters)
+
+
+def default_source():
+    return FakeSource() if os.getenv("STOCK_SOURCE", "yfinance") == "fake" else YFinanceSource()
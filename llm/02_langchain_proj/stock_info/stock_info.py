@@ -1,29 +1,83 @@
 # 종목 기본정보 스크래핑
-import yfinance as yf, pandas as pd
+# 기본정보 / 분기 손익계산서 / 재무상태표 / 현금흐름표 4종을 동시에 요청하고,
+# 결과는 심볼별로 캐시(메모리 + 디스크, TTL)에 저장해 다시 그릴 때 재사용
+import threading
+import pandas as pd
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from stock_info.cache import StockCache
+from stock_info.sources import KINDS, default_source
+
+# 프로세스 공용 — 여러 Stock 이 같은 캐시 / 요청 스레드를 사용
+_cache = StockCache()
+_pool  = ThreadPoolExecutor(max_workers=8, thread_name_prefix="stock-fetch")
+_inflight      = {}          # 진행 중인 요청 — 같은 데이터를 동시에 두 번 받지 않도록 Future 공유
+_inflight_lock = threading.Lock()
+
+
+def _quarterly(df: pd.DataFrame, rows: list) -> pd.DataFrame:
+    return df.loc[rows].rename_axis('항목').rename(columns=lambda x: x.strftime("%Y-%m-%d"))
+
 
 class Stock:
-    def __init__(self, symbol: str):
-        self.ticker = yf.Ticker(symbol)
+    def __init__(self, symbol: str, source=None, cache: StockCache = None):
+        self.symbol = symbol
+        self.source = source or default_source()
+        self.cache  = cache or _cache
+        self._text  = {}
+        # 캐시에 없는 데이터만 바로 병렬로 요청해 둠 (첫 get_* 호출 때 기다림)
+        self._data  = {kind: self._start(kind) for kind in KINDS}
+
+    def _key(self, kind):
+        return (self.source.name, self.symbol, kind)
+
+    def _start(self, kind):
+        key   = self._key(kind)
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+        with _inflight_lock:
+            future = _inflight.get(key)
+            if future is None:
+                future = _inflight[key] = _pool.submit(self._fetch, kind)
+        return future
+
+    def _fetch(self, kind):
+        key = self._key(kind)
+        try:
+            value = self.source.fetch(self.symbol, kind)
+            self.cache.set(key, value)             # 실패(예외)한 요청은 캐시하지 않음
+            return value
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def _get(self, kind):
+        value = self._data[kind]
+        if isinstance(value, Future):               # 아직 요청 중이면 결과 대기
+            value = self._data[kind] = value.result()
+        return value
 
     def get_basic_info(self) -> str:
-        df = pd.DataFrame.from_dict(self.ticker.info, orient='index', columns=['Value'])
-        df = df.loc[['longName','industry','sector','marketCap','sharesOutstanding']]
-        df = df.rename_axis('항목')
-        return df.to_markdown()
+        if "basic" not in self._text:
+            df = pd.DataFrame.from_dict(self._get("info"), orient='index', columns=['Value'])
+            df = df.loc[['longName','industry','sector','marketCap','sharesOutstanding']]
+            df = df.rename_axis('항목')
+            self._text["basic"] = df.to_markdown()
+        return self._text["basic"]
 
     def get_financial_statement(self) -> str:
-        inc = self.ticker.quarterly_income_stmt.loc[
-            ['Total Revenue','Gross Profit','Operating Income','Net Income']
-        ].rename_axis('항목').rename(columns=lambda x: x.strftime("%Y-%m-%d"))
-        bal = self.ticker.quarterly_balance_sheet.loc[
-            ['Total Assets','Total Liabilities Net Minority Interest','Stockholders Equity']
-        ].rename_axis('항목').rename(columns=lambda x: x.strftime("%Y-%m-%d"))
-        cfs = self.ticker.quarterly_cash_flow.loc[
-            ['Operating Cash Flow','Investing Cash Flow','Financing Cash Flow']
-        ].rename_axis('항목').rename(columns=lambda x: x.strftime("%Y-%m-%d"))
-
-        return (
-            "### Quarterly Income Statement\n" + inc.to_markdown() + "\n\n" +
-            "### Quarterly Balance Sheet\n"  + bal.to_markdown() + "\n\n" +
-            "### Quarterly Cash Flow\n"      + cfs.to_markdown()
-        )
\ No newline at end of file
+        if "financial" not in self._text:
+            inc = _quarterly(self._get("income"),
+                             ['Total Revenue','Gross Profit','Operating Income','Net Income'])
+            bal = _quarterly(self._get("balance"),
+                             ['Total Assets','Total Liabilities Net Minority Interest','Stockholders Equity'])
+            cfs = _quarterly(self._get("cash_flow"),
+                             ['Operating Cash Flow','Investing Cash Flow','Financing Cash Flow'])
+
+            self._text["financial"] = (
+                "### Quarterly Income Statement\n" + inc.to_markdown() + "\n\n" +
+                "### Quarterly Balance Sheet\n"  + bal.to_markdown() + "\n\n" +
+                "### Quarterly Cash Flow\n"      + cfs.to_markdown()
+            )
+        return self._text["financial"]
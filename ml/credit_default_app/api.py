@@ -0,0 +1,181 @@
+"""
+api.py — 신용카드 채무불이행 예측 FastAPI 서비스
+실행 : uvicorn api:app --port 8002
+
+동시에 들어온 요청을 최대 MAX_WAIT_MS 동안(또는 MAX_BATCH 건까지) 모아
+predict_batch 1회로 한꺼번에 추론합니다. (마이크로 배칭)
+"""
+
+import os
+import time
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, FastAPI
+from pydantic import BaseModel, Field
+
+from predict import FEATURE_COLS, RISK_LEVELS, load_engine, load_pipeline, predict_batch
+
+MAX_BATCH   = int(os.getenv("CREDIT_MAX_BATCH", "64"))
+MAX_WAIT_MS = float(os.getenv("CREDIT_MAX_WAIT_MS", "5"))
+
+# 위험등급 → 아이콘 / 권장조치 (get_risk 와 같은 표 사용)
+_RISK_INFO = {level: (icon, action) for _, level, icon, action, _ in RISK_LEVELS}
+
+
+# ── 마이크로 배처 ─────────────────────────────────────────────────
+class MicroBatcher:
+    """요청을 큐에 모아 배치 단위로 predict_batch 를 실행하는 백그라운드 작업"""
+
+    def __init__(self, max_batch: int = MAX_BATCH, max_wait_ms: float = MAX_WAIT_MS):
+        self.max_batch = max_batch
+        self.max_wait  = max_wait_ms / 1000
+        self.queue     = None
+        self.task      = None
+        self.batches   = 0
+        self.items     = 0
+        self.max_seen  = 0
+
+    async def start(self):
+        self.queue = asyncio.Queue()
+        self.task  = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, row: dict):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((row, future))
+        return await future
+
+    async def _collect(self) -> list:
+        """첫 요청 도착 후 max_wait 동안 또는 max_batch 건이 찰 때까지 수집"""
+        loop     = asyncio.get_running_loop()
+        batch    = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            rows  = [row for row, _ in batch]
+            try:
+                # 추론은 스레드에서 실행 → 그동안 이벤트 루프는 다음 요청을 계속 큐에 쌓음
+                result = await loop.run_in_executor(None, predict_batch, rows)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.items   += len(batch)
+            self.max_seen = max(self.max_seen, len(batch))
+            for (_, future), rec in zip(batch, result.itertuples(index=False)):
+                if not future.done():
+                    future.set_result(rec)
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth"   : self.queue.qsize() if self.queue else 0,
+            "batches"       : self.batches,
+            "items"         : self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_seen,
+            "max_batch"     : self.max_batch,
+            "max_wait_ms"   : self.max_wait * 1000,
+        }
+
+
+batcher = MicroBatcher()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 서버 시작 시 모델을 미리 로드 (첫 요청 지연 방지)
+    if load_engine() is None:
+        load_pipeline()
+    await batcher.start()
+    yield
+    await batcher.stop()
+
+
+# ── 요청 / 응답 모델 ──────────────────────────────────────────────
+class CreditRequest(BaseModel):
+    LIMIT_BAL: float = Field(ge=10_000, le=1_000_000, description="신용한도 (NTD)")
+    SEX:       int   = Field(ge=1, le=2)
+    EDUCATION: int   = Field(ge=1, le=4)
+    MARRIAGE:  int   = Field(ge=1, le=3)
+    AGE:       int   = Field(ge=18, le=100)
+    PAY_0: int = Field(ge=-2, le=8)
+    PAY_2: int = Field(ge=-2, le=8)
+    PAY_3: int = Field(ge=-2, le=8)
+    PAY_4: int = Field(ge=-2, le=8)
+    PAY_5: int = Field(ge=-2, le=8)
+    PAY_6: int = Field(ge=-2, le=8)
+    BILL_AMT1: float
+    BILL_AMT2: float
+    BILL_AMT3: float
+    BILL_AMT4: float
+    BILL_AMT5: float
+    BILL_AMT6: float
+    PAY_AMT1: float = Field(ge=0)
+    PAY_AMT2: float = Field(ge=0)
+    PAY_AMT3: float = Field(ge=0)
+    PAY_AMT4: float = Field(ge=0)
+    PAY_AMT5: float = Field(ge=0)
+    PAY_AMT6: float = Field(ge=0)
+
+
+class CreditResponse(BaseModel):
+    prob:   float
+    label:  int
+    level:  str
+    icon:   str
+    action: str
+    latency_ms: float
+
+
+# ── 라우터 ────────────────────────────────────────────────────────
+router = APIRouter(prefix="/credit", tags=["채무불이행 예측"])
+
+
+@router.post("/score", response_model=CreditResponse)
+async def score(request: CreditRequest):
+    start = time.perf_counter()
+    rec   = await batcher.submit(request.model_dump(include=set(FEATURE_COLS)))
+    icon, action = _RISK_INFO[rec.level]
+    return CreditResponse(
+        prob=round(float(rec.prob), 4),
+        label=int(rec.label),
+        level=rec.level,
+        icon=icon,
+        action=action,
+        latency_ms=round((time.perf_counter() - start) * 1000, 3),
+    )
+
+
+@router.get("/stats")
+def stats():
+    return batcher.stats()
+
+
+app = FastAPI(title="신용카드 채무불이행 예측 서비스", lifespan=lifespan)
+app.include_router(router)
@@ -4,7 +4,7 @@ app.py — 신용카드 채무불이행 예측 Streamlit 웹 서비스
 """
 
 import streamlit as st
-from predict import predict
+from predict import predict_cached
 
 # ── 페이지 기본 설정 ──────────────────────────────────────────────
 st.set_page_config(
@@ -107,7 +107,7 @@ if btn:
     }
 
     with st.spinner("예측 중..."):
-        result = predict(input_data)
+        result = predict_cached(input_data)     # 같은 입력 재예측 시 캐시 결과 반환
 
     # ── 결과 출력 ─────────────────────────────────────────────────
     st.subheader("📊 예측 결과")
@@ -3,9 +3,12 @@ app1.py — 신용카드 연체확률 예측 Streamlit 웹 서비스 (UI 개선)
 실행 : conda activate ml_edu  →  streamlit run app1.py
 """
 
+import time
+import altair as alt
+import numpy as np
 import streamlit as st
 import pandas as pd
-from predict import load_pipeline, get_risk, FEATURE_COLS
+from predict import MODEL_PATH, load_engine, load_pipeline, get_risk, predict_cached, sweep, FEATURE_COLS
 
 # ── 페이지 설정 ───────────────────────────────────────────────────
 st.set_page_config(
@@ -59,14 +62,14 @@ st.markdown("""
 
 # ── EX-01 : 모델 로드 ─────────────────────────────────────────────
 @st.cache_resource
-def get_pipeline():
-    try:
-        return load_pipeline()
-    except FileNotFoundError:
+def get_model():
+    """고속 엔진(mmap)이 있으면 엔진만 로드 — 그때는 pipeline.pkl 의 전체 forest 를 unpickle 하지 않음"""
+    if not MODEL_PATH.exists():
         return None
+    return load_engine() or load_pipeline()
 
-pipeline = get_pipeline()
-if pipeline is None:
+model = get_model()
+if model is None:
     st.error("⛔ 모델 파일을 찾을 수 없습니다. `models/pipeline.pkl` 경로를 확인해주세요.")
     st.stop()
 
@@ -185,8 +188,9 @@ btn = st.button("🔍  예측하기", type="primary", use_container_width=True,
 if btn:
     try:
         with st.spinner("예측 중..."):
-            df   = pd.DataFrame([input_data], columns=FEATURE_COLS)
-            prob = float(pipeline.predict_proba(df)[0][1])
+            # 같은 고객 정보로 다시 누르면 캐시 결과를 바로 반환 (pipeline.pkl 변경 시 자동 무효화)
+            # 등급은 반올림 전 확률로 판정, 반올림은 아래 화면 표시에서만
+            prob = predict_cached(input_data)["prob"]
 
         # EX-04 : 예측값 범위 검사
         if not (0.0 <= prob <= 1.0):
@@ -243,6 +247,75 @@ if btn:
             ])
             st.dataframe(summary_df, use_container_width=True, hide_index=True)
 
+        cache = predict_cached.stats()
+        st.caption(f"예측 캐시 — 적중 {cache['hits']:,} / 미적중 {cache['misses']:,} "
+                   f"(적중률 {cache['hit_rate'] * 100:.0f}%, 저장 {cache['size']:,}건)")
+
     # EX-05 : 모델 추론 오류
     except Exception as e:
         st.error(f"❌ 서비스 오류가 발생했습니다: {e}")
+
+
+# ═══════════════════════════════════════════════════════════════
+# What-if 민감도 분석 — 피처 1~2개를 바꿔 가며 한 번에 배치 예측
+# ═══════════════════════════════════════════════════════════════
+# 피처별 탐색 범위 (위 입력 위젯의 허용 범위와 동일)
+SWEEP_RANGES = {
+    'LIMIT_BAL': (10_000, 1_000_000), 'AGE': (18, 100),
+    'SEX': [1, 2], 'EDUCATION': [1, 2, 3, 4], 'MARRIAGE': [1, 2, 3],
+    **{c: PAY_OPTS for c in ['PAY_0', 'PAY_2', 'PAY_3', 'PAY_4', 'PAY_5', 'PAY_6']},
+    **{c: (0, 10_000_000) for c in FEATURE_COLS if c.startswith(('BILL_AMT', 'PAY_AMT'))},
+}
+
+def sweep_values(feature: str, n_points: int):
+    """범주형은 전체 값, 연속형은 (최소, 최대) 구간을 n_points 개로 등분"""
+    rng = SWEEP_RANGES[feature]
+    if isinstance(rng, list):
+        return rng
+    return np.unique(np.round(np.linspace(rng[0], rng[1], n_points)))
+
+st.divider()
+with st.expander("🔬 What-if 민감도 분석", expanded=False):
+    st.caption("현재 입력한 고객에서 선택한 피처만 바꿔 가며 연체확률 변화를 한 번에 계산합니다.")
+    s1, s2, s3 = st.columns([1, 1, 1])
+    with s1:
+        feat_x = st.selectbox("피처 1 (X축)", FEATURE_COLS, index=FEATURE_COLS.index('PAY_0'))
+    with s2:
+        feat_y = st.selectbox("피처 2 (히트맵, 선택)", ["없음"] + [c for c in FEATURE_COLS if c != feat_x])
+    with s3:
+        n_points = st.slider("연속형 피처 격자 수", min_value=10, max_value=100, value=50, step=5)
+
+    if st.button("📈 민감도 분석 실행", disabled=len(val_errors) > 0):
+        grid = {feat_x: sweep_values(feat_x, n_points)}
+        if feat_y != "없음":
+            grid[feat_y] = sweep_values(feat_y, n_points)
+
+        try:
+            start  = time.perf_counter()
+            result = sweep(input_data, grid)
+            elapsed = time.perf_counter() - start
+        except Exception as e:
+            st.error(f"❌ 민감도 분석 중 오류가 발생했습니다: {e}")
+            st.stop()
+
+        st.caption(f"{len(result):,}개 조합 예측  |  {elapsed * 1000:.0f} ms")
+
+        if feat_y == "없음":
+            line = alt.Chart(result).mark_line(point=True).encode(
+                x=alt.X(f"{feat_x}:Q", title=feat_x),
+                y=alt.Y("prob:Q", title="연체확률", scale=alt.Scale(domain=[0, 1])),
+                tooltip=[feat_x, alt.Tooltip("prob:Q", format=".3f"), "level"],
+            )
+            # 현재 입력값 위치 표시
+            current = alt.Chart(pd.DataFrame({feat_x: [input_data[feat_x]]})).mark_rule(
+                color="red", strokeDash=[4, 4]).encode(x=f"{feat_x}:Q")
+            st.altair_chart(line + current, use_container_width=True)
+        else:
+            heat = alt.Chart(result).mark_rect().encode(
+                x=alt.X(f"{feat_x}:O", title=feat_x),
+                y=alt.Y(f"{feat_y}:O", title=feat_y, sort="descending"),
+                color=alt.Color("prob:Q", title="연체확률",
+                                scale=alt.Scale(scheme="redyellowgreen", reverse=True, domain=[0, 1])),
+                tooltip=[feat_x, feat_y, alt.Tooltip("prob:Q", format=".3f"), "level"],
+            )
+            st.altair_chart(heat, use_container_width=True)
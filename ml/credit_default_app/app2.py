@@ -0,0 +1,112 @@
+"""
+app2.py — 포트폴리오 위험 대시보드 (전체 고객 파일 업로드 → 일괄 예측)
+실행 : conda activate ml_edu  →  streamlit run app2.py
+
+한 번 예측한 고객은 피처 해시로 결과를 저장해 두고,
+다시 업로드하면 피처가 바뀐 고객만 재평가합니다.
+"""
+
+import streamlit as st
+import pandas as pd
+from predict import FEATURE_COLS, RISK_LEVELS
+from portfolio import ScoreStore, score_portfolio, tier_summary
+
+# ── 페이지 설정 ───────────────────────────────────────────────────
+st.set_page_config(
+    page_title="포트폴리오 위험 대시보드",
+    page_icon="📊",
+    layout="wide",
+)
+
+# ── 점수 저장소 (프로세스당 1개, 세션 간 공유) ────────────────────
+@st.cache_resource
+def get_store():
+    return ScoreStore()
+
+store = get_store()
+
+RISK_ICON = {level: icon for _, level, icon, *_ in RISK_LEVELS}
+
+# ═══════════════════════════════════════════════════════════════
+# SIDEBAR ── 파일 업로드
+# ═══════════════════════════════════════════════════════════════
+with st.sidebar:
+    st.markdown("## 📊 포트폴리오 평가")
+    st.caption("FEATURE_COLS 23개 컬럼을 포함한 CSV / Parquet 파일을 올려주세요.")
+    uploaded = st.file_uploader("고객 파일", type=["csv", "parquet"])
+    st.divider()
+    st.caption(f"저장된 예측 결과 : {len(store):,}건")
+    if st.button("🗑️ 저장된 결과 초기화", use_container_width=True):
+        store.clear()
+        st.rerun()
+
+st.title("📊 포트폴리오 위험 대시보드")
+st.caption("업로드한 전체 고객을 예측하고 위험등급별 분포와 한도 노출액을 보여줍니다.  |  모델: RFC + SMOTE + PCA(15)")
+st.divider()
+
+if uploaded is None:
+    st.info("왼쪽 사이드바에서 고객 파일을 업로드하세요.")
+    st.stop()
+
+# ── 파일 읽기 + 컬럼 검사 ─────────────────────────────────────────
+try:
+    if uploaded.name.lower().endswith(".parquet"):
+        df = pd.read_parquet(uploaded)
+    else:
+        df = pd.read_csv(uploaded)
+except Exception as e:
+    st.error(f"❌ 파일을 읽을 수 없습니다: {e}")
+    st.stop()
+
+missing = [c for c in FEATURE_COLS if c not in df.columns]
+if missing:
+    st.error(f"❌ 필수 컬럼이 없습니다: {', '.join(missing)}")
+    st.stop()
+
+# ── 예측 (변경된 고객만) ──────────────────────────────────────────
+try:
+    with st.spinner("포트폴리오 예측 중..."):
+        scored, stats = score_portfolio(df, store)
+except Exception as e:
+    st.error(f"❌ 예측 중 오류가 발생했습니다: {e}")
+    st.stop()
+
+m1, m2, m3, m4 = st.columns(4)
+m1.metric("전체 고객", f"{stats['rows']:,}")
+m2.metric("신규·변경 (재평가)", f"{stats['scored']:,}")
+m3.metric("기존 결과 재사용", f"{stats['reused']:,}")
+m4.metric("소요 시간", f"{stats['seconds']:.2f} 초")
+
+# ── 위험등급별 분포 / 노출액 ──────────────────────────────────────
+summary = tier_summary(scored)
+st.subheader("위험등급별 분포")
+
+view = pd.DataFrame({
+    "위험등급"  : [f"{RISK_ICON[lv]} {lv}" for lv in summary.index],
+    "고객 수"   : summary["customers"].map("{:,}".format),
+    "비중"      : (summary["share"] * 100).map("{:.1f} %".format),
+    "한도 노출액 (NTD)": summary["exposure"].map("{:,.0f}".format),
+    "노출 비중" : (summary["exposure_share"] * 100).map("{:.1f} %".format),
+    "평균 연체확률": (summary["mean_prob"].fillna(0) * 100).map("{:.1f} %".format),
+})
+st.dataframe(view, use_container_width=True, hide_index=True)
+
+c1, c2 = st.columns(2)
+chart = summary.reset_index().rename(columns={"level": "위험등급"})
+with c1:
+    st.markdown("**고객 수**")
+    st.bar_chart(chart, x="위험등급", y="customers", color="#2d5a8e")
+with c2:
+    st.markdown("**한도 노출액 (LIMIT_BAL 합)**")
+    st.bar_chart(chart, x="위험등급", y="exposure", color="#d62728")
+
+# ── 고위험 고객 / 다운로드 ────────────────────────────────────────
+with st.expander("🔴 연체확률 상위 고객 100명", expanded=False):
+    st.dataframe(scored.nlargest(100, "prob"), use_container_width=True)
+
+st.download_button(
+    "💾 예측 결과 다운로드 (CSV)",
+    scored.to_csv(index=False).encode("utf-8-sig"),
+    file_name="portfolio_scored.csv",
+    mime="text/csv",
+)
@@ -0,0 +1,266 @@
+"""
+bench.py — 채무불이행 추론 경로 벤치마크
+
+측정 항목
+  · cold import      : 새 프로세스에서 import predict → 첫 예측까지 걸린 시간
+  · load_pipeline    : 모델 로드 시간 (최초 / 캐시)
+  · 단건 지연        : predict() / get_risk() 지연 p50 · p90 · p99
+  · 배치 처리량      : predict_batch() 배치 크기별 행/초
+  · 최대 메모리      : 새 프로세스에서 배치 1회 — tracemalloc 최대 할당량 + 최대 RSS / 배치가 늘린 RSS
+
+실행 :
+  python bench.py                                   # bench_results/<커밋>.json 저장
+  python bench.py --quick                           # 반복 횟수를 줄인 빠른 측정
+  python bench.py --compare bench_results/abc123.json   # 이전 결과와 비교
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR    = Path(__file__).parent
+RESULTS_DIR = BASE_DIR / "bench_results"
+BATCH_SIZES = [1, 10, 100, 1_000, 10_000, 100_000]
+
+
+# ── 합성 데이터 생성 (app1.py 입력 범위와 동일) ───────────────────
+def make_customers(n: int, seed: int = 0) -> pd.DataFrame:
+    """app1.py 에서 허용하는 FEATURE_COLS 범위 안의 무작위 고객 n명"""
+    from predict import FEATURE_COLS
+
+    rng = np.random.default_rng(seed)
+    data = {
+        "LIMIT_BAL": rng.integers(1, 101, n) * 10_000,     # 10,000 ~ 1,000,000 (10,000 단위)
+        "SEX"      : rng.integers(1, 3, n),
+        "EDUCATION": rng.integers(1, 5, n),
+        "MARRIAGE" : rng.integers(1, 4, n),
+        "AGE"      : rng.integers(18, 101, n),
+    }
+    for col in ["PAY_0", "PAY_2", "PAY_3", "PAY_4", "PAY_5", "PAY_6"]:
+        data[col] = rng.integers(-2, 9, n)
+    for i in range(1, 7):
+        # 금액은 0 ~ 10,000,000 범위, 실제 분포처럼 작은 값에 몰리도록 로그 균등
+        data[f"BILL_AMT{i}"] = np.minimum(np.round(np.expm1(rng.uniform(0, np.log1p(10_000_000), n))), 10_000_000)
+        data[f"PAY_AMT{i}"]  = np.minimum(np.round(np.expm1(rng.uniform(0, np.log1p(10_000_000), n))), 10_000_000)
+    return pd.DataFrame(data)[FEATURE_COLS]
+
+
+# ── 측정 도우미 ───────────────────────────────────────────────────
+def _percentiles(samples_s: list) -> dict:
+    us = np.asarray(samples_s) * 1e6
+    return {
+        "n"      : len(us),
+        "mean_us": round(float(us.mean()), 2),
+        "p50_us" : round(float(np.percentile(us, 50)), 2),
+        "p90_us" : round(float(np.percentile(us, 90)), 2),
+        "p99_us" : round(float(np.percentile(us, 99)), 2),
+    }
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def bench_cold_import(repeat: int) -> dict:
+    """새 파이썬 프로세스에서 import → 첫 예측까지 (모델 로드 포함)"""
+    code = (
+        "import time; t0 = time.perf_counter()\n"
+        "import predict\n"
+        "t1 = time.perf_counter()\n"
+        "predict.predict({c: 0 for c in predict.FEATURE_COLS})\n"
+        "t2 = time.perf_counter()\n"
+        "print(t1 - t0, t2 - t0)\n"
+    )
+    imports, firsts = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR,
+                             capture_output=True, text=True, check=True)
+        t_import, t_first = map(float, out.stdout.split())
+        imports.append(t_import)
+        firsts.append(t_first)
+    return {
+        "import_ms"          : round(float(np.median(imports)) * 1000, 2),
+        "first_prediction_ms": round(float(np.median(firsts)) * 1000, 2),
+        "repeat"             : repeat,
+    }
+
+
+def bench_load_pipeline() -> dict:
+    import predict
+
+    predict.reload_models()
+    start = time.perf_counter()
+    predict.load_pipeline()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predict.load_pipeline()
+    warm = time.perf_counter() - start
+    return {"cold_ms": round(cold * 1000, 2), "cached_us": round(warm * 1e6, 2)}
+
+
+def bench_single(rows: list, repeat: int) -> dict:
+    from predict import predict, get_risk
+
+    predict(rows[0])                                    # 워밍업 (모델 로드)
+    lat = []
+    for i in range(repeat):
+        row   = rows[i % len(rows)]
+        start = time.perf_counter()
+        predict(row)
+        lat.append(time.perf_counter() - start)
+
+    probs = np.random.default_rng(0).random(repeat)
+    risk  = []
+    for p in probs:
+        start = time.perf_counter()
+        get_risk(p)
+        risk.append(time.perf_counter() - start)
+    return {"predict": _percentiles(lat), "get_risk": _percentiles(risk)}
+
+
+def bench_batch(df: pd.DataFrame, sizes: list, min_time: float) -> list:
+    """배치 크기별 처리량 — 크기마다 최소 min_time 초 이상 반복 측정"""
+    from predict import predict_batch
+
+    results = []
+    for size in sizes:
+        chunk = df.iloc[:size]
+        predict_batch(chunk)                            # 워밍업
+        n_calls, elapsed = 0, 0.0
+        while elapsed < min_time:
+            start = time.perf_counter()
+            predict_batch(chunk)
+            elapsed += time.perf_counter() - start
+            n_calls += 1
+        results.append({
+            "batch_size"  : size,
+            "calls"       : n_calls,
+            "ms_per_batch": round(elapsed / n_calls * 1000, 3),
+            "rows_per_sec": round(size * n_calls / elapsed, 1),
+        })
+    return results
+
+
+def bench_memory(n_rows: int) -> dict:
+    """
+    새 프로세스에서 predict_batch(n_rows) 1회의 메모리 — 다른 벤치마크가 남긴 최대 RSS 와 섞이지 않도록
+
+    모델 로드 + 데이터 생성까지 마친 시점의 최대 RSS 를 기준으로, 배치 예측이 늘린 양(batch_rss_delta_mb)을 함께 기록
+    """
+    code = (
+        "import sys, json, resource, tracemalloc\n"
+        "from bench import make_customers\n"
+        "from predict import predict_batch\n"
+        "scale = 1 if sys.platform == 'darwin' else 1024\n"        # ru_maxrss : Linux 는 KB, macOS 는 byte
+        "maxrss = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale\n"
+        f"df = make_customers({n_rows}, seed=0)\n"
+        "predict_batch(df.iloc[:1])\n"                               # 모델 로드는 기준선에 포함
+        "before = maxrss()\n"
+        "tracemalloc.start()\n"
+        "predict_batch(df)\n"
+        "_, peak = tracemalloc.get_traced_memory()\n"
+        "tracemalloc.stop()\n"
+        "print(json.dumps([peak, before, maxrss()]))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR,
+                         capture_output=True, text=True, check=True)
+    peak, before, after = json.loads(out.stdout.strip().splitlines()[-1])
+    return {
+        "batch_rows"         : n_rows,
+        "tracemalloc_peak_mb": round(peak / 2**20, 2),
+        "baseline_rss_mb"    : round(before / 2**20, 2),
+        "max_rss_mb"         : round(after / 2**20, 2),
+        "batch_rss_delta_mb" : round((after - before) / 2**20, 2),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    import sklearn
+    import predict
+
+    sizes = BATCH_SIZES[:-1] if quick else BATCH_SIZES
+    df    = make_customers(max(sizes), seed=0)
+    rows  = df.iloc[:1000].to_dict("records")
+
+    return {
+        "commit"   : _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "env": {
+            "python"  : platform.python_version(),
+            "numpy"   : np.__version__,
+            "pandas"  : pd.__version__,
+            "sklearn" : sklearn.__version__,
+            "platform": platform.platform(),
+            "engine"  : predict.load_engine() is not None,
+        },
+        "cold_import"  : bench_cold_import(repeat=2 if quick else 5),
+        "load_pipeline": bench_load_pipeline(),
+        "single"       : bench_single(rows, repeat=300 if quick else 3000),
+        "batch"        : bench_batch(df, sizes, min_time=0.2 if quick else 1.0),
+        "memory"       : bench_memory(len(df)),
+    }
+
+
+# ── 결과 비교 ─────────────────────────────────────────────────────
+def compare(old: dict, new: dict):
+    """주요 지표를 이전 결과와 나란히 출력 (비율 > 1 이면 느려짐)"""
+    def row(name, a, b):
+        ratio = b / a if a else float("nan")
+        flag  = "  ⚠️" if ratio > 1.1 else ""
+        print(f"  {name:<28} {a:>12,.2f} → {b:>12,.2f}   x{ratio:5.2f}{flag}")
+
+    print(f"비교 : {old['commit']} → {new['commit']}")
+    row("cold import (ms)", old["cold_import"]["first_prediction_ms"], new["cold_import"]["first_prediction_ms"])
+    row("predict p50 (µs)", old["single"]["predict"]["p50_us"], new["single"]["predict"]["p50_us"])
+    row("predict p99 (µs)", old["single"]["predict"]["p99_us"], new["single"]["predict"]["p99_us"])
+    old_batch = {b["batch_size"]: b for b in old["batch"]}
+    for b in new["batch"]:
+        if b["batch_size"] in old_batch:
+            # 처리량은 역수로 비교해 '비율 > 1 = 느려짐' 규칙을 유지
+            row(f"batch {b['batch_size']:>7,} (ms/batch)",
+                old_batch[b["batch_size"]]["ms_per_batch"], b["ms_per_batch"])
+    row("max RSS (MB)", old["memory"]["max_rss_mb"], new["memory"]["max_rss_mb"])
+    if "batch_rss_delta_mb" in old["memory"]:
+        row("batch RSS delta (MB)", old["memory"]["batch_rss_delta_mb"], new["memory"]["batch_rss_delta_mb"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채무불이행 추론 벤치마크")
+    parser.add_argument("--quick",   action="store_true", help="반복 횟수를 줄여 빠르게 측정")
+    parser.add_argument("--output",  default=None, help="결과 JSON 경로 (기본: bench_results/<커밋>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    result = run(quick=args.quick)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{result['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+
+    single = result["single"]["predict"]
+    print(f"cold import : {result['cold_import']['first_prediction_ms']:.1f} ms (첫 예측까지)")
+    print(f"predict()   : p50 {single['p50_us']:.1f} µs / p99 {single['p99_us']:.1f} µs")
+    for b in result["batch"]:
+        print(f"batch {b['batch_size']:>7,} : {b['rows_per_sec']:>12,.0f} 행/초")
+    print(f"memory      : peak {result['memory']['tracemalloc_peak_mb']} MB (tracemalloc), "
+          f"max RSS {result['memory']['max_rss_mb']} MB (배치 +{result['memory']['batch_rss_delta_mb']} MB)")
+    print(f"저장 완료   : {output}")
+
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+fast_model.py — RFC 파이프라인 고속 추론 엔진 (순수 NumPy)
+
+pipeline.pkl (StandardScaler → PCA(15) → SMOTE → RFC) 을 아래 형태로 변환합니다.
+  · StandardScaler + PCA  →  아핀 변환 1개   z = x @ W + b
+  · SMOTE                 →  제거 (추론 시에는 아무 동작도 하지 않음)
+  · RandomForest          →  모든 트리 노드를 이어 붙인 연속 NumPy 배열
+
+배열은 .npy 파일 하나씩 저장하고 mmap 으로 읽으므로,
+여러 워커 프로세스가 같은 파일을 열면 OS 페이지 캐시의 물리 메모리 1벌을 함께 사용합니다.
+
+실행 :
+  python fast_model.py export      # models/pipeline_fast/ 생성 + 원본 파이프라인과 일치 검사
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+
+BASE_DIR        = Path(__file__).parent
+FAST_MODEL_PATH = BASE_DIR / "models" / "pipeline_fast"
+META_FILE       = "meta.json"
+
+
+# ── 파이프라인 분해 ───────────────────────────────────────────────
+
+def _split_pipeline(pipeline):
+    """파이프라인 → (전처리 단계 목록, 최종 분류기). 샘플러(SMOTE 등)는 제외"""
+    steps = [est for _, est in pipeline.steps if est not in (None, "passthrough")]
+    *transforms, forest = steps
+    transforms = [est for est in transforms if not hasattr(est, "fit_resample")]
+    return transforms, forest
+
+
+def _fold_affine(transforms, n_features: int):
+    """StandardScaler / PCA 를 하나의 아핀 변환 (W, b) 으로 합칩니다."""
+    W = np.eye(n_features)
+    b = np.zeros(n_features)
+    for est in transforms:
+        name = type(est).__name__
+        if name == "StandardScaler":
+            mean  = est.mean_  if est.with_mean else 0.0
+            scale = est.scale_ if est.with_std  else 1.0
+            W, b  = W / scale, (b - mean) / scale
+        elif name == "PCA":
+            C = est.components_.T
+            if est.whiten:
+                C = C / np.sqrt(est.explained_variance_)
+            W, b = W @ C, (b - est.mean_) @ C
+        else:
+            raise TypeError(f"지원하지 않는 전처리 단계입니다: {name}")
+    return W, b
+
+
+def _flatten_forest(forest):
+    """
+    트리들을 하나의 노드 배열로 이어 붙입니다.
+
+    리프 노드는 자기 자신을 자식으로 가리키도록 만들어
+    (threshold=+inf → 항상 왼쪽 = 자기 자신) 고정 횟수 반복만으로 탐색이 끝나게 합니다.
+    반환값 : (노드 배열 dict, 전체 트리 최대 깊이)
+    """
+    children, feature, threshold, value, roots = [], [], [], [], []
+    offset, depth = 0, 0
+    for est in forest.estimators_:
+        t     = est.tree_
+        idx   = np.arange(t.node_count)
+        leaf  = t.children_left == -1
+        left  = np.where(leaf, idx, t.children_left)  + offset
+        right = np.where(leaf, idx, t.children_right) + offset
+
+        children.append(np.stack([left, right], axis=1))
+        feature.append(np.where(leaf, 0, t.feature))
+        threshold.append(np.where(leaf, np.inf, t.threshold))
+        value.append(t.value[:, 0, :])
+        roots.append(offset)
+        offset += t.node_count
+        depth   = max(depth, t.max_depth)
+
+    value = np.concatenate(value).astype(np.float64)
+    sums  = value.sum(axis=1, keepdims=True)
+    if not np.allclose(sums, 1.0):
+        # 구버전 sklearn 은 리프에 클래스별 개수를 저장 → predict_proba 와 동일하게 정규화
+        sums[sums == 0.0] = 1.0
+        value = value / sums
+
+    return {
+        "children" : np.concatenate(children).astype(np.int64).ravel(),   # [left0, right0, left1, ...]
+        "feature"  : np.concatenate(feature).astype(np.int64),
+        "threshold": np.concatenate(threshold).astype(np.float64),
+        "value"    : value,
+        "roots"    : np.asarray(roots, dtype=np.int64),
+    }, depth
+
+
+def _source_stamp(source) -> dict:
+    """원본 pipeline.pkl 식별 정보 (export 이후 모델이 바뀌었는지 판단용)"""
+    stat = Path(source).stat()
+    return {"source_mtime_ns": stat.st_mtime_ns, "source_size": stat.st_size}
+
+
+def export(pipeline, path=FAST_MODEL_PATH, source=None) -> Path:
+    """
+    파이프라인을 고속 엔진용 배열 디렉터리로 저장합니다.
+
+    배열마다 <이름>.npy 1개, 마지막에 meta.json 을 기록합니다.
+    source 에 pipeline.pkl 경로를 주면 meta.json 에 mtime·크기를 남겨 is_current() 로 검사합니다.
+    """
+    transforms, forest = _split_pipeline(pipeline)
+    n_features = transforms[0].n_features_in_ if transforms else forest.n_features_in_
+    W, b = _fold_affine(transforms, n_features)
+    nodes, max_depth = _flatten_forest(forest)
+    arrays = {"W": W, "b": b, "classes": np.asarray(forest.classes_), **nodes}
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    for name, arr in arrays.items():
+        np.save(path / f"{name}.npy", np.ascontiguousarray(arr))
+
+    meta = {"arrays": sorted(arrays), "max_depth": int(max_depth),
+            **(_source_stamp(source) if source else {})}
+    (path / META_FILE).write_text(json.dumps(meta, indent=2))
+    return path
+
+
+def is_current(path=FAST_MODEL_PATH, source=None) -> bool:
+    """export 결과가 존재하고, source(pipeline.pkl) 가 그 이후 바뀌지 않았으면 True"""
+    meta_path = Path(path) / META_FILE
+    if not meta_path.exists():
+        return False
+    if source is None or not Path(source).exists():
+        return True
+    meta  = json.loads(meta_path.read_text())
+    stamp = _source_stamp(source)
+    return all(meta.get(k) == v for k, v in stamp.items())
+
+
+# ── 추론 엔진 ─────────────────────────────────────────────────────
+
+class FastForest:
+    """export() 로 저장한 배열만으로 predict_proba 를 계산하는 평가기"""
+
+    def __init__(self, arrays, max_depth: int):
+        self.W         = arrays["W"]
+        self.b         = arrays["b"]
+        self.classes_  = arrays["classes"]
+        self.children  = arrays["children"]
+        self.feature   = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.value     = arrays["value"]
+        self.roots     = arrays["roots"]
+        self.max_depth = int(max_depth)
+        self.n_trees   = len(self.roots)
+        self.is_leaf   = np.isinf(self.threshold)
+
+    @classmethod
+    def load(cls, path=FAST_MODEL_PATH, mmap: bool = True):
+        """
+        export() 디렉터리에서 배열을 읽습니다.
+
+        mmap=True 이면 파일을 복사하지 않고 메모리 매핑만 하므로
+        로드가 즉시 끝나고, 같은 파일을 연 프로세스끼리 물리 메모리를 공유합니다.
+        """
+        path = Path(path)
+        meta = json.loads((path / META_FILE).read_text())
+        mode = "r" if mmap else None
+        # np.memmap 서브클래스는 연산마다 부가 비용이 있어 일반 ndarray 뷰로 변환 (복사 없음)
+        arrays = {name: np.asarray(np.load(path / f"{name}.npy", mmap_mode=mode))
+                  for name in meta["arrays"]}
+        return cls(arrays, meta["max_depth"])
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """원본 피처 → PCA 공간 (RFC 와 동일하게 float32 로 비교)"""
+        return (X @ self.W + self.b).astype(np.float32)
+
+    def apply(self, Z: np.ndarray) -> np.ndarray:
+        """각 행·트리가 도달한 리프 노드 번호 (n, n_trees)"""
+        n, d = Z.shape
+        flatZ = Z.ravel()
+        if n == 1:                                      # 단건: 브로드캐스트 없이 1차원으로 탐색
+            node, rows = self.roots, 0
+        else:
+            node = np.broadcast_to(self.roots, (n, self.n_trees)).copy()
+            rows = np.arange(n)[:, None] * d
+        for depth in range(self.max_depth):
+            go_right = flatZ.take(rows + self.feature.take(node)) > self.threshold.take(node)
+            node     = self.children.take(node * 2 + go_right)
+            # 모든 트리가 리프에 도달하면 조기 종료 (4단계마다 확인)
+            if depth % 4 == 3 and self.is_leaf.take(node).all():
+                break
+        return node.reshape(n, self.n_trees)
+
+    def predict_proba(self, X, block_size: int = 4096) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if len(X) > block_size:                         # 대량 입력은 블록 단위로 나눠 메모리 제한
+            return np.concatenate([self.predict_proba(X[i:i + block_size], block_size)
+                                   for i in range(0, len(X), block_size)])
+        leaves = self.apply(self.transform(X))
+        # (n, n_trees, n_classes) → 트리 순서대로 누적합 (sklearn 의 += 누적과 같은 순서)
+        proba = np.cumsum(self.value[leaves], axis=1)[:, -1, :]
+        return proba / self.n_trees
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_.take(self.predict_proba(X).argmax(axis=1))
+
+
+# ── 원본 파이프라인과 일치 검사 ───────────────────────────────────
+
+def check_parity(pipeline, engine: FastForest, X) -> dict:
+    """
+    동일 입력에 대해 원본 파이프라인과 고속 엔진 결과를 비교합니다.
+
+    Returns
+    -------
+    dict
+        n_rows / identical_rows (확률이 비트 단위로 동일한 행 수)
+        max_abs_diff / label_mismatch
+    """
+    import pandas as pd
+    from predict import FEATURE_COLS
+
+    df       = pd.DataFrame(np.asarray(X, dtype=np.float64), columns=FEATURE_COLS)
+    expected = pipeline.predict_proba(df)
+    actual   = engine.predict_proba(df.to_numpy())
+    return {
+        "n_rows"        : len(df),
+        "identical_rows": int((expected == actual).all(axis=1).sum()),
+        "max_abs_diff"  : float(np.abs(expected - actual).max()),
+        "label_mismatch": int((pipeline.predict(df) != engine.predict(df.to_numpy())).sum()),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import joblib
+    from predict import MODEL_PATH
+
+    if sys.argv[1:2] != ["export"]:
+        print(__doc__)
+        sys.exit(0)
+
+    pipeline = joblib.load(MODEL_PATH)
+    path     = export(pipeline, source=MODEL_PATH)
+    engine   = FastForest.load(path)
+    print(f"저장 완료 : {path}  (트리 {engine.n_trees}개, 노드 {len(engine.feature):,}개, 최대 깊이 {engine.max_depth})")
+
+    # 학습 분포를 모르므로 스케일러 평균·표준편차 기준으로 검사용 입력 생성
+    transforms, _ = _split_pipeline(pipeline)
+    scaler = transforms[0]
+    rng    = np.random.default_rng(0)
+    X      = np.round(rng.normal(scaler.mean_, scaler.scale_, size=(20_000, len(scaler.mean_))))
+
+    parity = check_parity(pipeline, engine, X)
+    print(f"일치 검사 : {parity}")
+
+    row = X[:1]
+    engine.predict_proba(row)
+    start = time.perf_counter()
+    for _ in range(1_000):
+        engine.predict_proba(row)
+    print(f"단건 지연 : {(time.perf_counter() - start) * 1e3:.1f} µs")
+
+    if parity["identical_rows"] != parity["n_rows"]:
+        sys.exit("❌ 원본 파이프라인과 결과가 다릅니다")
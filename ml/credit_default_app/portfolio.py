@@ -0,0 +1,186 @@
+"""
+portfolio.py — 포트폴리오(전체 고객) 일괄 예측 + 증분 재평가
+
+고객 행마다 FEATURE_COLS 값으로 해시를 만들고, 이전에 예측한 해시의 결과는 재사용합니다.
+→ 매일 다시 올리는 파일에서 피처가 바뀐 고객만 모델에 넣습니다.
+"""
+
+import os
+import time
+import threading
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from predict import FEATURE_COLS, MODEL_PATH, RISK_LEVELS, predict_batch, risk_levels
+
+STORE_PATH    = Path(__file__).parent / "models" / "portfolio_scores.npz"
+STORE_TTL     = float(os.getenv("CREDIT_STORE_TTL_DAYS", "90")) * 86400   # 이 기간 동안 어느 업로드에도 없던 해시는 삭제
+STORE_MAX     = int(os.getenv("CREDIT_STORE_MAX", "5000000"))            # 보관하는 해시 최대 수 (넘으면 오래된 것부터)
+
+
+def _model_stamp() -> np.ndarray:
+    """pipeline.pkl 식별값 (mtime, 크기) — 모델이 바뀌면 저장된 점수는 모두 폐기"""
+    if not MODEL_PATH.exists():
+        return np.zeros(2, dtype=np.int64)
+    stat = MODEL_PATH.stat()
+    return np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+
+def feature_hash(df: pd.DataFrame) -> np.ndarray:
+    """FEATURE_COLS 값 기준 행 해시 (uint64). 정수/실수 표기 차이는 같은 값으로 취급"""
+    return pd.util.hash_pandas_object(df[FEATURE_COLS].astype(np.float64), index=False).to_numpy()
+
+
+class ScoreStore:
+    """
+    피처 해시 → (확률, 클래스) 저장소. npz 파일로 저장해 재시작 후에도 유지
+
+    저장 시점의 pipeline.pkl 과 현재 모델이 다르면 불러오지 않습니다. (전체 재평가)
+    업로드마다 해시를 추가하고 마지막으로 본 시각만 갱신합니다 — 다른 파일(부분 / 델타 업로드)의 점수는 지우지 않음.
+    ttl 동안 어느 업로드에도 없던 해시, max_size 를 넘는 오래된 해시만 삭제해 저장소 크기를 제한합니다.
+    """
+
+    def __init__(self, path=STORE_PATH, ttl: float = STORE_TTL, max_size: int = STORE_MAX):
+        self.path     = Path(path)
+        self.ttl      = ttl
+        self.max_size = max_size
+        self._lock    = threading.Lock()
+        self.hashes   = np.empty(0, dtype=np.uint64)
+        self.prob     = np.empty(0, dtype=np.float64)
+        self.label    = np.empty(0, dtype=np.int64)
+        self.seen     = np.empty(0, dtype=np.float64)     # 마지막으로 업로드에 나온 시각 (epoch 초)
+        self.model    = _model_stamp()
+        if self.path.exists():
+            with np.load(self.path) as data:
+                if np.array_equal(data["model"], self.model):
+                    self.hashes, self.prob, self.label = data["hashes"], data["prob"], data["label"]
+                    self.seen = data["seen"] if "seen" in data else np.full(len(self.hashes), time.time())
+        self._index = pd.Index(self.hashes)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def lookup(self, hashes: np.ndarray):
+        """(확률, 클래스, 저장 여부) — 저장소에 없는 행은 nan / -1 / False"""
+        prob  = np.full(len(hashes), np.nan)
+        label = np.full(len(hashes), -1, dtype=np.int64)
+        with self._lock:                                 # 위치 계산과 값 읽기를 같은 배열에서
+            pos = self._index.get_indexer(hashes)
+            hit = pos >= 0
+            prob[hit]  = self.prob[pos[hit]]
+            label[hit] = self.label[pos[hit]]
+        return prob, label, hit
+
+    def add(self, hashes: np.ndarray, prob: np.ndarray, label: np.ndarray, now: float = None) -> int:
+        """
+        (중복 없는) 해시의 점수를 추가하고 마지막으로 본 시각을 now 로 갱신 — 이미 있는 해시는 시각만 갱신
+        이후 ttl 이 지났거나 max_size 를 넘는 오래된 해시를 삭제하고, 삭제한 수를 반환합니다.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            pos  = self._index.get_indexer(hashes)
+            old  = pos >= 0
+            new  = ~old
+            seen = self.seen.copy()
+            seen[pos[old]] = now
+            hashes_ = np.concatenate([self.hashes, hashes[new]])
+            prob_   = np.concatenate([self.prob, prob[new]])
+            label_  = np.concatenate([self.label, label[new]])
+            seen    = np.concatenate([seen, np.full(int(new.sum()), now)])
+
+            keep = seen >= now - self.ttl
+            if keep.sum() > self.max_size:                # 최근에 본 순으로 max_size 개만
+                recent = np.argsort(-seen, kind="stable")[:self.max_size]
+                keep   = np.zeros(len(seen), dtype=bool)
+                keep[recent] = True
+            evicted = int((~keep).sum())
+            if evicted:
+                hashes_, prob_, label_, seen = hashes_[keep], prob_[keep], label_[keep], seen[keep]
+
+            self.hashes, self.prob, self.label, self.seen = hashes_, prob_, label_, seen
+            self._index = pd.Index(self.hashes)
+        return evicted
+
+    def check_model(self):
+        """실행 중 pipeline.pkl 이 교체됐으면 저장된 점수를 모두 폐기"""
+        stamp = _model_stamp()
+        if not np.array_equal(stamp, self.model):
+            self.clear()
+            self.model = stamp
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.stem + ".tmp.npz")
+        with self._lock:
+            hashes, prob, label, seen = self.hashes, self.prob, self.label, self.seen
+        np.savez(tmp, hashes=hashes, prob=prob, label=label, seen=seen, model=self.model)
+        tmp.replace(self.path)                           # 저장 중 중단돼도 기존 파일 보존
+
+    def clear(self):
+        with self._lock:
+            self.hashes = np.empty(0, dtype=np.uint64)
+            self.prob   = np.empty(0, dtype=np.float64)
+            self.label  = np.empty(0, dtype=np.int64)
+            self.seen   = np.empty(0, dtype=np.float64)
+            self._index = pd.Index(self.hashes)
+        self.path.unlink(missing_ok=True)
+
+
+def score_portfolio(df: pd.DataFrame, store: ScoreStore, save: bool = True):
+    """
+    포트폴리오 전체 예측 — 저장소에 없는 (피처가 바뀐/새) 고객만 모델로 예측합니다.
+
+    Returns
+    -------
+    (pd.DataFrame, dict)
+        입력 df + prob / label / level 컬럼,
+        통계 dict : rows / scored / reused / evicted / seconds
+    """
+    start  = time.perf_counter()
+    store.check_model()
+    hashes = feature_hash(df)
+    prob, label, hit = store.lookup(hashes)
+    miss   = ~hit
+
+    # 업로드 내 동일 고객은 1번만 예측
+    new_hashes, first = np.unique(hashes[miss], return_index=True)
+    if len(new_hashes):
+        rows   = df.loc[miss, FEATURE_COLS].iloc[first]
+        result = predict_batch(rows)
+        where  = np.searchsorted(new_hashes, hashes[miss])
+        prob[miss]  = result["prob"].to_numpy()[where]
+        label[miss] = result["label"].to_numpy()[where]
+
+    # 이번 업로드의 해시 추가 + 마지막으로 본 시각 갱신 (오래 안 나온 고객의 점수만 정리됨)
+    keep, idx = np.unique(hashes, return_index=True)
+    evicted   = store.add(keep, prob[idx], label[idx])
+    if save:
+        store.save()
+
+    out = df.copy()
+    out["prob"]  = prob
+    out["label"] = label
+    out["level"] = risk_levels(prob)
+
+    stats = {
+        "rows"   : len(df),
+        "scored" : int(len(new_hashes)),
+        "reused" : int(hit.sum()),
+        "evicted": evicted,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    return out, stats
+
+
+def tier_summary(scored: pd.DataFrame) -> pd.DataFrame:
+    """위험등급별 고객 수·비중·한도 노출액(LIMIT_BAL 합)·평균 확률 (위험 → 안전 순)"""
+    summary = scored.groupby("level", observed=False).agg(
+        customers=("prob", "size"),
+        exposure=("LIMIT_BAL", "sum"),
+        mean_prob=("prob", "mean"),
+    )
+    summary["share"]          = summary["customers"] / max(len(scored), 1)
+    summary["exposure_share"] = summary["exposure"] / max(summary["exposure"].sum(), 1)
+    order = [level for _, level, *_ in RISK_LEVELS]
+    return summary.reindex(order)
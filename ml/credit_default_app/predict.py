@@ -3,15 +3,78 @@ predict.py — 채무불이행 예측 추론 모듈
 
 pipeline.pkl 을 로드하고 입력값을 받아 예측 결과를 반환합니다.
 파이프라인 내부 순서: StandardScaler → PCA(15) → SMOTE → RFC
+
+실행 :
+  python predict.py                                  # 샘플 1건 예측
+  python predict.py score customers.csv -o out.csv   # 파일 대량 예측 (CSV / Parquet)
+  python predict.py score big.parquet -o out.parquet --chunksize 200000 --workers 8
 """
 
+import sys
+import time
+import argparse
+import threading
 import joblib
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import fast_model
+from fast_model import FAST_MODEL_PATH, FastForest
 
-# ── 모델 로드 (모듈 임포트 시 1회만 실행) ──────────────────────────
+# ── 모델 로드 (첫 사용 시 1회만, 프로세스당 1개 인스턴스 공유) ──────
 MODEL_PATH = Path(__file__).parent / "models" / "pipeline.pkl"
-pipeline   = joblib.load(MODEL_PATH)
+
+_lock     = threading.Lock()
+_pipeline = None
+_engine   = None
+_engine_checked = False
+
+
+def load_pipeline():
+    """EX-01 대응 — 파일 없으면 FileNotFoundError 발생 (최초 1회만 로드, 이후 같은 객체 반환)"""
+    global _pipeline
+    if _pipeline is None:
+        with _lock:
+            if _pipeline is None:
+                if not MODEL_PATH.exists():
+                    raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {MODEL_PATH}")
+                _pipeline = joblib.load(MODEL_PATH)
+    return _pipeline
+
+
+def load_engine():
+    """
+    고속 추론 엔진 (python fast_model.py export 결과가 있을 때만, 없으면 None)
+
+    배열을 mmap 으로 열기 때문에 워커 프로세스가 여럿이어도 물리 메모리는 1벌만 사용합니다.
+    pipeline.pkl 이 export 이후 바뀌었으면 무시 → 원본 파이프라인으로 추론
+    """
+    global _engine, _engine_checked
+    if not _engine_checked:
+        with _lock:
+            if not _engine_checked:
+                if fast_model.is_current(FAST_MODEL_PATH, MODEL_PATH):
+                    _engine = FastForest.load(FAST_MODEL_PATH)
+                _engine_checked = True
+    return _engine
+
+
+def reload_models():
+    """로드된 모델을 버리고 다음 사용 시 디스크에서 다시 로드하도록 초기화"""
+    global _pipeline, _engine, _engine_checked
+    with _lock:
+        _pipeline, _engine, _engine_checked = None, None, False
+
+
+def __getattr__(name):
+    """기존 코드 호환 — predict.pipeline / predict.engine 접근 시 지연 로드"""
+    if name == "pipeline":
+        return load_pipeline()
+    if name == "engine":
+        return load_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ── 피처 컬럼 순서 (학습 시와 동일하게 유지) ──────────────────────
 FEATURE_COLS = [
@@ -24,6 +87,23 @@ FEATURE_COLS = [
 ]
 
 
+def _predict_one(input_dict: dict) -> dict:
+    """predict() 와 같지만 확률을 반올림하지 않음 (등급 판정 / 캐시용)"""
+    engine = load_engine()
+    if engine is not None:
+        proba = engine.predict_proba([[input_dict[c] for c in FEATURE_COLS]])
+    else:
+        df    = pd.DataFrame([input_dict], columns=FEATURE_COLS)
+        proba = load_pipeline().predict_proba(df)      # 1회 추론으로 확률·클래스 모두 산출
+    label = int(_labels_from_proba(proba)[0])
+
+    return {
+        "prob"  : float(proba[0][1]),
+        "label" : label,
+        "result": "채무불이행 위험" if label == 1 else "정상",
+    }
+
+
 def predict(input_dict: dict) -> dict:
     """
     단일 고객 데이터로 채무불이행 확률과 예측 클래스를 반환합니다.
@@ -40,15 +120,9 @@ def predict(input_dict: dict) -> dict:
         label  (int)   : 예측 클래스  0=정상 / 1=채무불이행
         result (str)   : 한국어 결과 문자열
     """
-    df    = pd.DataFrame([input_dict], columns=FEATURE_COLS)
-    prob  = float(pipeline.predict_proba(df)[0][1])
-    label = int(pipeline.predict(df)[0])
-
-    return {
-        "prob"  : round(prob, 4),
-        "label" : label,
-        "result": "채무불이행 위험" if label == 1 else "정상",
-    }
+    result = _predict_one(input_dict)
+    result["prob"] = round(result["prob"], 4)
+    return result
 
 
 # ── app1.py 용 추가 함수 ─────────────────────────────────────────
@@ -61,11 +135,106 @@ RISK_LEVELS = [
     (0.0, "안전", "🟢", "한도 증액 가능",           "success"),
 ]
 
-def load_pipeline():
-    """EX-01 대응 — 파일 없으면 FileNotFoundError 발생"""
-    if not MODEL_PATH.exists():
-        raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {MODEL_PATH}")
-    return joblib.load(MODEL_PATH)
+# get_risk 벡터화용 구간표 (오름차순 경계 / 등급)
+_RISK_BINS   = np.array([t for t, *_ in RISK_LEVELS[::-1]][1:])      # [0.3, 0.5, 0.7]
+_RISK_LABELS = [level for _, level, *_ in RISK_LEVELS[::-1]]          # 안전 → 위험
+
+
+def _labels_from_proba(proba: np.ndarray) -> np.ndarray:
+    """predict_proba 결과 → 클래스 (pipeline.predict 와 동일하게 argmax 사용)"""
+    model = load_engine() or load_pipeline()
+    return np.asarray(model.classes_).take(proba.argmax(axis=1))
+
+
+# 고속 엔진은 단건·소량에서 유리, 대량은 sklearn 의 멀티스레드 트리 탐색이 더 빠름
+ENGINE_MAX_ROWS = 1024
+
+
+def _predict_proba(df: pd.DataFrame) -> np.ndarray:
+    """소량은 고속 엔진, 대량(또는 엔진 없음)은 원본 파이프라인으로 predict_proba (결과 동일)"""
+    engine = load_engine()
+    if engine is not None and len(df) <= ENGINE_MAX_ROWS:
+        return engine.predict_proba(df.to_numpy(dtype=np.float64))
+    return load_pipeline().predict_proba(df)
+
+
+def _to_frame(data) -> pd.DataFrame:
+    """DataFrame / ndarray / dict 이터러블 → FEATURE_COLS 순서의 DataFrame"""
+    if isinstance(data, pd.DataFrame):
+        return data[FEATURE_COLS]
+    if isinstance(data, np.ndarray):
+        if data.ndim != 2 or data.shape[1] != len(FEATURE_COLS):
+            raise ValueError(f"배열 shape 은 (n, {len(FEATURE_COLS)}) 이어야 합니다: {data.shape}")
+        return pd.DataFrame(data, columns=FEATURE_COLS)
+    return pd.DataFrame.from_records(list(data), columns=FEATURE_COLS)
+
+
+def risk_levels(prob) -> pd.Categorical:
+    """확률 배열 → 위험등급 배열 (get_risk 의 벡터화 버전)"""
+    idx = np.digitize(np.asarray(prob, dtype=float), _RISK_BINS)
+    return pd.Categorical.from_codes(idx, categories=_RISK_LABELS, ordered=True)
+
+
+def predict_batch(data) -> pd.DataFrame:
+    """
+    여러 고객을 한 번에 예측합니다. (야간 전체 재평가용)
+
+    Parameters
+    ----------
+    data : pd.DataFrame | np.ndarray | Iterable[dict]
+        DataFrame 은 FEATURE_COLS 컬럼을 포함해야 하며,
+        ndarray 는 (n, 23) shape 에 FEATURE_COLS 순서여야 합니다.
+
+    Returns
+    -------
+    pd.DataFrame
+        prob  (float)    : 채무불이행 확률
+        label (int)      : 예측 클래스  0=정상 / 1=채무불이행
+        level (category) : 위험등급 (RISK_LEVELS 기준)
+    """
+    df    = _to_frame(data)
+    proba = _predict_proba(df)                         # predict_proba 1회만 호출
+    prob  = proba[:, 1]
+
+    return pd.DataFrame(
+        {
+            "prob" : prob,
+            "label": _labels_from_proba(proba).astype(int),
+            "level": risk_levels(prob),
+        },
+        index=df.index,
+    )
+
+
+def sweep(base: dict, grid: dict) -> pd.DataFrame:
+    """
+    What-if 민감도 분석 — base 고객에서 1~2개 피처만 바꾼 격자 전체를 한 번에 예측합니다.
+
+    Parameters
+    ----------
+    base : dict
+        기준 고객 (FEATURE_COLS 전체)
+    grid : dict
+        {피처명: 값 목록} 1개 또는 2개. 2개면 모든 조합(카테시안 곱)을 평가
+
+    Returns
+    -------
+    pd.DataFrame
+        grid 피처 컬럼 + prob / label / level
+    """
+    names  = list(grid)
+    values = np.meshgrid(*[np.asarray(grid[n], dtype=np.float64) for n in names], indexing="ij")
+    values = [v.ravel() for v in values]
+
+    X = np.tile(np.array([base[c] for c in FEATURE_COLS], dtype=np.float64), (len(values[0]), 1))
+    for name, v in zip(names, values):
+        X[:, FEATURE_COLS.index(name)] = v
+
+    out = predict_batch(X)
+    for name, v in reversed(list(zip(names, values))):
+        out.insert(0, name, v)
+    return out
+
 
 def get_risk(prob: float) -> dict:
     """확률 → 위험등급·아이콘·권장조치 반환 (FR-05)"""
@@ -75,8 +244,223 @@ def get_risk(prob: float) -> dict:
                     "action": action, "msg_type": msg_type}
 
 
-# ── 단독 실행 시 동작 테스트 ─────────────────────────────────────
-if __name__ == "__main__":
+# ── 예측 결과 캐시 (Streamlit 재실행 시 같은 고객 재예측 방지) ─────
+
+class PredictionCache:
+    """
+    예측 결과 LRU + TTL 캐시 (확률은 반올림 전 값을 보관 — 화면에 보일 때만 반올림)
+
+    · 키   : FEATURE_COLS 순서의 float 튜플 (200000 / 200000.0 / np.int64 는 같은 키)
+    · 무효화 : pipeline.pkl 의 mtime·크기가 바뀌면 캐시를 비우고 모델을 다시 로드
+    · 통계 : stats() → hits / misses / size / hit_rate 등
+    """
+
+    def __init__(self, func, maxsize: int = 4096, ttl: float = 3600.0,
+                 check_interval: float = 1.0):
+        self.func           = func
+        self.maxsize        = maxsize
+        self.ttl            = ttl
+        self.check_interval = check_interval     # 모델 파일 변경 확인 주기 (초)
+        self._data          = OrderedDict()      # key → (저장 시각, 결과)
+        self._lock          = threading.Lock()
+        self._stamp         = self._model_stamp()
+        self._checked_at    = time.monotonic()
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    @staticmethod
+    def _model_stamp():
+        try:
+            stat = MODEL_PATH.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def make_key(input_dict: dict) -> tuple:
+        return tuple(float(input_dict[c]) for c in FEATURE_COLS)
+
+    def _check_model(self, now: float):
+        """check_interval 마다 pipeline.pkl 변경 여부 확인 → 바뀌었으면 전체 무효화"""
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        stamp = self._model_stamp()
+        if stamp != self._stamp:
+            self._stamp = stamp
+            self._data.clear()
+            self.invalidations += 1
+            reload_models()
+
+    def __call__(self, input_dict: dict) -> dict:
+        key = self.make_key(input_dict)
+        now = time.monotonic()
+        with self._lock:
+            self._check_model(now)
+            item = self._data.get(key)
+            if item is not None:
+                if now - item[0] <= self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return dict(item[1])
+                del self._data[key]
+                self.expirations += 1
+            self.misses += 1
+
+        result = self.func(input_dict)          # 추론은 락 밖에서 실행
+
+        with self._lock:
+            self._data[key] = (now, result)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return dict(result)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits"         : self.hits,
+            "misses"       : self.misses,
+            "hit_rate"     : round(self.hits / total, 4) if total else 0.0,
+            "size"         : len(self._data),
+            "maxsize"      : self.maxsize,
+            "evictions"    : self.evictions,
+            "expirations"  : self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# 앱에서 사용하는 캐시 적용 예측 함수 (모듈 단위 1개 → 세션·재실행 간 공유)
+# 반올림 전 확률을 돌려주므로 get_risk 등급 경계(0.7 등)가 predict_batch 와 같게 판정됨
+predict_cached = PredictionCache(_predict_one)
+
+
+# ── 파일 단위 대량 예측 (CLI score 모드) ──────────────────────────
+
+def _is_parquet(path: Path) -> bool:
+    return path.suffix.lower() in (".parquet", ".pq")
+
+
+def iter_chunks(path, chunksize: int = 100_000, id_col: str = None):
+    """CSV / Parquet 파일을 chunksize 행씩 읽어 DataFrame 으로 내보냅니다."""
+    path = Path(path)
+    cols = FEATURE_COLS + ([id_col] if id_col else [])
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=cols):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=cols, chunksize=chunksize)
+
+
+def _count_rows(path: Path):
+    """Parquet 은 메타데이터로 전체 행 수를 알 수 있음 (CSV 는 None)"""
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    return None
+
+
+def _score_chunk(chunk: pd.DataFrame, id_col: str = None) -> pd.DataFrame:
+    """청크 1개 예측 (프로세스 풀 워커에서도 호출되므로 모듈 최상위 함수)"""
+    out = predict_batch(chunk)
+    if id_col:
+        out.insert(0, id_col, chunk[id_col].to_numpy())
+    return out
+
+
+class _ResultWriter:
+    """예측 결과를 청크 단위로 이어 쓰기 (CSV append / ParquetWriter)"""
+
+    def __init__(self, path):
+        self.path   = Path(path)
+        self.writer = None
+        self.first  = True
+
+    def write(self, df: pd.DataFrame):
+        if _is_parquet(self.path):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.path, table.schema)
+            self.writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode="w" if self.first else "a",
+                      header=self.first, index=False)
+        self.first = False
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def score_file(input_path, output_path, chunksize: int = 100_000,
+               workers: int = 1, id_col: str = None, verbose: bool = True) -> dict:
+    """
+    대용량 고객 파일을 청크 단위로 예측해 결과 파일에 순서대로 기록합니다.
+
+    메모리에는 최대 (workers × 2) 개의 청크만 올라가므로
+    입력 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Returns
+    -------
+    dict
+        rows (int) / seconds (float) / rows_per_sec (float)
+    """
+    input_path = Path(input_path)
+    total      = _count_rows(input_path)
+    writer     = _ResultWriter(output_path)
+    chunks     = iter_chunks(input_path, chunksize, id_col)
+    done, start = 0, time.perf_counter()
+
+    def report(n_rows):
+        nonlocal done
+        done   += n_rows
+        elapsed = time.perf_counter() - start
+        pct     = f" ({done / total:6.1%})" if total else ""
+        if verbose:
+            print(f"\r  {done:>12,} 행{pct}  |  {done / elapsed:,.0f} 행/초",
+                  end="", file=sys.stderr, flush=True)
+
+    try:
+        if workers <= 1:
+            for chunk in chunks:
+                writer.write(_score_chunk(chunk, id_col))
+                report(len(chunk))
+        else:
+            # fork 전에 부모에서 로드 → 워커들이 모델 메모리를 copy-on-write 로 공유
+            load_engine()
+            load_pipeline()
+            # 진행 중인 청크 수를 제한해 메모리를 일정하게 유지 (출력 순서는 입력과 동일)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = []
+                for chunk in chunks:
+                    pending.append(pool.submit(_score_chunk, chunk, id_col))
+                    if len(pending) >= workers * 2:
+                        out = pending.pop(0).result()
+                        writer.write(out)
+                        report(len(out))
+                for fut in pending:
+                    out = fut.result()
+                    writer.write(out)
+                    report(len(out))
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    if verbose:
+        print(file=sys.stderr)
+    return {"rows": done, "seconds": round(elapsed, 3),
+            "rows_per_sec": round(done / elapsed, 1) if elapsed else 0.0}
+
+
+def _demo():
+    """샘플 1건 예측 (기존 단독 실행 동작)"""
     sample = {
         'LIMIT_BAL': 20000,  'SEX': 2, 'EDUCATION': 2, 'MARRIAGE': 1, 'AGE': 24,
         'PAY_0': 2,  'PAY_2': 2,  'PAY_3': -1, 'PAY_4': -1, 'PAY_5': -2, 'PAY_6': -2,
@@ -88,3 +472,29 @@ if __name__ == "__main__":
     result = predict(sample)
     print(f"채무불이행 확률 : {result['prob']:.4f}")
     print(f"예측 클래스     : {result['label']}  ({result['result']})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="신용카드 채무불이행 예측")
+    sub    = parser.add_subparsers(dest="command")
+
+    sc = sub.add_parser("score", help="CSV / Parquet 파일 대량 예측")
+    sc.add_argument("input",  help="입력 파일 (FEATURE_COLS 포함, .csv / .parquet)")
+    sc.add_argument("-o", "--output", required=True, help="결과 파일 (.csv / .parquet)")
+    sc.add_argument("--chunksize", type=int, default=100_000, help="청크당 행 수")
+    sc.add_argument("--workers",   type=int, default=1, help="프로세스 풀 크기 (1=단일 프로세스)")
+    sc.add_argument("--id-col",    default=None, help="결과에 함께 기록할 고객 ID 컬럼")
+
+    args = parser.parse_args(argv)
+    if args.command == "score":
+        stats = score_file(args.input, args.output, args.chunksize,
+                           args.workers, args.id_col)
+        print(f"완료 : {stats['rows']:,} 행  {stats['seconds']:.1f} 초  "
+              f"({stats['rows_per_sec']:,.0f} 행/초)  →  {args.output}")
+    else:
+        _demo()
+
+
+# ── 단독 실행 ─────────────────────────────────────────────────────
+if __name__ == "__main__":
+    main()
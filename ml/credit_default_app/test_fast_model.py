@@ -0,0 +1,74 @@
+"""
+test_fast_model.py — 고속 추론 엔진이 원본 파이프라인과 같은 확률을 내는지 검사
+
+실행 :
+  python -m pytest -q test_fast_model.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.decomposition import PCA
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from fast_model import FastForest, check_parity, export
+from predict import FEATURE_COLS
+
+
+def _customers(n: int, seed: int = 0) -> tuple:
+    rng = np.random.default_rng(seed)
+    X   = pd.DataFrame(np.round(rng.normal(size=(n, len(FEATURE_COLS))) * 1000), columns=FEATURE_COLS)
+    X["PAY_0"] = rng.integers(-2, 9, n)
+    y   = ((X["PAY_0"] > 1) | (rng.random(n) < 0.1)).astype(int)
+    return X, y
+
+
+def _fit(steps, n: int = 800) -> Pipeline:
+    X, y = _customers(n)
+    return Pipeline(steps).fit(X, y)
+
+
+def _forest():
+    return RandomForestClassifier(n_estimators=20, max_depth=12, random_state=0)
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    return _fit([("scaler", StandardScaler()), ("pca", PCA(15)), ("rfc", _forest())])
+
+
+def _assert_parity(pipeline, tmp_path, n: int = 2_000):
+    engine = FastForest.load(export(pipeline, tmp_path / "fast"))
+    X, _   = _customers(n, seed=1)
+    parity = check_parity(pipeline, engine, X.to_numpy())
+    assert parity["identical_rows"] == parity["n_rows"] == n
+    assert parity["max_abs_diff"] == 0.0
+    assert parity["label_mismatch"] == 0
+
+
+def test_parity_scaler_pca_forest(pipeline, tmp_path):
+    _assert_parity(pipeline, tmp_path)
+
+
+def test_parity_single_row_and_blocks(pipeline, tmp_path):
+    engine = FastForest.load(export(pipeline, tmp_path / "fast"))
+    X, _   = _customers(50, seed=2)
+    df     = pd.DataFrame(X.to_numpy(dtype=np.float64), columns=FEATURE_COLS)
+    single = np.vstack([engine.predict_proba(row[None, :]) for row in df.to_numpy()])
+    blocks = engine.predict_proba(df.to_numpy(), block_size=7)
+    assert np.array_equal(single, pipeline.predict_proba(df))
+    assert np.array_equal(blocks, pipeline.predict_proba(df))
+
+
+def test_parity_with_smote(tmp_path):
+    # 실제 pipeline.pkl 과 같은 구성 (SMOTE 는 추론 시 동작하지 않으므로 export 에서 제외)
+    pytest.importorskip("imblearn")
+    from imblearn.over_sampling import SMOTE
+    from imblearn.pipeline import Pipeline as ImbPipeline
+
+    X, y     = _customers(800)
+    pipeline = ImbPipeline([("scaler", StandardScaler()), ("pca", PCA(15)),
+                            ("smote", SMOTE(random_state=0)), ("rfc", _forest())]).fit(X, y)
+    _assert_parity(pipeline, tmp_path)